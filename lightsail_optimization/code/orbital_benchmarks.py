@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+WARPEED LIGHTSAIL - ORBITAL SIMULATOR BENCHMARKS
+Performance and accuracy measurements for orbital_mechanics_simulation.py
+
+BENCHMARKS:
+- Ephemeris cache: RHS evaluation speedup and interpolation error bound
+- Compiled RHS: equations_of_motion evaluations per second (NumPy vs Numba)
+- Integrators: accuracy vs cost of methods and tolerances for both phases,
+  written as a machine-readable report for regression checks
+
+Author: Warpeed Orbital Mechanics Team
+Date: October 17, 2026
+"""
+
+import numpy as np
+import json
+import os
+import platform
+import time
+from datetime import datetime
+from scipy.integrate import solve_ivp
+
+from orbital_mechanics_simulation import (
+    PlanetaryEphemeris, equations_of_motion, equations_of_motion_compiled,
+    equations_of_motion_batch, gravitational_acceleration, nominal_initial_state,
+    default_ephemeris, integrate_ensemble, propagate_coast_encke, _body_table,
+    acceleration_time, alpha_centauri_distance, T_earth, NUMBA_AVAILABLE
+)
+
+# Default integrator sweep: (method, rtol) per phase
+ACCELERATION_SWEEP = [(method, rtol) for method in ('DOP853', 'RK45', 'LSODA')
+                      for rtol in (1e-6, 1e-8, 1e-10, 1e-12)]
+COAST_SWEEP = [(method, rtol) for method in ('DOP853', 'RK45', 'LSODA')
+               for rtol in (1e-6, 1e-8, 1e-10)]
+
+def _time_calls(func, n_calls):
+    """Average wall time per call [s]"""
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        func()
+    return (time.perf_counter() - start) / n_calls
+
+def benchmark_ephemeris(n_calls=20000, ephemeris=None):
+    """
+    Compare RHS cost with analytic planet positions vs the ephemeris cache
+
+    Also reports the analytic Chebyshev error bound and the measured
+    worst-case interpolation error of the cache.
+    """
+    print("\n" + "="*80)
+    print("BENCHMARK: PLANETARY EPHEMERIS CACHE")
+    print("="*80)
+
+    if ephemeris is None:
+        ephemeris = PlanetaryEphemeris()
+
+    state = nominal_initial_state()
+    t_samples = np.random.default_rng(0).uniform(0.0, 8.0 * T_earth, n_calls)
+
+    # Warm up both paths (and the segment tables)
+    equations_of_motion(0.0, state)
+    equations_of_motion(0.0, state, ephemeris=ephemeris)
+
+    t_iter = iter(np.tile(t_samples, 2).tolist())
+    t_exact = _time_calls(lambda: equations_of_motion(next(t_iter), state, acceleration_phase=False), n_calls)
+    t_cached = _time_calls(lambda: equations_of_motion(next(t_iter), state, acceleration_phase=False,
+                                                       ephemeris=ephemeris), n_calls)
+
+    # Physics parity of the gravity term
+    deviation = max(
+        np.linalg.norm(gravitational_acceleration(state[0:3], t) - gravitational_acceleration(state[0:3], t, ephemeris))
+        for t in t_samples[:1000].tolist()
+    )
+
+    bounds = ephemeris.error_bound()
+    measured = ephemeris.max_interpolation_error()
+
+    print(f"\n  Ephemeris: {len(ephemeris.bodies)} bodies, {ephemeris.n_segments} segments "
+          f"of {ephemeris.segment_length/86400:.1f} days, degree {ephemeris.degree}")
+    print(f"\n  RHS evaluation (equations_of_motion):")
+    print(f"    Analytic positions: {t_exact*1e6:.2f} µs/call ({1.0/t_exact:,.0f} evals/s)")
+    print(f"    Ephemeris cache:    {t_cached*1e6:.2f} µs/call ({1.0/t_cached:,.0f} evals/s)")
+    print(f"    Speedup: {t_exact/t_cached:.2f}x")
+    print(f"\n  Interpolation error per body:")
+    for name in ephemeris.bodies:
+        print(f"    {name:8s} bound: {bounds[name]:.3e} m   measured: {measured[name]:.3e} m")
+    print(f"\n  Max gravity deviation: {deviation:.3e} m/s²")
+
+    return {
+        'rhs_time_exact_s': t_exact,
+        'rhs_time_ephemeris_s': t_cached,
+        'speedup': t_exact / t_cached,
+        'error_bound_m': {k: float(v) for k, v in bounds.items()},
+        'measured_error_m': {k: float(v) for k, v in measured.items()},
+        'max_gravity_deviation_m_s2': float(deviation),
+    }
+
+def benchmark_compiled_rhs(n_calls=20000):
+    """
+    Evaluations per second of the NumPy and Numba-compiled equations of motion
+
+    Evaluated at acceleration-phase states so the laser branch is included.
+    """
+    print("\n" + "="*80)
+    print("BENCHMARK: COMPILED RIGHT-HAND SIDE")
+    print("="*80)
+
+    state = nominal_initial_state()
+    ephemeris = default_ephemeris()
+    t_values = np.linspace(1.0, acceleration_time, n_calls).tolist()
+
+    # First call triggers JIT compilation; keep it out of the timing
+    equations_of_motion_compiled(0.0, state)
+
+    rates = {}
+    for label, rhs in (
+            ('numpy', lambda t: equations_of_motion(t, state)),
+            ('numpy_ephemeris', lambda t: equations_of_motion(t, state, ephemeris=ephemeris)),
+            ('compiled', lambda t: equations_of_motion_compiled(t, state))):
+        t_iter = iter(t_values)
+        rates[label] = 1.0 / _time_calls(lambda: rhs(next(t_iter)), n_calls)
+
+    print(f"\n  Numba available: {NUMBA_AVAILABLE}")
+    print(f"\n  Evaluations per second:")
+    for label, rate in rates.items():
+        print(f"    {label:16s} {rate:12,.0f} evals/s  ({rate/rates['numpy']:.1f}x)")
+
+    return {
+        'numba_available': NUMBA_AVAILABLE,
+        'evals_per_second': rates,
+        'speedup': rates['compiled'] / rates['numpy'],
+    }
+
+def _best_time(func, repeats):
+    """Best-of-N wall time [s] and the last result"""
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def _integrator_case(phase, method, rtol, atol, rhs, t_span, state0, reference, repeats, label=None):
+    """Run one solve_ivp configuration and compare its final state with the reference"""
+    wall_time, sol = _best_time(lambda: solve_ivp(rhs, t_span, state0, method=method, rtol=rtol, atol=atol),
+                                repeats)
+    final = sol.y[:, -1]
+    return {
+        'phase': phase,
+        'method': label or method,
+        'rtol': rtol,
+        'atol': atol,
+        'success': bool(sol.success),
+        'wall_time_s': wall_time,
+        'nfev': int(sol.nfev),
+        'steps': len(sol.t) - 1,
+        'position_error_m': float(np.linalg.norm(final[0:3] - reference[0:3])),
+        'velocity_error_m_s': float(np.linalg.norm(final[3:6] - reference[3:6])),
+    }
+
+def benchmark_integrators(acceleration_sweep=ACCELERATION_SWEEP, coast_sweep=COAST_SWEEP,
+                          reference_rtol=1e-13, repeats=3, ensemble_size=256):
+    """
+    Accuracy vs cost of integration methods and tolerances
+
+    Both phases are integrated with the same right-hand sides as
+    simulate_acceleration_phase / simulate_coast_phase. Each case records
+    wall time (best of `repeats`), RHS evaluations, steps and the final-state
+    error against a DOP853 reference at reference_rtol. The compiled RHS,
+    the ensemble integrator (cost per trajectory) and the Encke coast
+    propagator are included at the production tolerances.
+    """
+    print("\n" + "="*80)
+    print("BENCHMARK: INTEGRATOR ACCURACY VS COST")
+    print("="*80)
+
+    ephemeris = default_ephemeris()
+    state0 = nominal_initial_state()
+    cases = []
+
+    # Acceleration phase
+    accel_rhs = lambda t, y: equations_of_motion(t, y, acceleration_phase=True, ephemeris=ephemeris)
+    accel_span = (0.0, acceleration_time)
+    reference = solve_ivp(accel_rhs, accel_span, state0, method='DOP853', rtol=reference_rtol, atol=1e-12)
+    accel_reference = reference.y[:, -1]
+
+    for method, rtol in acceleration_sweep:
+        cases.append(_integrator_case('acceleration', method, rtol, 1e-12, accel_rhs, accel_span,
+                                      state0, accel_reference, repeats))
+
+    if NUMBA_AVAILABLE:
+        body_table = _body_table(ephemeris.bodies)
+        compiled_rhs = lambda t, y: equations_of_motion_compiled(t, y, acceleration_phase=True, bodies=body_table)
+        compiled_rhs(0.0, state0)  # JIT warm-up
+        cases.append(_integrator_case('acceleration', 'DOP853', 1e-10, 1e-12, compiled_rhs, accel_span,
+                                      state0, accel_reference, repeats, label='DOP853 (compiled)'))
+
+    states0 = np.repeat(state0[None, :], ensemble_size, axis=0)
+    wall_time, sol = _best_time(lambda: integrate_ensemble(
+        lambda t, y: equations_of_motion_batch(t, y, acceleration_phase=True, ephemeris=ephemeris),
+        accel_span, states0, rtol=1e-10, atol=1e-12), repeats)
+    final = sol['y'][0, :, -1]
+    cases.append({
+        'phase': 'acceleration',
+        'method': f'RK45 (ensemble x{ensemble_size}, per trajectory)',
+        'rtol': 1e-10,
+        'atol': 1e-12,
+        'success': bool(sol['success']),
+        'wall_time_s': wall_time / ensemble_size,
+        'nfev': int(sol['nfev']),
+        'steps': int(sol['nsteps']),
+        'position_error_m': float(np.linalg.norm(final[0:3] - accel_reference[0:3])),
+        'velocity_error_m_s': float(np.linalg.norm(final[3:6] - accel_reference[3:6])),
+    })
+
+    # Coast phase from the reference burnout state
+    coast_rhs = lambda t, y: equations_of_motion(t, y, acceleration_phase=False, ephemeris=ephemeris)
+    duration = (alpha_centauri_distance - np.linalg.norm(accel_reference[0:3])) / np.linalg.norm(accel_reference[3:6])
+    coast_span = (0.0, duration)
+    reference = solve_ivp(coast_rhs, coast_span, accel_reference, method='DOP853', rtol=reference_rtol, atol=1e-10)
+    coast_reference = reference.y[:, -1]
+
+    for method, rtol in coast_sweep:
+        cases.append(_integrator_case('coast', method, rtol, 1e-10, coast_rhs, coast_span,
+                                      accel_reference, coast_reference, repeats))
+
+    wall_time, sol = _best_time(lambda: propagate_coast_encke(accel_reference, duration, ephemeris=ephemeris,
+                                                              rtol=1e-8, atol=1e-10), repeats)
+    final = sol.y[:, -1]
+    cases.append({
+        'phase': 'coast',
+        'method': 'Encke (DOP853)',
+        'rtol': 1e-8,
+        'atol': 1e-10,
+        'success': bool(sol.success),
+        'wall_time_s': wall_time,
+        'nfev': int(sol.nfev),
+        'steps': None,
+        'position_error_m': float(np.linalg.norm(final[0:3] - coast_reference[0:3])),
+        'velocity_error_m_s': float(np.linalg.norm(final[3:6] - coast_reference[3:6])),
+    })
+
+    print(f"\n  Reference: DOP853 rtol={reference_rtol:g}")
+    print(f"\n  {'phase':13s} {'method':38s} {'rtol':>7s} {'time [ms]':>10s} {'nfev':>7s} {'steps':>6s} "
+          f"{'pos err [m]':>12s} {'vel err [m/s]':>13s}")
+    for case in cases:
+        steps = '-' if case['steps'] is None else str(case['steps'])
+        print(f"  {case['phase']:13s} {case['method']:38s} {case['rtol']:7.0e} {case['wall_time_s']*1e3:10.2f} "
+              f"{case['nfev']:7d} {steps:>6s} {case['position_error_m']:12.3e} {case['velocity_error_m_s']:13.3e}")
+
+    recommended = {}
+    print(f"\n  Cheapest settings meeting the position error target:")
+    for phase, target in (('acceleration', 1.0), ('coast', 1e3)):
+        best = cheapest_within_tolerance(cases, phase, target)
+        recommended[phase] = None if best is None else {'method': best['method'], 'rtol': best['rtol'],
+                                                        'position_error_target_m': target}
+        if best is not None:
+            print(f"    {phase:13s} (< {target:g} m): {best['method']} rtol={best['rtol']:g} "
+                  f"({best['wall_time_s']*1e3:.2f} ms)")
+
+    return {
+        'reference_rtol': reference_rtol,
+        'ensemble_size': ensemble_size,
+        'cases': cases,
+        'recommended': recommended,
+    }
+
+def cheapest_within_tolerance(cases, phase, position_error_m):
+    """Fastest successful case of a phase whose final position error meets the target (or None)"""
+    candidates = [case for case in cases
+                  if case['phase'] == phase and case['success'] and case['position_error_m'] <= position_error_m]
+    return min(candidates, key=lambda case: case['wall_time_s'], default=None)
+
+def compare_reports(baseline, current, time_tolerance=1.5, error_tolerance=10.0):
+    """
+    Flag integrator cases that regressed against a baseline report
+
+    A case regresses when its wall time grows by more than time_tolerance x,
+    its RHS evaluations grow at all, or its final-state error grows by more
+    than error_tolerance x (with a 1 m / 1e-6 m/s floor for round-off).
+    Returns a list of human-readable regression messages.
+    """
+    def key(case):
+        return (case['phase'], case['method'], case['rtol'])
+
+    baseline_cases = {key(case): case for case in baseline['integrators']['cases']}
+    regressions = []
+
+    for case in current['integrators']['cases']:
+        old = baseline_cases.get(key(case))
+        if old is None:
+            continue
+        name = f"{case['phase']} {case['method']} rtol={case['rtol']:g}"
+        if case['wall_time_s'] > time_tolerance * old['wall_time_s']:
+            regressions.append(f"{name}: wall time {old['wall_time_s']*1e3:.2f} -> {case['wall_time_s']*1e3:.2f} ms")
+        if case['nfev'] > old['nfev']:
+            regressions.append(f"{name}: nfev {old['nfev']} -> {case['nfev']}")
+        if case['position_error_m'] > error_tolerance * max(old['position_error_m'], 1.0):
+            regressions.append(f"{name}: position error {old['position_error_m']:.3e} -> "
+                               f"{case['position_error_m']:.3e} m")
+        if case['velocity_error_m_s'] > error_tolerance * max(old['velocity_error_m_s'], 1e-6):
+            regressions.append(f"{name}: velocity error {old['velocity_error_m_s']:.3e} -> "
+                               f"{case['velocity_error_m_s']:.3e} m/s")
+
+    return regressions
+
+def write_report(results, path):
+    """Write benchmark results as JSON with the run environment"""
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'numba_available': NUMBA_AVAILABLE,
+        },
+        **results,
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+def main(report_path=None, baseline_path=None):
+    """
+    Run all orbital simulator benchmarks
+
+    report_path:   JSON report destination (default: results/orbital_benchmarks.json)
+    baseline_path: optional earlier report; regressions against it are printed
+    """
+    print("="*80)
+    print("WARPEED LIGHTSAIL - ORBITAL SIMULATOR BENCHMARKS")
+    print("="*80)
+
+    results = {
+        'ephemeris': benchmark_ephemeris(),
+        'compiled_rhs': benchmark_compiled_rhs(),
+        'integrators': benchmark_integrators(),
+    }
+
+    if report_path is None:
+        output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'results')
+        os.makedirs(output_dir, exist_ok=True)
+        report_path = os.path.join(output_dir, 'orbital_benchmarks.json')
+    report = write_report(results, report_path)
+    print(f"\n✓ Benchmark report saved: {report_path}")
+
+    if baseline_path is not None:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(baseline, report)
+        print(f"\n  Regressions vs {baseline_path}: {len(regressions)}")
+        for message in regressions:
+            print(f"    ✗ {message}")
+
+    return report
+
+if __name__ == '__main__':
+    results = main()
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+WARPEED LIGHTSAIL - MONTE CARLO LAUNCH DISPERSION CAMPAIGN
+Arrival-error statistics for α Centauri under launch dispersions
+
+DISPERSIONS:
+- Laser power jitter (relative, Gaussian)
+- Beam pointing error (in-plane / out-of-plane thrust tilt, Gaussian)
+- Sail reflectivity variance (Gaussian, clipped at 1)
+- Launch-time phase (uniform over the launch window)
+
+Samples are integrated in batches with the vectorized ensemble integrator
+and fanned out over a process pool. Each batch draws from its own RNG
+stream spawned from the campaign seed, so results do not depend on the
+number of workers. Per-sample summaries are streamed to an append-only CSV
+file and percentiles are estimated incrementally (P² algorithm), so memory
+stays bounded for 100k+ sample campaigns.
+
+Author: Warpeed Orbital Mechanics Team
+Date: October 17, 2026
+"""
+
+import numpy as np
+import csv
+import json
+import os
+import io
+import time
+import contextlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from orbital_mechanics_simulation import (
+    simulate_acceleration_phase_ensemble, simulate_coast_phase_ensemble,
+    nominal_initial_state, default_ephemeris,
+    sail_reflectivity, acceleration_time, T_earth, AU
+)
+
+# ============================================================================
+# DISPERSION MODEL
+# ============================================================================
+
+DEFAULT_DISPERSIONS = {
+    'laser_power_sigma': 0.01,           # 1% (1σ) laser power jitter
+    'pointing_sigma_rad': 1e-7,          # 0.1 µrad (1σ) per thrust-tilt axis
+    'reflectivity_sigma': 2e-6,          # Reflectivity spread (1σ)
+    'launch_window_s': T_earth,          # Launch epoch uniform over one year
+}
+
+# Per-sample summary columns written to the campaign file
+SUMMARY_COLUMNS = (
+    'sample', 'batch', 'launch_epoch_days', 'laser_power_scale', 'reflectivity',
+    'pointing_in_plane_urad', 'pointing_out_of_plane_urad',
+    'v_final_c', 'targeting_error_AU', 'cross_track_error_AU', 'gravitational_losses'
+)
+
+# Metrics tracked by the streaming statistics
+SUMMARY_METRICS = ('v_final_c', 'targeting_error_AU', 'cross_track_error_AU', 'gravitational_losses')
+
+DEFAULT_QUANTILES = (0.01, 0.05, 0.5, 0.95, 0.99)
+
+def draw_dispersions(rng, n_samples, dispersions=None):
+    """
+    Draw dispersed launch inputs
+
+    Returns dict of (n_samples,) arrays: 'laser_power_scale', 'reflectivity',
+    'launch_epoch' [s] and 'pointing_error' (n_samples, 2) [rad].
+    """
+    model = dict(DEFAULT_DISPERSIONS, **(dispersions or {}))
+
+    return {
+        'laser_power_scale': 1.0 + model['laser_power_sigma'] * rng.standard_normal(n_samples),
+        'reflectivity': np.minimum(
+            sail_reflectivity + model['reflectivity_sigma'] * rng.standard_normal(n_samples), 1.0),
+        'pointing_error': model['pointing_sigma_rad'] * rng.standard_normal((n_samples, 2)),
+        'launch_epoch': model['launch_window_s'] * rng.random(n_samples),
+    }
+
+def launch_phase_rotation(launch_epoch):
+    """(N, 3, 3) rotations about ẑ by Earth's orbital phase at the launch epochs"""
+    phase = 2.0 * np.pi * np.asarray(launch_epoch, dtype=float) / T_earth
+    cos_phase, sin_phase = np.cos(phase), np.sin(phase)
+    rotation = np.zeros((len(phase), 3, 3))
+    rotation[:, 0, 0] = cos_phase
+    rotation[:, 0, 1] = -sin_phase
+    rotation[:, 1, 0] = sin_phase
+    rotation[:, 1, 1] = cos_phase
+    rotation[:, 2, 2] = 1.0
+    return rotation
+
+def dispersed_initial_states(launch_epoch):
+    """Nominal LEO launch state carried around Earth's orbit to each launch epoch"""
+    rotation = launch_phase_rotation(launch_epoch)
+    state0 = nominal_initial_state()
+    return np.concatenate([rotation @ state0[0:3], rotation @ state0[3:6]], axis=1)
+
+# ============================================================================
+# STREAMING STATISTICS
+# ============================================================================
+
+class P2Quantile:
+    """
+    Streaming quantile estimate with the P² algorithm (Jain & Chlamtac, 1985)
+
+    Keeps five markers whose heights are adjusted with piecewise-parabolic
+    interpolation, so memory is O(1) regardless of the number of samples.
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.count = 0
+        self.heights = []
+        self.positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self.desired = [0.0, 2.0 * p, 4.0 * p, 2.0 + 2.0 * p, 4.0]
+        self.increments = [0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0]
+
+    def add(self, x):
+        """Add one observation"""
+        self.count += 1
+        q = self.heights
+
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        # Locate the marker cell and update the extreme markers
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1.0
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Adjust the three middle markers
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1.0 and n[i + 1] - n[i] > 1.0) or (d <= -1.0 and n[i - 1] - n[i] < -1.0):
+                d = 1.0 if d > 0 else -1.0
+                q_new = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < q_new < q[i + 1]:
+                    j = i + int(d)
+                    q_new = q[i] + d * (q[j] - q[i]) / (n[j] - n[i])
+                q[i] = q_new
+                n[i] += d
+
+    def value(self):
+        """Current quantile estimate (exact for fewer than 5 observations)"""
+        if self.count == 0:
+            return float('nan')
+        if self.count <= 5:
+            return float(np.quantile(self.heights, self.p))
+        return self.heights[2]
+
+class StreamingStatistics:
+    """
+    Bounded-memory summary of a stream of values
+
+    Count, mean and standard deviation (batched Welford/Chan update),
+    min/max and P² quantile estimates.
+    """
+
+    def __init__(self, quantiles=DEFAULT_QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.quantiles = [P2Quantile(p) for p in quantiles]
+
+    def update(self, values):
+        """Add a batch of values (non-finite values are skipped)"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        n = len(values)
+        if n == 0:
+            return
+
+        batch_mean = values.mean()
+        batch_m2 = np.sum((values - batch_mean)**2)
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += batch_m2 + delta**2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        for x in values.tolist():
+            for estimator in self.quantiles:
+                estimator.add(x)
+
+    def summary(self):
+        """Dictionary of the current statistics"""
+        return {
+            'count': self.count,
+            'mean': float(self.mean),
+            'std': float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else 0.0,
+            'min': float(self.min),
+            'max': float(self.max),
+            'percentiles': {f"p{100 * q.p:g}": float(q.value()) for q in self.quantiles},
+        }
+
+# ============================================================================
+# CAMPAIGN EXECUTION
+# ============================================================================
+
+def _nominal_arrival_direction():
+    """Unit arrival direction of the undispersed trajectory launched at epoch 0"""
+    accel = simulate_acceleration_phase_ensemble(nominal_initial_state()[None, :], n_eval=2, rtol=1e-9)
+    coast = simulate_coast_phase_ensemble(accel['final_state'], n_eval=2, epoch=np.array([acceleration_time]))
+    r_final = coast['final_state'][0, 0:3]
+    return r_final / np.linalg.norm(r_final)
+
+def run_sample_batch(batch_index, seed_sequence, first_sample, n_samples, dispersions=None,
+                     aim_direction=None, rtol=1e-9):
+    """
+    Draw and propagate one batch of dispersed trajectories
+
+    Runs in a worker process; the batch RNG is seeded from its own spawned
+    SeedSequence. Returns a dict of (n_samples,) summary columns.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    inputs = draw_dispersions(rng, n_samples, dispersions)
+
+    # Laser force scales with power and reflectivity
+    laser_scale = inputs['laser_power_scale'] * inputs['reflectivity'] / sail_reflectivity
+    epoch = inputs['launch_epoch']
+    ephemeris = default_ephemeris()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        accel = simulate_acceleration_phase_ensemble(
+            dispersed_initial_states(epoch), n_eval=2, rtol=rtol, ephemeris=ephemeris,
+            laser_scale=laser_scale, pointing_error=inputs['pointing_error'], epoch=epoch)
+        coast = simulate_coast_phase_ensemble(
+            accel['final_state'], n_eval=2, ephemeris=ephemeris, epoch=epoch + acceleration_time)
+
+    # Cross-track error relative to the nominal aim rotated to each launch phase
+    if aim_direction is None:
+        aim_direction = _nominal_arrival_direction()
+    aim = launch_phase_rotation(epoch) @ aim_direction
+    r_final = coast['final_state'][:, 0:3]
+    along = np.einsum('ij,ij->i', r_final, aim)
+    cross_track = np.linalg.norm(r_final - along[:, None] * aim, axis=1)
+
+    return {
+        'sample': np.arange(first_sample, first_sample + n_samples),
+        'batch': np.full(n_samples, batch_index),
+        'launch_epoch_days': epoch / 86400.0,
+        'laser_power_scale': inputs['laser_power_scale'],
+        'reflectivity': inputs['reflectivity'],
+        'pointing_in_plane_urad': inputs['pointing_error'][:, 0] * 1e6,
+        'pointing_out_of_plane_urad': inputs['pointing_error'][:, 1] * 1e6,
+        'v_final_c': accel['v_final_c'],
+        'targeting_error_AU': coast['targeting_error_AU'],
+        'cross_track_error_AU': cross_track / AU,
+        'gravitational_losses': accel['gravitational_losses'],
+    }
+
+def _append_batch(writer, handle, columns):
+    """Append one batch of summaries to the campaign file"""
+    writer.writerows(zip(*(columns[name].tolist() for name in SUMMARY_COLUMNS)))
+    handle.flush()
+
+def run_campaign(n_samples, output_path, batch_size=1000, n_workers=None, seed=0,
+                 dispersions=None, quantiles=DEFAULT_QUANTILES, rtol=1e-9):
+    """
+    Run a Monte Carlo launch-dispersion campaign
+
+    n_samples:   total number of dispersed trajectories
+    output_path: CSV file receiving one summary row per sample (appended
+                 batch by batch as workers finish; rows are in completion order,
+                 statistics are accumulated in batch order so they only
+                 depend on the seed)
+    n_workers:   process pool size (None: os.cpu_count(), 1: run in-process)
+    seed:        campaign seed; batch b uses SeedSequence(seed).spawn(...)[b]
+
+    Returns dict with the campaign settings, throughput and streaming
+    statistics for v_final_c, targeting_error_AU, cross_track_error_AU and
+    gravitational_losses.
+    """
+    print("\n" + "="*80)
+    print("MONTE CARLO LAUNCH DISPERSION CAMPAIGN")
+    print("="*80)
+
+    model = dict(DEFAULT_DISPERSIONS, **(dispersions or {}))
+    n_batches = -(-n_samples // batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    sizes = [min(batch_size, n_samples - b * batch_size) for b in range(n_batches)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        aim_direction = _nominal_arrival_direction()
+
+    tasks = ((b, seeds[b], b * batch_size, sizes[b], model, aim_direction, rtol) for b in range(n_batches))
+    statistics = {name: StreamingStatistics(quantiles) for name in SUMMARY_METRICS}
+
+    print(f"\n  Samples: {n_samples:,} in {n_batches} batches of {batch_size}")
+    print(f"  Workers: {n_workers or os.cpu_count()}")
+    print(f"  Output: {output_path}")
+
+    start = time.perf_counter()
+    completed = 0
+
+    # Finished batches waiting for their predecessors before entering the statistics
+    ready = {}
+    next_batch = 0
+
+    def consume(batch_index, columns):
+        nonlocal completed, next_batch
+        _append_batch(writer, handle, columns)
+        ready[batch_index] = {name: columns[name] for name in SUMMARY_METRICS}
+        while next_batch in ready:
+            batch = ready.pop(next_batch)
+            for name in SUMMARY_METRICS:
+                statistics[name].update(batch[name])
+            next_batch += 1
+        completed += len(columns['sample'])
+        print(f"    {completed:,}/{n_samples:,} samples ({time.perf_counter() - start:.1f} s)")
+
+    with open(output_path, 'w', newline='') as handle:
+        writer = csv.writer(handle)
+        writer.writerow(SUMMARY_COLUMNS)
+        handle.flush()
+
+        if n_workers == 1:
+            for task in tasks:
+                consume(task[0], run_sample_batch(*task))
+        else:
+            # At most two batches per worker in flight or waiting for the
+            # statistics, so finished results are released instead of piling up
+            max_pending = 2 * (n_workers or os.cpu_count())
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                pending = {}
+
+                def collect():
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        consume(pending.pop(future), future.result())
+
+                for task in tasks:
+                    while len(pending) + len(ready) >= max_pending:
+                        collect()
+                    pending[pool.submit(run_sample_batch, *task)] = task[0]
+                while pending:
+                    collect()
+
+    wall_time = time.perf_counter() - start
+    summary = {name: statistics[name].summary() for name in SUMMARY_METRICS}
+
+    print(f"\n  RESULTS ({wall_time:.1f} s, {n_samples / wall_time:,.0f} samples/s):")
+    for name in SUMMARY_METRICS:
+        stats = summary[name]
+        percentiles = '  '.join(f"{k}={v:.6g}" for k, v in stats['percentiles'].items())
+        print(f"    {name:22s} mean={stats['mean']:.6g}  std={stats['std']:.3g}  {percentiles}")
+
+    return {
+        'n_samples': n_samples,
+        'batch_size': batch_size,
+        'n_workers': n_workers or os.cpu_count(),
+        'seed': seed,
+        'dispersions': model,
+        'output_path': output_path,
+        'wall_time_s': wall_time,
+        'samples_per_second': n_samples / wall_time,
+        'statistics': summary,
+    }
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(n_samples=10000):
+    """Run the default campaign and save its statistics next to the sample file"""
+    output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'results')
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = run_campaign(n_samples, os.path.join(output_dir, 'monte_carlo_samples.csv'))
+
+    json_path = os.path.join(output_dir, 'monte_carlo_summary.json')
+    with open(json_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✓ Campaign summary saved: {json_path}")
+
+    return results
+
+if __name__ == '__main__':
+    results = main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+WARPEED LIGHTSAIL - COLUMNAR TRAJECTORY STORE
+Binary storage for simulated trajectories (single runs and ensembles)
+
+LAYOUT (one directory per store):
+- manifest.json: format version, column dtypes and one entry per trajectory
+  (name, row offset, length, metadata)
+- time.npy:      (rows,) sample times [s]
+- position.npy:  (rows, 3) positions [m]
+- velocity.npy:  (rows, 3) velocities [m/s]
+
+Trajectories are appended row-wise to the column files, whose .npy headers
+are rewritten in place (NumPy pads them for growth along axis 0). Reads are
+memory-mapped: trajectory() returns zero-copy views shaped like the
+simulator results ('position'/'velocity' as (3, T)), so plot_trajectory and
+downstream analysis load only the slices they touch.
+
+Author: Warpeed Orbital Mechanics Team
+Date: October 17, 2026
+"""
+
+import numpy as np
+import json
+import os
+import shutil
+
+STORE_FORMAT = 'warpeed-trajectory-store'
+STORE_VERSION = 1
+
+# Column name -> trailing shape (rows are time samples)
+STORE_COLUMNS = {
+    'time': (),
+    'position': (3,),
+    'velocity': (3,),
+}
+
+class TrajectoryStore:
+    """
+    Append-by-trajectory columnar store with memory-mapped reads
+
+    store = TrajectoryStore(path)                    # open or create
+    store.append(time, position, velocity, name='acceleration')
+    view = store.trajectory('acceleration')          # zero-copy (3, T) views
+    """
+
+    def __init__(self, path, overwrite=False, dtype='<f8'):
+        self.path = path
+        self.manifest_path = os.path.join(path, 'manifest.json')
+
+        if overwrite and os.path.isdir(path):
+            shutil.rmtree(path)
+
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+            if self.manifest.get('format') != STORE_FORMAT:
+                raise ValueError(f"{path} is not a trajectory store")
+            if self.manifest.get('version') != STORE_VERSION:
+                raise ValueError(f"Unsupported trajectory store version {self.manifest.get('version')}")
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.manifest = {
+                'format': STORE_FORMAT,
+                'version': STORE_VERSION,
+                'dtype': np.dtype(dtype).str,
+                'rows': 0,
+                'columns': {name: list(shape) for name, shape in STORE_COLUMNS.items()},
+                'trajectories': [],
+            }
+            for name, shape in STORE_COLUMNS.items():
+                self._write_header(name, (0,) + shape, create=True)
+            self._save_manifest()
+
+        self._maps = {}
+        self._index = {entry['name']: k for k, entry in enumerate(self.manifest['trajectories'])}
+
+    # ------------------------------------------------------------------
+    # File handling
+    # ------------------------------------------------------------------
+
+    def _column_path(self, name):
+        return os.path.join(self.path, f"{name}.npy")
+
+    def _write_header(self, name, shape, create=False):
+        """Write (or rewrite in place) the .npy header of a column file"""
+        header = {'descr': self.manifest['dtype'], 'fortran_order': False, 'shape': shape}
+        with open(self._column_path(name), 'wb' if create else 'r+b') as f:
+            np.lib.format.write_array_header_1_0(f, header)
+            if not create and f.tell() != self._data_offset(name):
+                raise RuntimeError(f"Header of {name}.npy cannot grow in place")
+
+    def _data_offset(self, name):
+        with open(self._column_path(name), 'rb') as f:
+            np.lib.format.read_magic(f)
+            np.lib.format.read_array_header_1_0(f)
+            return f.tell()
+
+    def _save_manifest(self):
+        """Write the manifest atomically (readers never see a partial file)"""
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _column(self, name):
+        """Read-only memory map of a full column (reopened after appends)"""
+        if name not in self._maps:
+            if self.manifest['rows'] == 0:
+                return np.empty((0,) + STORE_COLUMNS[name], dtype=self.manifest['dtype'])
+            self._maps[name] = np.load(self._column_path(name), mmap_mode='r')
+        return self._maps[name]
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _columns(self, time, position, velocity):
+        """Validate one trajectory and convert it to row-major column blocks"""
+        time = np.ascontiguousarray(time, dtype=self.manifest['dtype'])
+        columns = {'time': time}
+        for column, values in (('position', position), ('velocity', velocity)):
+            values = np.asarray(values, dtype=self.manifest['dtype'])
+            if values.shape == (3, len(time)):
+                values = values.T
+            if values.shape != (len(time), 3):
+                raise ValueError(f"{column} has shape {values.shape}, expected (3, {len(time)})")
+            columns[column] = values
+        return columns
+
+    def _append_blocks(self, blocks, names, metadata):
+        """Write several trajectories with one write per column and one manifest update"""
+        names = [f"trajectory_{len(self) + k}" if name is None else name for k, name in enumerate(names)]
+        if len(set(names)) != len(names) or any(name in self._index for name in names):
+            raise ValueError("Trajectory names must be unique")
+
+        # Data first, then headers, then the manifest that makes it visible.
+        # Rows beyond the manifest (an interrupted append) are overwritten.
+        rows_before = self.manifest['rows']
+        rows = rows_before + sum(len(block['time']) for block in blocks)
+        for column, shape in STORE_COLUMNS.items():
+            data = np.concatenate([block[column] for block in blocks])
+            row_bytes = data.itemsize * int(np.prod(shape, dtype=int))
+            with open(self._column_path(column), 'r+b') as f:
+                f.seek(self._data_offset(column) + rows_before * row_bytes)
+                f.truncate()
+                f.write(np.ascontiguousarray(data).tobytes())
+            self._write_header(column, (rows,) + shape)
+
+        offset = rows_before
+        indices = []
+        for block, name, meta in zip(blocks, names, metadata):
+            self._index[name] = len(self.manifest['trajectories'])
+            indices.append(self._index[name])
+            self.manifest['trajectories'].append({
+                'name': name,
+                'offset': offset,
+                'length': len(block['time']),
+                'metadata': meta or {},
+            })
+            offset += len(block['time'])
+        self.manifest['rows'] = rows
+        self._save_manifest()
+        self._maps = {}
+
+        return indices
+
+    def append(self, time, position, velocity, name=None, metadata=None):
+        """
+        Append one trajectory
+
+        time: (T,), position/velocity: (3, T) as returned by the simulators
+        ((T, 3) is accepted for T != 3). Returns the trajectory index.
+        """
+        return self._append_blocks([self._columns(time, position, velocity)], [name], [metadata])[0]
+
+    def append_result(self, result, name=None, metadata=None):
+        """Append a simulate_*_phase result dict ('time', 'position', 'velocity')"""
+        return self.append(result['time'], result['position'], result['velocity'], name=name, metadata=metadata)
+
+    def append_ensemble(self, time, position, velocity, names=None, metadata=None):
+        """
+        Append an ensemble result trajectory by trajectory (in one write)
+
+        time: (T,) shared or (N, T) per trajectory;
+        position/velocity: (N, 3, T) as returned by the ensemble simulators.
+        Returns the list of trajectory indices.
+        """
+        time = np.asarray(time)
+        n = len(position)
+        blocks = [self._columns(time if time.ndim == 1 else time[k], position[k], velocity[k]) for k in range(n)]
+        return self._append_blocks(blocks, [None] * n if names is None else list(names),
+                                   [None] * n if metadata is None else list(metadata))
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.manifest['trajectories'])
+
+    @property
+    def names(self):
+        return [entry['name'] for entry in self.manifest['trajectories']]
+
+    def _entry(self, key):
+        if isinstance(key, str):
+            if key not in self._index:
+                raise KeyError(f"No trajectory named '{key}'")
+            key = self._index[key]
+        return self.manifest['trajectories'][key]
+
+    def trajectory(self, key, t_range=None):
+        """
+        Zero-copy views of one trajectory (by index or name)
+
+        t_range: optional (t_min, t_max) restricting the samples returned.
+        Returns dict with 'time' (T,), 'position'/'velocity' (3, T) memmap
+        views, 'name' and 'metadata'.
+        """
+        entry = self._entry(key)
+        start, stop = entry['offset'], entry['offset'] + entry['length']
+
+        time = self._column('time')[start:stop]
+        if t_range is not None:
+            first, last = np.searchsorted(time, t_range[0], 'left'), np.searchsorted(time, t_range[1], 'right')
+            start, stop = start + first, start + last
+            time = time[first:last]
+
+        return {
+            'name': entry['name'],
+            'metadata': entry['metadata'],
+            'time': time,
+            'position': self._column('position')[start:stop].T,
+            'velocity': self._column('velocity')[start:stop].T,
+        }
+
+    def final_states(self):
+        """(N, 6) final state of every trajectory (gathered from the memmaps)"""
+        last = np.array([entry['offset'] + entry['length'] - 1 for entry in self.manifest['trajectories']],
+                        dtype=int)
+        return np.concatenate([self._column('position')[last], self._column('velocity')[last]], axis=1)
@@ -4,11 +4,37 @@ Exploring what's actually achievable at 4.37 light-years
 """
 
 import json
+import os
+import sys
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'quantum'))
+from solution_store import SolutionStore
+
+def summarize_solution_store(store_path, max_mass_g=500.0):
+    """
+    Best feasible architecture per band under a mass limit, queried from the
+    memory-mapped solution store (every evaluated configuration, not only the
+    top 50 in the JSON); returns {band: row dict}
+    """
+    store = SolutionStore.open(store_path)
+    candidates = store.filter(store['feasible'] & (store['mass_g'] <= max_mass_g))
+
+    print(f"\nBEST FEASIBLE PER BAND (mass <= {max_mass_g:g} g, {len(candidates):,} of {len(store):,} solutions):")
+    best = {}
+    for band, group in candidates.group_by('band').items():
+        best[band] = group.top_k(1).rows()[0]
+        row = best[band]
+        print(f"   {band:10s}: Eb/N0 {row['eb_n0_db']:.2f} dB, {row['data_rate_bps']:.1f} bps, "
+              f"{row['mass_g']:.1f} g, TX {row['tx_power_w']:.1f} W / {row['tx_antenna_m']:.2f} m, "
+              f"RX {row['rx_antenna_m']:.0f} m ({len(group):,} feasible)")
+    if not best:
+        print("   No feasible solutions")
+    return best
+
 def analyze_rf_results():
     """Analyze quantum RF optimization results and provide insights"""
 
@@ -66,6 +92,10 @@ def analyze_rf_results():
     print(f"   TX Antenna: {best_mass['config']['tx_antenna_m']:.2f} m")
     print(f"   Eb/N0: {best_mass['eb_n0_db']:.2f} dB")
 
+    # Every evaluated configuration, if the optimizer saved a solution store
+    if data.get('solution_store') and os.path.isdir(data['solution_store']):
+        summarize_solution_store(data['solution_store'])
+
     # DSN compatible
     dsn_solutions = [s for s in top_solutions if s['metrics']['dsn_compatible']]
     if dsn_solutions:
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Pareto Ranking Utilities for the Quantum Optimizers
+===================================================
+
+Shared multi-objective result handling for the integrated, comm, RF, power
+and laser optimizers. Objectives are passed as an (N, k) array and are all
+MAXIMIZED (negate a column to minimize it, e.g. mass or cost).
+
+- pareto_front_mask:      first non-dominated front (O(N log N) for k = 2)
+- non_dominated_sort:     front rank of every point (O(N log N) for k = 2,
+                          efficient non-dominated sort with binary search
+                          over fronts for k > 2)
+- crowding_distance:      NSGA-II crowding distance within one front
+- ParetoArchive:          incremental non-dominated archive for streamed
+                          candidates (single points or batches)
+
+Dominance: a dominates b if a >= b in every objective and a > b in at
+least one. With keep_duplicates=False only the first occurrence of an
+objective vector is kept (the semantics of generate_pareto_frontier).
+"""
+
+import numpy as np
+from bisect import bisect_left
+from typing import List, Tuple
+
+
+def _as_objectives(objectives) -> np.ndarray:
+    objectives = np.asarray(objectives, dtype=float)
+    if objectives.ndim == 1:
+        objectives = objectives[:, None]
+    if objectives.ndim != 2:
+        raise ValueError(f"objectives must be (N, k), got shape {objectives.shape}")
+    return objectives
+
+
+def _first_occurrences(objectives: np.ndarray) -> np.ndarray:
+    """Mask of the first row of every distinct objective vector"""
+    _, first = np.unique(objectives, axis=0, return_index=True)
+    mask = np.zeros(len(objectives), dtype=bool)
+    mask[first] = True
+    return mask
+
+
+def _dominates_any(front: np.ndarray, point: np.ndarray) -> bool:
+    """True if any row of front dominates point"""
+    at_least = np.all(front >= point, axis=1)
+    return bool(np.any(at_least & np.any(front > point, axis=1)))
+
+
+# ============================================================================
+# NON-DOMINATED SORTING
+# ============================================================================
+
+def pareto_front_mask(objectives, keep_duplicates: bool = True) -> np.ndarray:
+    """
+    Boolean mask of the non-dominated rows of an (N, k) objective array
+
+    k = 2 uses one lexicographic sort and a running maximum (O(N log N));
+    k > 2 culls candidates against the growing front in sorted order.
+    """
+    objectives = _as_objectives(objectives)
+    n, k = objectives.shape
+    mask = np.zeros(n, dtype=bool)
+    if n == 0:
+        return mask
+
+    if k == 1:
+        mask = objectives[:, 0] == objectives[:, 0].max()
+    elif k == 2:
+        # Descending f0, then descending f1: a point is dominated iff an
+        # earlier point has larger f1, or equal f1 with larger f0
+        order = np.lexsort((-objectives[:, 1], -objectives[:, 0]))
+        f0, f1 = objectives[order, 0], objectives[order, 1]
+        best_f1 = np.concatenate([[-np.inf], np.maximum.accumulate(f1)[:-1]])
+        # f0 of the earliest point reaching the running maximum of f1
+        at_best = np.concatenate([[0], np.flatnonzero(np.diff(np.maximum.accumulate(f1)) > 0) + 1])
+        owner = at_best[np.searchsorted(at_best, np.arange(n), side='right') - 1]
+        best_f0 = np.concatenate([[np.inf], f0[owner][:-1]])
+        dominated = (best_f1 > f1) | ((best_f1 == f1) & (best_f0 > f0))
+        mask[order] = ~dominated
+    else:
+        order = np.lexsort(tuple(-objectives[:, j] for j in range(k - 1, -1, -1)))
+        front = []
+        for i in order:
+            if not front or not _dominates_any(objectives[front], objectives[i]):
+                front.append(i)
+        mask[front] = True
+
+    if not keep_duplicates:
+        mask &= _first_occurrences(objectives)
+    return mask
+
+
+def non_dominated_sort(objectives) -> np.ndarray:
+    """
+    Front rank (0 = Pareto front) of every row of an (N, k) objective array
+
+    Points are processed in lexicographically descending order, so no later
+    point can dominate an earlier one; each point joins the first front none
+    of whose members dominates it, found by binary search over the fronts.
+    For k = 2 a front is tested through its last member only (O(N log N)).
+    """
+    objectives = _as_objectives(objectives)
+    n, k = objectives.shape
+    ranks = np.zeros(n, dtype=int)
+    if n == 0 or k == 1:
+        if k == 1 and n:
+            ranks = np.unique(-objectives[:, 0], return_inverse=True)[1].ravel()
+        return ranks
+
+    order = np.lexsort(tuple(-objectives[:, j] for j in range(k - 1, -1, -1)))
+
+    if k == 2:
+        # keys[r] = -(f1, f0) of the last member of front r (increasing);
+        # front r dominates the point iff keys[r] < its key
+        keys: List[Tuple[float, float]] = []
+        for i in order:
+            key = (-objectives[i, 1], -objectives[i, 0])
+            r = bisect_left(keys, key)
+            if r == len(keys):
+                keys.append(key)
+            else:
+                keys[r] = key
+            ranks[i] = r
+        return ranks
+
+    fronts: List[List[int]] = []
+    for i in order:
+        point = objectives[i]
+        lo, hi = 0, len(fronts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _dominates_any(objectives[fronts[mid]], point):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(fronts):
+            fronts.append([])
+        fronts[lo].append(i)
+        ranks[i] = lo
+    return ranks
+
+
+def crowding_distance(objectives) -> np.ndarray:
+    """NSGA-II crowding distance of the rows of one front (boundary points: inf)"""
+    objectives = _as_objectives(objectives)
+    n, k = objectives.shape
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+
+    for j in range(k):
+        order = np.argsort(objectives[:, j], kind='stable')
+        values = objectives[order, j]
+        span = values[-1] - values[0]
+        distance[order[0]] = distance[order[-1]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+
+# ============================================================================
+# INCREMENTAL ARCHIVE
+# ============================================================================
+
+class ParetoArchive:
+    """
+    Non-dominated archive for streamed candidates
+
+    archive = ParetoArchive()
+    archive.add(objectives_row, item)            # single candidate
+    archive.add_batch(objectives, items)         # (M, k) chunk
+    archive.objectives, archive.items            # current front, arrival order
+
+    capacity: optional size bound; when exceeded, the most crowded members
+    (smallest crowding distance) are dropped.
+    """
+
+    def __init__(self, capacity: int = None, keep_duplicates: bool = True):
+        self.capacity = capacity
+        self.keep_duplicates = keep_duplicates
+        self.objectives = None
+        self.items = []
+        self.n_seen = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, objectives, item=None) -> bool:
+        """Offer one candidate; returns True if it entered the archive"""
+        point = np.asarray(objectives, dtype=float).ravel()
+        self.n_seen += 1
+        if self.objectives is None:
+            self.objectives = point[None, :]
+            self.items = [item]
+            return True
+
+        front = self.objectives
+        if _dominates_any(front, point):
+            return False
+        if not self.keep_duplicates and np.any(np.all(front == point, axis=1)):
+            return False
+
+        dominated = np.all(point >= front, axis=1) & np.any(point > front, axis=1)
+        keep = ~dominated
+        self.objectives = np.vstack([front[keep], point])
+        self.items = [it for it, k in zip(self.items, keep) if k] + [item]
+        self._enforce_capacity()
+        return True
+
+    def add_batch(self, objectives, items=None) -> int:
+        """Offer an (M, k) chunk of candidates; returns how many entered"""
+        objectives = _as_objectives(objectives)
+        if items is None:
+            items = range(self.n_seen, self.n_seen + len(objectives))
+        items = list(items)
+        self.n_seen += len(objectives)
+
+        # Thin the chunk first, then merge with the archive (archive first, so
+        # existing members win ties when duplicates are dropped)
+        chunk = np.flatnonzero(pareto_front_mask(objectives, keep_duplicates=self.keep_duplicates))
+        if self.objectives is None:
+            merged = objectives[chunk]
+            merged_items = [items[i] for i in chunk]
+            n_before = 0
+        else:
+            n_before = len(self.objectives)
+            merged = np.vstack([self.objectives, objectives[chunk]])
+            merged_items = self.items + [items[i] for i in chunk]
+
+        keep = pareto_front_mask(merged, keep_duplicates=self.keep_duplicates)
+        self.objectives = merged[keep]
+        self.items = [it for it, k in zip(merged_items, keep) if k]
+        self._enforce_capacity()
+        return int(keep[n_before:].sum())
+
+    def _enforce_capacity(self):
+        while self.capacity is not None and len(self.items) > self.capacity:
+            drop = int(np.argmin(crowding_distance(self.objectives)))
+            self.objectives = np.delete(self.objectives, drop, axis=0)
+            del self.items[drop]
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Variational QAOA Angle Optimization
+===================================
+
+Classical outer loop that tunes the per-layer QAOA angles (gamma_l, beta_l)
+against the expected decoded objective, evaluated exactly on the local
+statevector simulator (qaoa_simulator.py):
+
+    E(gamma, beta) = sum_x P(x | gamma, beta) * objective[x]      (maximized)
+
+- Depth 1 starts from the best point of a coarse (gamma, beta) grid.
+- Depth p+1 is warm-started from the depth-p optimum by linear
+  interpolation of the angle schedules (INTERP), then refined locally.
+- Tuned angles are cached per problem instance (objective vector and
+  circuit family, or a caller-supplied encoding fingerprint), in memory
+  and optionally in a JSON file, so repeated runs and hardware
+  submissions reuse them without re-optimizing.
+- With a precomputed cost diagonal (qaoa_cost.py) the expectation is
+  evolved directly on the simulator, without building circuits.
+
+tuner = QAOAAngleOptimizer(build_circuit, objective, instance='integrated:balanced')
+gammas, betas = tuner.optimize(n_layers=3)
+qc = build_circuit(gammas, betas)          # angles for the hardware shots
+"""
+
+import numpy as np
+import json
+import os
+import hashlib
+from typing import Callable, Dict, List, Tuple
+
+from qiskit import QuantumCircuit
+from scipy.optimize import minimize
+
+from qaoa_simulator import QAOASimulator
+
+
+class AngleCache:
+    """
+    Tuned QAOA angles per problem instance and depth
+
+    path: optional JSON file; loaded on creation, rewritten on every store
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Dict]] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f)
+
+    def get(self, key: str, n_layers: int) -> Dict:
+        return self.entries.get(key, {}).get(str(n_layers))
+
+    def store(self, key: str, n_layers: int, gammas, betas, value: float, n_evaluations: int):
+        self.entries.setdefault(key, {})[str(n_layers)] = {
+            'gammas': [float(g) for g in gammas],
+            'betas': [float(b) for b in betas],
+            'expected_objective': float(value),
+            'evaluations': int(n_evaluations)
+        }
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump(self.entries, f, indent=2)
+
+
+# Shared by all optimizers in a session unless a cache is passed explicitly
+DEFAULT_ANGLE_CACHE = AngleCache()
+
+
+def interpolate_angles(angles: np.ndarray) -> np.ndarray:
+    """
+    INTERP warm start: depth-p schedule -> depth-(p+1) schedule
+
+    a'_i = (i / p) a_{i-1} + ((p - i) / p) a_i,  i = 0..p  (a_{-1} = a_p = 0)
+    """
+    angles = np.asarray(angles, dtype=float)
+    p = len(angles)
+    padded = np.concatenate([[0.0], angles, [0.0]])
+    i = np.arange(p + 1)
+    return (i / p) * padded[i] + ((p - i) / p) * padded[i + 1]
+
+
+class QAOAAngleOptimizer:
+    """
+    Tune (gamma_l, beta_l) of a QAOA circuit family on the local simulator
+
+    build_circuit: (gammas, betas) -> bound, measured QuantumCircuit
+    objective:     value to MAXIMIZE for every outcome (classical register
+                   value), length 2^n_clbits, or a callable returning it,
+                   evaluated only once an expectation is needed
+    instance:      problem-instance label; the cache key also includes a
+                   hash of the objective vector (and of cost_diagonal)
+    fingerprint:   replaces that hash in the cache key, e.g. a hash of the
+                   encoding the objective is computed from; a cache hit then
+                   never evaluates a callable objective
+    cost_diagonal: diagonal C evolved as exp(-i gamma C) by the cost layers
+                   of build_circuit, if known; expectations then skip the
+                   circuit (build_circuit may be None)
+    gamma_range, beta_range: depth-1 grid search ranges
+    """
+
+    def __init__(self, build_circuit: Callable[[np.ndarray, np.ndarray], QuantumCircuit],
+                 objective, instance: str = 'qaoa',
+                 simulator: QAOASimulator = None, cache: AngleCache = None,
+                 gamma_range: Tuple[float, float] = (0.0, np.pi),
+                 beta_range: Tuple[float, float] = (0.0, np.pi / 2),
+                 grid_size: int = 6, maxiter: int = 40, cost_diagonal: np.ndarray = None,
+                 fingerprint: str = None):
+        self.build_circuit = build_circuit
+        self._objective = objective if callable(objective) else np.asarray(objective, dtype=float)
+        self.cost_diagonal = cost_diagonal
+        self.simulator = simulator or QAOASimulator()
+        self.cache = DEFAULT_ANGLE_CACHE if cache is None else cache
+        self.gamma_range = gamma_range
+        self.beta_range = beta_range
+        self.grid_size = grid_size
+        self.maxiter = maxiter
+        self.n_evaluations = 0
+
+        if fingerprint is None:
+            digest = hashlib.sha1(np.ascontiguousarray(self.objective).tobytes())
+            if cost_diagonal is not None:
+                digest.update(np.ascontiguousarray(cost_diagonal, dtype=float).tobytes())
+            fingerprint = digest.hexdigest()[:16]
+        self.key = f"{instance}:{fingerprint}"
+
+    @property
+    def objective(self) -> np.ndarray:
+        if callable(self._objective):
+            self._objective = np.asarray(self._objective(), dtype=float)
+        return self._objective
+
+    def expectation(self, gammas, betas) -> float:
+        """Exact expected objective of the circuit's output distribution"""
+        self.n_evaluations += 1
+        if self.cost_diagonal is not None:
+            probs = self.simulator.qaoa_probabilities(self.cost_diagonal, gammas, betas)
+        else:
+            probs = self.simulator.probabilities(self.build_circuit(np.asarray(gammas), np.asarray(betas)))
+        return float(probs @ self.objective)
+
+    def _refine(self, gammas: np.ndarray, betas: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        p = len(gammas)
+
+        def negative(x):
+            return -self.expectation(x[:p], x[p:])
+
+        result = minimize(negative, np.concatenate([gammas, betas]), method='COBYLA',
+                          options={'maxiter': self.maxiter * p, 'rhobeg': 0.2})
+        return result.x[:p], result.x[p:], -result.fun
+
+    def _grid_start(self) -> Tuple[np.ndarray, np.ndarray]:
+        best, best_value = None, -np.inf
+        for gamma in np.linspace(*self.gamma_range, self.grid_size + 2)[1:-1]:
+            for beta in np.linspace(*self.beta_range, self.grid_size + 2)[1:-1]:
+                value = self.expectation([gamma], [beta])
+                if value > best_value:
+                    best, best_value = (gamma, beta), value
+        return np.array([best[0]]), np.array([best[1]])
+
+    def optimize(self, n_layers: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tuned angles for n_layers, building up from depth 1 with warm starts
+        (every intermediate depth is cached as well)
+        """
+        cached = self.cache.get(self.key, n_layers)
+        if cached is not None:
+            return np.array(cached['gammas']), np.array(cached['betas'])
+
+        # Deepest cached schedule below n_layers, else the depth-1 grid
+        depth, gammas, betas = 0, None, None
+        for p in range(n_layers - 1, 0, -1):
+            entry = self.cache.get(self.key, p)
+            if entry is not None:
+                depth, gammas, betas = p, np.array(entry['gammas']), np.array(entry['betas'])
+                break
+
+        while depth < n_layers:
+            if depth == 0:
+                gammas, betas = self._grid_start()
+            else:
+                gammas, betas = interpolate_angles(gammas), interpolate_angles(betas)
+            depth += 1
+            start = self.n_evaluations
+            gammas, betas, value = self._refine(gammas, betas)
+            self.cache.store(self.key, depth, gammas, betas, value, self.n_evaluations - start)
+
+        return gammas, betas
+
+    def history(self) -> List[Dict]:
+        """Cached results of this instance by depth"""
+        entries = self.cache.entries.get(self.key, {})
+        return [dict(entry, n_layers=int(p)) for p, entry in sorted(entries.items(), key=lambda e: int(e[0]))]
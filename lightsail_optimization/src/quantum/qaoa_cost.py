@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Diagonal Cost Hamiltonians for the QAOA Optimizers
+==================================================
+
+The hand-coded RZ/RZZ cost layers of the create_qaoa_circuit methods do not
+reflect the objectives the optimizers actually rank by (evaluate_design,
+evaluate_configuration, ...). This module evaluates the true objective of
+every basis state of an n-qubit encoding once and uses it three ways:
+
+- DiagonalCost:   the objective of all 2^n outcomes, computed vectorized in
+                  chunks through a batch evaluator (outcome ints -> values)
+- IsingModel:     sparse fit of the diagonal in the Z-product basis. The
+                  Walsh-Hadamard transform gives every coefficient exactly
+                  (f = sum_S c_S prod_{q in S} z_q); keeping orders <= 2
+                  gives fields and couplings, i.e. an RZ/RZZ cost layer.
+                  explained_variance reports how much of f survives.
+- circuits and expectations: cost.circuit(...) builds a QAOA circuit whose
+                  cost layers implement the fitted model; cost.expectation
+                  evolves the same cost diagonal directly on the simulator
+                  (no circuit), for angle optimization.
+
+Conventions: values are MAXIMIZED. The evolved cost is C = -(f - mean)/std
+(fitted f for the Ising model), layer exp(-i gamma C), mixer exp(-i beta X)
+per qubit; outcome bit q is qubit q (qiskit ordering).
+
+cost = DiagonalCost.from_batch(evaluate_outcomes, n_qubits=20)
+model = cost.fit_ising(max_order=2)
+gammas, betas = cost.angle_optimizer(model, instance='power').optimize(n_layers=2)
+qc = cost.circuit(gammas, betas, model)          # faithful hardware circuit
+value = cost.expectation(gammas, betas, model)   # exact E[f] of that circuit
+"""
+
+import numpy as np
+from typing import Callable, Dict, Tuple
+
+from qiskit import QuantumCircuit
+
+from qaoa_simulator import QAOASimulator
+from qaoa_angles import AngleCache, QAOAAngleOptimizer
+
+
+def walsh_hadamard(values: np.ndarray) -> np.ndarray:
+    """Unnormalized fast Walsh-Hadamard transform (length 2^n, returns a copy)"""
+    out = np.array(values, dtype=float)
+    n = out.size.bit_length() - 1
+    if out.size != 2 ** n:
+        raise ValueError(f"length must be a power of two, got {out.size}")
+    for q in range(n):
+        view = out.reshape(-1, 2, 2 ** q)
+        low = view[:, 0, :].copy()
+        view[:, 0, :] += view[:, 1, :]
+        view[:, 1, :] = low - view[:, 1, :]
+    return out
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    counts = np.zeros(masks.shape, dtype=np.int64)
+    masks = masks.copy()
+    while masks.any():
+        counts += masks & 1
+        masks >>= 1
+    return counts
+
+
+class IsingModel:
+    """
+    Sparse Z-product expansion of a cost diagonal
+
+    terms:  {(q,): h_q, (q, r): J_qr, ...} coefficients of prod z
+    offset: constant term
+    explained_variance: fraction of the diagonal's variance kept
+    """
+
+    def __init__(self, n_qubits: int, terms: Dict[Tuple[int, ...], float], offset: float,
+                 explained_variance: float):
+        self.n_qubits = n_qubits
+        self.terms = terms
+        self.offset = offset
+        self.explained_variance = explained_variance
+        self._diagonal = None
+
+    @property
+    def max_order(self) -> int:
+        return max((len(key) for key in self.terms), default=0)
+
+    def diagonal(self) -> np.ndarray:
+        """Model value of every basis state (inverse Walsh-Hadamard transform)"""
+        if self._diagonal is None:
+            coefficients = np.zeros(2 ** self.n_qubits)
+            coefficients[0] = self.offset
+            for key, value in self.terms.items():
+                coefficients[sum(1 << q for q in key)] = value
+            self._diagonal = walsh_hadamard(coefficients)
+        return self._diagonal
+
+
+class DiagonalCost:
+    """
+    Objective of every outcome of an n-qubit encoding (maximized)
+
+    values: length-2^n array, index = measured outcome value
+    """
+
+    def __init__(self, values: np.ndarray, simulator: QAOASimulator = None):
+        self.values = np.asarray(values, dtype=float)
+        self.n_qubits = self.values.size.bit_length() - 1
+        if self.values.size != 2 ** self.n_qubits:
+            raise ValueError(f"values must have 2^n entries, got {self.values.size}")
+        self.mean = float(self.values.mean())
+        self.std = float(self.values.std()) or 1.0
+        # Single precision: expectations to ~1e-6, at a third of the time
+        self.simulator = simulator or QAOASimulator(dtype=np.complex64)
+        self._coefficients = None
+
+    @classmethod
+    def from_batch(cls, evaluate: Callable[[np.ndarray], np.ndarray], n_qubits: int,
+                   chunk_size: int = 65536) -> 'DiagonalCost':
+        """Evaluate evaluate(outcomes) over all 2^n outcomes in chunks"""
+        values = np.empty(2 ** n_qubits)
+        for start in range(0, len(values), chunk_size):
+            outcomes = np.arange(start, min(start + chunk_size, len(values)), dtype=np.int64)
+            values[outcomes] = evaluate(outcomes)
+        return cls(values)
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """Z-product coefficients c_S of the values, indexed by qubit mask S"""
+        if self._coefficients is None:
+            self._coefficients = walsh_hadamard(self.values) / self.values.size
+        return self._coefficients
+
+    def fit_ising(self, max_order: int = 2, max_terms: int = None) -> IsingModel:
+        """
+        Exact Z-product coefficients truncated to orders <= max_order,
+        optionally to the max_terms largest in magnitude
+        """
+        coefficients = self.coefficients
+        masks = np.arange(1, coefficients.size, dtype=np.int64)
+        keep = masks[_popcount(masks) <= max_order]
+        if max_terms is not None and len(keep) > max_terms:
+            keep = keep[np.argsort(-np.abs(coefficients[keep]), kind='stable')[:max_terms]]
+        keep = np.sort(keep)
+
+        terms = {tuple(q for q in range(self.n_qubits) if mask >> q & 1): float(coefficients[mask])
+                 for mask in keep if coefficients[mask] != 0.0}
+        total = float(np.sum(coefficients[1:] ** 2))
+        explained = float(np.sum(coefficients[keep] ** 2) / total) if total > 0 else 1.0
+        return IsingModel(self.n_qubits, terms, float(coefficients[0]), explained)
+
+    def phase(self, model: IsingModel = None) -> np.ndarray:
+        """Normalized cost diagonal C = -(f - mean)/std evolved by the cost layers"""
+        values = self.values if model is None else model.diagonal()
+        return -(values - self.mean) / self.std
+
+    def circuit(self, gammas, betas, model: IsingModel) -> QuantumCircuit:
+        """QAOA circuit implementing exp(-i gamma C_model) cost layers and RX mixers"""
+        if model.max_order > 2:
+            raise ValueError(f"Only orders <= 2 map to RZ/RZZ gates (model order {model.max_order})")
+        qc = QuantumCircuit(self.n_qubits)
+        qc.h(range(self.n_qubits))
+        for gamma, beta in zip(gammas, betas):
+            for key, value in model.terms.items():
+                angle = -2 * gamma * value / self.std
+                if len(key) == 1:
+                    qc.rz(angle, key[0])
+                else:
+                    qc.rzz(angle, key[0], key[1])
+            for q in range(self.n_qubits):
+                qc.rx(2 * beta, q)
+        qc.measure_all()
+        return qc
+
+    def expectation(self, gammas, betas, model: IsingModel = None) -> float:
+        """
+        Exact E[f] after QAOA with the cost diagonal of model (exact values
+        if None), evolved directly on the simulator
+        """
+        probs = self.simulator.qaoa_probabilities(self.phase(model), gammas, betas)
+        return float(probs @ self.values)
+
+    def angle_optimizer(self, model: IsingModel = None, instance: str = 'qaoa',
+                        cache: AngleCache = None, **kwargs) -> QAOAAngleOptimizer:
+        """
+        Angle tuner for the circuit family of model (exact diagonal if None),
+        with direct-evolution expectations
+        """
+        build_circuit = None if model is None else (lambda gammas, betas: self.circuit(gammas, betas, model))
+        return QAOAAngleOptimizer(build_circuit, self.values, instance=instance, simulator=self.simulator,
+                                  cache=cache, cost_diagonal=self.phase(model), **kwargs)
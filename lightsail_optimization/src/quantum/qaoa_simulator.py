@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Local NumPy Statevector Simulator for the QAOA Design Circuits
+==============================================================
+
+The create_qaoa_circuit methods of the integrated, comm, RF and power
+optimizers build 20-24 qubit circuits from H, RZ, RZZ and RX gates (some
+spell RZZ as CX-RZ-CX). Such circuits fit in a 2^20-2^24 complex statevector
+and can be simulated directly:
+
+- Diagonal runs (consecutive RZ/RZZ gates, and CX-RZ-CX sandwiches fused to
+  RZZ) are collected into one Ising phase vector and applied as a single
+  elementwise multiply. QAOA cost layers differ only by their angle gamma,
+  so the phase vector of a layer is built once and rescaled.
+- Runs of single-qubit gates (H, X, RX, RY: the mixers) are multiplied per
+  qubit and applied as butterfly blocks: the 2x2 matrices of 4 adjacent
+  qubits are combined into one 16x16 Kronecker block and applied with a
+  single matmul on the (2^(n-q-4), 16, 2^q) view of the statevector
+  (a full 20-qubit mixer layer is five matmuls instead of 20 passes).
+- CX is an amplitude swap.
+- Shots are drawn from the final distribution with one multinomial draw.
+
+sim = QAOASimulator(seed=1)
+counts = sim.sample(qc, shots=10000)      # {outcome int: probability}
+probs = sim.probabilities(qc)             # length 2^n_clbits
+probs = sim.qaoa_probabilities(cost_diagonal, gammas, betas)   # no circuit
+
+Qubit q is bit q of the basis index (qiskit ordering); measurements must be
+terminal and are mapped to classical bits as in the circuit.
+"""
+
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from qiskit import QuantumCircuit
+
+DIAGONAL_GATES = ('rz', 'rzz')
+SINGLE_QUBIT_GATES = ('h', 'x', 'rx', 'ry')
+SUPPORTED_GATES = DIAGONAL_GATES + SINGLE_QUBIT_GATES + ('cx', 'measure', 'barrier')
+
+
+class UnsupportedCircuitError(ValueError):
+    """Circuit contains gates or features outside the simulator's gate set"""
+
+
+def _single_qubit_matrix(name: str, theta: float = 0.0) -> np.ndarray:
+    if name == 'h':
+        return np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+    if name == 'x':
+        return np.array([[0, 1], [1, 0]])
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    if name == 'rx':
+        return np.array([[c, -1j * s], [-1j * s, c]])
+    return np.array([[c, -s], [s, c]])  # ry
+
+
+def _phase_factors(angles: np.ndarray, dtype) -> np.ndarray:
+    """exp(i * angles) via cos/sin in the statevector precision"""
+    angles = angles.astype(np.finfo(dtype).dtype, copy=False)
+    factors = np.empty(angles.shape, dtype=dtype)
+    factors.real = np.cos(angles)
+    factors.imag = np.sin(angles)
+    return factors
+
+
+class QAOASimulator:
+    """
+    Statevector simulator specialized to QAOA-style circuits
+
+    seed:        shot-sampling seed
+    dtype:       statevector dtype (np.complex64 halves memory at 24 qubits)
+    max_qubits:  refuse larger circuits instead of exhausting memory
+    """
+
+    block_qubits = 4
+
+    def __init__(self, seed=None, dtype=np.complex128, max_qubits: int = 26):
+        self.rng = np.random.default_rng(seed)
+        self.dtype = dtype
+        self.max_qubits = max_qubits
+        # Normalized Ising terms -> phase vector, reused across QAOA layers
+        self._phase_cache = OrderedDict()
+        self._phase_cache_size = 8
+
+    # ------------------------------------------------------------------
+    # Circuit compilation
+    # ------------------------------------------------------------------
+
+    def _compile(self, circuit: QuantumCircuit) -> Tuple[List[Tuple], Dict[int, int]]:
+        """
+        Circuit -> list of ('phase', terms) / ('block', low qubit, matrix) /
+        ('cx', control, target) ops and the terminal qubit -> clbit map
+        """
+        if circuit.parameters:
+            raise UnsupportedCircuitError(
+                f"Circuit has unbound parameters: {sorted(p.name for p in circuit.parameters)}")
+        if circuit.num_qubits > self.max_qubits:
+            raise UnsupportedCircuitError(
+                f"{circuit.num_qubits} qubits exceed the simulator limit of {self.max_qubits}")
+
+        instructions = []
+        for instruction in circuit.data:
+            name = instruction.operation.name
+            if name not in SUPPORTED_GATES:
+                raise UnsupportedCircuitError(f"Unsupported gate '{name}' (supported: {SUPPORTED_GATES})")
+            qubits = tuple(circuit.find_bit(q).index for q in instruction.qubits)
+            clbits = tuple(circuit.find_bit(c).index for c in instruction.clbits)
+            params = instruction.operation.params
+            instructions.append((name, qubits, clbits, float(params[0]) if params else 0.0))
+
+        n = circuit.num_qubits
+        ops = []
+        terms = {}
+        singles = {}
+        measured = {}
+
+        def flush():
+            if terms:
+                ops.append(('phase', dict(terms)))
+                terms.clear()
+            # Combine the pending single-qubit matrices of each aligned block
+            for low in range(0, n, self.block_qubits):
+                block = range(low, min(low + self.block_qubits, n))
+                if any(q in singles for q in block):
+                    matrix = np.ones((1, 1))
+                    for q in reversed(block):
+                        matrix = np.kron(matrix, singles.get(q, np.eye(2)))
+                    ops.append(('block', low, matrix))
+            singles.clear()
+
+        i = 0
+        while i < len(instructions):
+            name, qubits, clbits, theta = instructions[i]
+            if any(q in measured for q in qubits) and name != 'barrier':
+                raise UnsupportedCircuitError("Only terminal measurements are supported")
+
+            # CX(a, b) RZ(theta, b) CX(a, b) == RZZ(theta, a, b)
+            if name == 'cx' and i + 2 < len(instructions):
+                nxt, after = instructions[i + 1], instructions[i + 2]
+                if (nxt[0] == 'rz' and nxt[1] == (qubits[1],) and
+                        after[0] == 'cx' and after[1] == qubits):
+                    name, qubits, theta = 'rzz', tuple(sorted(qubits)), nxt[3]
+                    i += 2
+
+            if name in DIAGONAL_GATES:
+                if singles:
+                    flush()
+                key = tuple(sorted(qubits))
+                terms[key] = terms.get(key, 0.0) + theta
+            elif name in SINGLE_QUBIT_GATES:
+                if terms:
+                    flush()
+                q = qubits[0]
+                singles[q] = _single_qubit_matrix(name, theta) @ singles.get(q, np.eye(2))
+            elif name == 'cx':
+                flush()
+                ops.append(('cx',) + qubits)
+            elif name == 'measure':
+                measured[qubits[0]] = clbits[0]
+            i += 1
+
+        flush()
+        return ops, measured
+
+    # ------------------------------------------------------------------
+    # Kernels
+    # ------------------------------------------------------------------
+
+    def _phase_vector(self, terms: Dict[Tuple[int, ...], float], n_qubits: int) -> np.ndarray:
+        """
+        Ising phase sum_t theta_t * prod_{q in t} z_q over all basis states
+        (z_q = +1 for bit 0, -1 for bit 1), built by broadcasting on the
+        (2,)*n tensor view; cached up to an overall scale
+        """
+        keys = sorted(terms)
+        scale = next((terms[k] for k in keys if terms[k] != 0.0), 0.0)
+        if scale == 0.0:
+            return None
+        signature = (n_qubits,) + tuple((k, round(terms[k] / scale, 12)) for k in keys)
+
+        base = self._phase_cache.get(signature)
+        if base is None:
+            base = np.zeros((2,) * n_qubits)
+            z = np.array([1.0, -1.0])
+            for key in keys:
+                shape = [1] * n_qubits
+                term = terms[key] / scale
+                for q in key:
+                    shape[n_qubits - 1 - q] = 2
+                if len(key) == 1:
+                    base += (term * z).reshape(shape)
+                else:
+                    base += (term * np.outer(z, z)).reshape(shape)
+            base = base.ravel()
+            self._phase_cache[signature] = base
+            if len(self._phase_cache) > self._phase_cache_size:
+                self._phase_cache.popitem(last=False)
+        else:
+            self._phase_cache.move_to_end(signature)
+        return scale * base
+
+    @staticmethod
+    def _apply_block(state: np.ndarray, matrix: np.ndarray, low: int, n_qubits: int):
+        """Apply a Kronecker block acting on qubits low..low+k-1, in place"""
+        width = matrix.shape[0]
+        if low == 0:
+            view = state.reshape(-1, width)
+            state[:] = (view @ matrix.T).ravel()
+        else:
+            view = state.reshape(-1, width, 2 ** low)
+            state[:] = np.matmul(matrix, view).ravel()
+
+    @staticmethod
+    def _apply_cx(state: np.ndarray, control: int, target: int, n_qubits: int):
+        """Swap the target amplitudes where the control bit is set, in place"""
+        tensor = state.reshape((2,) * n_qubits)
+        zero = [slice(None)] * n_qubits
+        one = [slice(None)] * n_qubits
+        zero[n_qubits - 1 - control] = one[n_qubits - 1 - control] = 1
+        zero[n_qubits - 1 - target], one[n_qubits - 1 - target] = 0, 1
+        zero, one = tuple(zero), tuple(one)
+        swap = tensor[zero].copy()
+        tensor[zero] = tensor[one]
+        tensor[one] = swap
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    def statevector(self, circuit: QuantumCircuit) -> np.ndarray:
+        """Final statevector (measurements ignored), qiskit basis ordering"""
+        return self._run(circuit)[0]
+
+    def _run(self, circuit: QuantumCircuit) -> Tuple[np.ndarray, Dict[int, int]]:
+        ops, measured = self._compile(circuit)
+        n = circuit.num_qubits
+        state = np.zeros(2 ** n, dtype=self.dtype)
+        state[0] = 1.0
+
+        for op in ops:
+            if op[0] == 'phase':
+                phase = self._phase_vector(op[1], n)
+                if phase is not None:
+                    state *= _phase_factors(-0.5 * phase, self.dtype)
+            elif op[0] == 'block':
+                self._apply_block(state, op[2].astype(self.dtype), op[1], n)
+            else:
+                self._apply_cx(state, op[1], op[2], n)
+        return state, measured
+
+    def qaoa_probabilities(self, cost_diagonal: np.ndarray, gammas, betas) -> np.ndarray:
+        """
+        Outcome probabilities of standard QAOA on a precomputed cost diagonal
+
+        |+>^n, then per layer exp(-i gamma C) (one elementwise multiply) and
+        RX(2 beta) on every qubit (Kronecker blocks); no circuit is built.
+        """
+        n = len(cost_diagonal).bit_length() - 1
+        state = np.full(2 ** n, 2 ** (-n / 2), dtype=self.dtype)
+        for gamma, beta in zip(gammas, betas):
+            state *= _phase_factors(-gamma * cost_diagonal, self.dtype)
+            mixer = _single_qubit_matrix('rx', 2 * beta)
+            for low in range(0, n, self.block_qubits):
+                width = min(self.block_qubits, n - low)
+                block = np.ones((1, 1))
+                for _ in range(width):
+                    block = np.kron(block, mixer)
+                self._apply_block(state, block.astype(self.dtype), low, n)
+        probs = np.abs(state) ** 2
+        return probs / probs.sum()
+
+    def probabilities(self, circuit: QuantumCircuit) -> np.ndarray:
+        """
+        Outcome probabilities indexed by the classical register value
+        (by basis state if the circuit has no measurements)
+        """
+        state, measured = self._run(circuit)
+        probs = np.abs(state) ** 2
+        probs /= probs.sum()
+
+        n = circuit.num_qubits
+        if not measured or (circuit.num_clbits == n and
+                            all(measured.get(q) == q for q in range(n))):
+            return probs
+
+        basis = np.arange(2 ** n)
+        outcome = np.zeros(2 ** n, dtype=np.int64)
+        for qubit, clbit in measured.items():
+            outcome |= ((basis >> qubit) & 1) << clbit
+        return np.bincount(outcome, weights=probs, minlength=2 ** circuit.num_clbits)
+
+    def sample(self, circuit: QuantumCircuit, shots: int = 10000) -> Dict[int, float]:
+        """Sampled outcome distribution {classical register value: probability}"""
+        probs = self.probabilities(circuit)
+        counts = self.rng.multinomial(shots, probs / probs.sum())
+        outcomes = np.flatnonzero(counts)
+        return {int(k): counts[k] / shots for k in outcomes}
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Lazy Quantum Backend Provider
+=============================
+
+Shared connection handling for the IBM Quantum optimizers. Creating an
+optimizer no longer talks to IBM Quantum: the runtime service is opened on
+the first quantum use, the outcome (backend or failure) is cached for the
+lifetime of the provider, and classical-only runs never touch the network.
+
+Backend selection (constructor argument, else $WARPEED_QUANTUM_BACKEND):
+- 'ibm_torino' (default) or any other IBM backend name: QiskitRuntimeService
+- 'local':   local stand-in (same sampling interface, no account or
+             network needed): the NumPy QAOA simulator of qaoa_simulator.py,
+             qiskit's StatevectorSampler for gates outside its gate set
+- 'offline': no quantum backend; callers take their classical fallback
+
+provider = QuantumBackendProvider()
+if provider.available:                      # connects on first access
+    circuit = provider.transpile(qc)        # ISA circuit for IBM, unchanged locally
+    counts = provider.sample(circuit, shots=10000)   # {outcome int: probability}
+"""
+
+import os
+import threading
+from typing import Dict
+
+from qiskit import QuantumCircuit, transpile as qiskit_transpile
+
+from qaoa_simulator import QAOASimulator, UnsupportedCircuitError
+
+BACKEND_ENV_VAR = 'WARPEED_QUANTUM_BACKEND'
+DEFAULT_BACKEND = 'ibm_torino'
+LOCAL_BACKEND = 'local'
+OFFLINE_BACKEND = 'offline'
+
+
+class QuantumBackendProvider:
+    """
+    Lazily connected quantum backend with a local simulator stand-in
+
+    backend_name: IBM backend name, 'local' or 'offline'
+                  (None: $WARPEED_QUANTUM_BACKEND, default 'ibm_torino')
+    channel:      QiskitRuntimeService channel (None: saved account default)
+    seed:         sampling seed of the local stand-in
+    """
+
+    def __init__(self, backend_name: str = None, channel: str = None, seed: int = None):
+        self.backend_name = backend_name or os.environ.get(BACKEND_ENV_VAR) or DEFAULT_BACKEND
+        self.channel = channel
+        self.seed = seed
+
+        self.service = None
+        self.backend = None
+        self.simulator = None
+        self.error = None
+        self._connected = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """Pickle the configuration only; the copy reconnects lazily"""
+        return {'backend_name': self.backend_name, 'channel': self.channel, 'seed': self.seed}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def is_local(self) -> bool:
+        return self.backend_name == LOCAL_BACKEND
+
+    @property
+    def is_offline(self) -> bool:
+        return self.backend_name == OFFLINE_BACKEND
+
+    @property
+    def connected(self) -> bool:
+        """True once a connection attempt has succeeded (never connects)"""
+        return bool(self._connected)
+
+    @property
+    def available(self) -> bool:
+        """Quantum backend usable; connects on first access"""
+        return self.connect()
+
+    @property
+    def label(self) -> str:
+        """Human-readable backend description for reports"""
+        if self.is_offline:
+            return 'Classical simulation'
+        if self.is_local:
+            return 'Local statevector simulator'
+        name = self.backend_name.replace('ibm_', '').title()
+        if self.backend is not None:
+            return f"IBM {name} ({self.backend.num_qubits} qubits)"
+        return f"IBM {name}"
+
+    def connect(self) -> bool:
+        """Open the backend once (thread-safe); the result is cached"""
+        with self._lock:
+            if self._connected is not None:
+                return self._connected
+            if self.is_offline:
+                self._connected = False
+            elif self.is_local:
+                self.simulator = QAOASimulator(seed=self.seed)
+                self._connected = True
+                print("✓ Using local statevector simulator (quantum stand-in)")
+            else:
+                try:
+                    from qiskit_ibm_runtime import QiskitRuntimeService
+                    if self.channel is None:
+                        self.service = QiskitRuntimeService()
+                    else:
+                        self.service = QiskitRuntimeService(channel=self.channel)
+                    self.backend = self.service.backend(self.backend_name)
+                    self._connected = True
+                    print(f"✓ Connected to {self.label}")
+                except Exception as e:
+                    self.error = e
+                    self.service = self.backend = None
+                    self._connected = False
+                    print(f"⚠ Quantum backend unavailable: {e}")
+            return self._connected
+
+    def transpile(self, circuit: QuantumCircuit, optimization_level: int = 3) -> QuantumCircuit:
+        """Circuit in the backend's instruction set (unchanged for the local stand-in)"""
+        if not self.available:
+            raise RuntimeError(f"Quantum backend '{self.backend_name}' unavailable: {self.error}")
+        if self.is_local:
+            return circuit
+        return qiskit_transpile(circuit, backend=self.backend, optimization_level=optimization_level)
+
+    def sample(self, circuit: QuantumCircuit, shots: int = 10000) -> Dict[int, float]:
+        """
+        Run a measured circuit and return its outcome distribution
+
+        Keys are the measured classical bits as integers, values the
+        observed probabilities (the format of the V1 quasi_dists[0]).
+        """
+        if not self.available:
+            raise RuntimeError(f"Quantum backend '{self.backend_name}' unavailable: {self.error}")
+
+        if self.is_local:
+            try:
+                return self.simulator.sample(circuit, shots=shots)
+            except UnsupportedCircuitError:
+                from qiskit.primitives import StatevectorSampler
+                job = StatevectorSampler(seed=self.seed).run([circuit], shots=shots)
+        else:
+            from qiskit_ibm_runtime import SamplerV2
+            job = SamplerV2(mode=self.backend).run([circuit], shots=shots)
+            print(f"   Job ID: {job.job_id()}")
+
+        counts = job.result()[0].join_data().get_int_counts()
+        total = sum(counts.values())
+        return {outcome: count / total for outcome, count in counts.items()}
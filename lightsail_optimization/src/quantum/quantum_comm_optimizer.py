@@ -13,6 +13,10 @@ import os
 from datetime import datetime
 from typing import Dict, List, Tuple
 import itertools
+import heapq
+
+from pareto import pareto_front_mask
+from topk import TopK
 
 class QuantumCommOptimizer:
     """
@@ -20,6 +24,17 @@ class QuantumCommOptimizer:
     Uses QAOA to explore massive configuration space simultaneously.
     """
 
+    # Configuration parameters, in the column order of index arrays
+    CONFIG_KEYS = ('tx_power', 'tx_diameter', 'rx_diameter', 'wavelength',
+                   'rx_location', 'modulation', 'fec_overhead', 'detector_eff')
+
+    # Branch-and-bound roles (exhaustive_search): the score is monotone in
+    # the numeric parameters (SNR rises with each, transmitter mass with
+    # tx_power/tx_diameter, receiver cost with rx_diameter); categorical
+    # parameters are branched on first; fec_overhead does not affect it
+    MONOTONE_KEYS = ('tx_power', 'tx_diameter', 'rx_diameter', 'detector_eff')
+    CATEGORICAL_KEYS = ('wavelength', 'rx_location', 'modulation')
+
     def __init__(self):
         # Physical constants
         self.c = 299792458  # Speed of light (m/s)
@@ -253,84 +268,324 @@ class QuantumCommOptimizer:
 
         return score, results
 
-    def classical_grid_search(self, num_samples: int = 10000) -> List[Dict]:
+    def config_columns(self, indices: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        Classical grid search for comparison and to generate initial solutions.
-        Samples the configuration space intelligently.
+        Configuration columns of an (N, 8) array of indices into
+        param_ranges (columns in CONFIG_KEYS order)
         """
-        print("Running classical grid search to explore configuration space...")
+        return {key: np.asarray(self.param_ranges[key])[indices[:, j]]
+                for j, key in enumerate(self.CONFIG_KEYS)}
+
+    def config_from_indices(self, row: np.ndarray) -> Dict:
+        """Configuration dict of one row of parameter indices"""
+        return {key: self.param_ranges[key][int(i)] for key, i in zip(self.CONFIG_KEYS, row)}
+
+    def calculate_link_budget_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """calculate_link_budget for configuration columns (same keys, arrays)"""
+        tx_power = columns['tx_power']
+        wavelength = columns['wavelength']
+        modulation = columns['modulation']
+
+        tx_gain_db = 10 * np.log10((4 * np.pi * (np.pi * (columns['tx_diameter']/2)**2)) / (wavelength**2))
+        path_loss_db = 10 * np.log10((wavelength / (4 * np.pi * self.distance))**2)
+        rx_gain_db = 10 * np.log10((4 * np.pi * (np.pi * (columns['rx_diameter']/2)**2)) / (wavelength**2))
+        atm_loss_db = np.where(columns['rx_location'] == 'ground',
+                               np.where(wavelength < 3000e-9, -5.0, -15.0), 0.0)
+        pointing_loss_db = -1.0
+        detector_loss_db = 10 * np.log10(columns['detector_eff'])
+
+        rx_power_dbw = (10 * np.log10(tx_power) + tx_gain_db + path_loss_db +
+                        rx_gain_db + atm_loss_db + pointing_loss_db +
+                        detector_loss_db)
+        rx_power_watts = 10**(rx_power_dbw/10)
+        photon_energy = self.h * self.c / wavelength
+        photon_rate = rx_power_watts / photon_energy
 
-        # Generate smart samples (focusing on promising regions)
-        all_configs = []
-
-        # Strategy 1: High power, large apertures
-        for _ in range(num_samples // 4):
-            config = {
-                'tx_power': np.random.choice(self.param_ranges['tx_power'][-3:]),  # High power
-                'tx_diameter': np.random.choice(self.param_ranges['tx_diameter'][-3:]),  # Large
-                'rx_diameter': np.random.choice(self.param_ranges['rx_diameter'][-3:]),  # Large
-                'wavelength': np.random.choice(self.param_ranges['wavelength'][:3]),  # Optical
-                'rx_location': np.random.choice(self.param_ranges['rx_location']),
-                'modulation': np.random.choice(self.param_ranges['modulation']),
-                'fec_overhead': np.random.choice(self.param_ranges['fec_overhead']),
-                'detector_eff': np.random.choice(self.param_ranges['detector_eff'][-2:])  # High eff
-            }
-            all_configs.append(config)
+        # Modulation: (data rate, bandwidth expansion)
+        data_rate = np.select([modulation == 'OOK', modulation == 'PPM-16', modulation == 'PPM-256'],
+                              [1e6, 1e6 / 4, 1e6 / 8], np.nan)
+        bandwidth = data_rate * np.select([modulation == 'PPM-16', modulation == 'PPM-256'], [16, 256], 1)
+
+        noise_power_dbw = 10 * np.log10(self.k * self.T_noise * bandwidth)
+        total_noise_dbw = np.maximum(noise_power_dbw,
+                                     10 * np.log10(np.sqrt(photon_rate * 1.0) * photon_energy))
+        snr_db = rx_power_dbw - total_noise_dbw
+
+        return {
+            'tx_gain_db': tx_gain_db,
+            'path_loss_db': np.broadcast_to(path_loss_db, tx_gain_db.shape),
+            'rx_gain_db': rx_gain_db,
+            'atm_loss_db': atm_loss_db,
+            'rx_power_dbw': rx_power_dbw,
+            'rx_power_watts': rx_power_watts,
+            'photon_rate': photon_rate,
+            'noise_power_dbw': total_noise_dbw,
+            'snr_db': snr_db,
+            'link_margin_db': snr_db - self.min_snr,
+            'data_rate_bps': data_rate * (1 - columns['fec_overhead']),
+            'bandwidth_hz': bandwidth
+        }
+
+    def calculate_mass_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """calculate_mass for configuration columns"""
+        tx_power = columns['tx_power']
+        wavelength = columns['wavelength']
+        laser_mass = np.select([wavelength == 1064e-9, wavelength == 1550e-9, wavelength == 2000e-9],
+                               [0.05 + tx_power * 0.08, 0.03 + tx_power * 0.05, 0.04 + tx_power * 0.06],
+                               0.10 + tx_power * 0.15)
+        optics_mass = 0.02 + (columns['tx_diameter']**2) * 0.10
+        pointing_mass = 0.05
+        return laser_mass + optics_mass + pointing_mass
+
+    def calculate_receiver_cost_batch(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """calculate_receiver_cost for configuration columns"""
+        scale = (columns['rx_diameter'] / 50.0)**2.5
+        return np.where(columns['rx_location'] == 'ground', 1e9 * scale, 5e9 * scale * 1.5)
+
+    def evaluate_configurations_batch(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        evaluate_configuration for configuration columns: score, viable,
+        mass_grams, cost_usd, power_watts arrays and the link_budget columns
+        """
+        link = self.calculate_link_budget_batch(columns)
+        snr_db = link['snr_db']
+        mass = self.calculate_mass_batch(columns)
+        cost = self.calculate_receiver_cost_batch(columns)
+        power = columns['tx_power']
+
+        return {
+            'link_budget': link,
+            'mass_grams': mass,
+            'cost_usd': cost,
+            'power_watts': power,
+            'score': self.score_batch(snr_db, mass, power, cost),
+            'viable': ((snr_db >= self.min_snr) & (mass <= self.max_tx_mass) &
+                       (power <= self.max_power) & (cost <= self.max_rx_cost))
+        }
+
+    def score_batch(self, snr_db: np.ndarray, mass: np.ndarray, power: np.ndarray,
+                    cost: np.ndarray) -> np.ndarray:
+        """
+        Score of evaluate_configuration from its inputs (nondecreasing in
+        snr_db, nonincreasing in mass, power and cost)
+        """
+        return (snr_db
+                - np.where(mass > self.max_tx_mass, 100 * (mass - self.max_tx_mass), 0.0)
+                - np.where(power > self.max_power, 100 * (power - self.max_power), 0.0)
+                - np.where(cost > self.max_rx_cost, 50 * (cost - self.max_rx_cost) / 1e9, 0.0)
+                + np.where(snr_db - self.min_snr >= self.target_margin, 10, 0)
+                + np.where(mass < self.max_tx_mass * 0.8, 5, 0))
+
+    def materialize_results(self, indices: np.ndarray) -> List[Dict]:
+        """Result dicts (as from evaluate_configuration) of rows of parameter indices"""
+        evaluation = self.evaluate_configurations_batch(self.config_columns(indices))
+        link = evaluation['link_budget']
+        return [{
+            'config': self.config_from_indices(row),
+            'link_budget': {key: float(column[i]) for key, column in link.items()},
+            'mass_grams': float(evaluation['mass_grams'][i]),
+            'cost_usd': float(evaluation['cost_usd'][i]),
+            'power_watts': float(evaluation['power_watts'][i]),
+            'score': float(evaluation['score'][i]),
+            'viable': bool(evaluation['viable'][i])
+        } for i, row in enumerate(indices)]
+
+    def sample_indices(self, num_samples: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Parameter indices of the four grid-search sampling strategies
+        (num_samples // 4 rows each)
+        """
+        chunks = list(self.iter_sample_indices(num_samples, rng, max(num_samples, 1)))
+        return np.concatenate(chunks) if chunks else np.empty((0, len(self.CONFIG_KEYS)), dtype=np.int16)
+
+    def iter_sample_indices(self, num_samples: int, rng: np.random.Generator, chunk_size: int):
+        """
+        sample_indices(num_samples, rng) in consecutive chunks of at most
+        chunk_size rows; the samples do not depend on chunk_size
+        """
+        sizes = np.array([len(self.param_ranges[key]) for key in self.CONFIG_KEYS])
+        column = {key: j for j, key in enumerate(self.CONFIG_KEYS)}
+
+        def restrict(low, high, key, first=None, last=None):
+            n = sizes[column[key]]
+            if last is not None:
+                low[column[key]] = max(n - last, 0)
+            if first is not None:
+                high[column[key]] = min(first, n)
+
+        def fix(low, high, key, value):
+            low[column[key]] = self.param_ranges[key].index(value)
+            high[column[key]] = low[column[key]] + 1
+
+        strategies = []
+        # Strategy 1: High power, large apertures, optical, high efficiency
+        low, high = np.zeros_like(sizes), sizes.copy()
+        for key in ('tx_power', 'tx_diameter', 'rx_diameter'):
+            restrict(low, high, key, last=3)
+        restrict(low, high, 'wavelength', first=3)
+        restrict(low, high, 'detector_eff', last=2)
+        strategies.append((low, high))
 
         # Strategy 2: Optimal wavelength (1550nm), vary other params
-        for _ in range(num_samples // 4):
-            config = {
-                'tx_power': np.random.choice(self.param_ranges['tx_power']),
-                'tx_diameter': np.random.choice(self.param_ranges['tx_diameter']),
-                'rx_diameter': np.random.choice(self.param_ranges['rx_diameter']),
-                'wavelength': 1550e-9,  # Fix at 1550nm
-                'rx_location': np.random.choice(self.param_ranges['rx_location']),
-                'modulation': np.random.choice(self.param_ranges['modulation']),
-                'fec_overhead': np.random.choice(self.param_ranges['fec_overhead']),
-                'detector_eff': np.random.choice(self.param_ranges['detector_eff'])
-            }
-            all_configs.append(config)
+        low, high = np.zeros_like(sizes), sizes.copy()
+        fix(low, high, 'wavelength', 1550e-9)
+        strategies.append((low, high))
 
         # Strategy 3: Space-based receivers (no atmospheric loss)
-        for _ in range(num_samples // 4):
-            config = {
-                'tx_power': np.random.choice(self.param_ranges['tx_power']),
-                'tx_diameter': np.random.choice(self.param_ranges['tx_diameter']),
-                'rx_diameter': np.random.choice(self.param_ranges['rx_diameter']),
-                'wavelength': np.random.choice(self.param_ranges['wavelength']),
-                'rx_location': 'space',  # Fix at space
-                'modulation': np.random.choice(self.param_ranges['modulation']),
-                'fec_overhead': np.random.choice(self.param_ranges['fec_overhead']),
-                'detector_eff': np.random.choice(self.param_ranges['detector_eff'])
-            }
-            all_configs.append(config)
+        low, high = np.zeros_like(sizes), sizes.copy()
+        fix(low, high, 'rx_location', 'space')
+        strategies.append((low, high))
 
         # Strategy 4: Random exploration
-        for _ in range(num_samples // 4):
-            config = {
-                'tx_power': np.random.choice(self.param_ranges['tx_power']),
-                'tx_diameter': np.random.choice(self.param_ranges['tx_diameter']),
-                'rx_diameter': np.random.choice(self.param_ranges['rx_diameter']),
-                'wavelength': np.random.choice(self.param_ranges['wavelength']),
-                'rx_location': np.random.choice(self.param_ranges['rx_location']),
-                'modulation': np.random.choice(self.param_ranges['modulation']),
-                'fec_overhead': np.random.choice(self.param_ranges['fec_overhead']),
-                'detector_eff': np.random.choice(self.param_ranges['detector_eff'])
-            }
-            all_configs.append(config)
+        strategies.append((np.zeros_like(sizes), sizes.copy()))
+
+        # int32 draws consume the generator row by row (int16 draws are buffered),
+        # so splitting a strategy's draw across chunks leaves the samples unchanged
+        pieces, n_pieces = [], 0
+        for low, high in strategies:
+            remaining = num_samples // 4
+            while remaining > 0:
+                n = min(remaining, chunk_size - n_pieces)
+                pieces.append(rng.integers(low, high, size=(n, len(sizes)), dtype=np.int32).astype(np.int16))
+                n_pieces += n
+                remaining -= n
+                if n_pieces == chunk_size:
+                    yield np.concatenate(pieces)
+                    pieces, n_pieces = [], 0
+        if pieces:
+            yield np.concatenate(pieces)
+
+    def classical_grid_search(self, num_samples: int = 10000, top_n: int = None,
+                              seed=None, chunk_size: int = 262144) -> List[Dict]:
+        """
+        Classical grid search for comparison and to generate initial solutions.
+        Samples the configuration space intelligently.
 
-        # Evaluate all configurations
-        results = []
-        for i, config in enumerate(all_configs):
-            if (i + 1) % 1000 == 0:
-                print(f"  Evaluated {i+1}/{len(all_configs)} configurations...")
-            score, result = self.evaluate_configuration(config)
-            results.append(result)
+        Samples are drawn and evaluated chunk by chunk; with top_n only a
+        running top-n of the chunks' samples is kept (see topk.py, memory
+        O(top_n + chunk_size)) and materialized as dicts, otherwise all
+        results are.
+        seed: int or SeedSequence for the sampling (None: fresh entropy)
+        """
+        print("Running classical grid search to explore configuration space...")
 
-        # Sort by score (descending)
-        results.sort(key=lambda x: x['score'], reverse=True)
+        # Smart samples (focusing on promising regions), evaluated as they are drawn
+        sizes = [len(self.param_ranges[key]) for key in self.CONFIG_KEYS]
+        top = TopK(top_n) if top_n is not None else None
+        kept_indices, kept_scores = [], []
+        n_evaluated = n_viable = 0
+        for indices in self.iter_sample_indices(num_samples, np.random.default_rng(seed), chunk_size):
+            evaluation = self.evaluate_configurations_batch(self.config_columns(indices))
+            if top is None:
+                kept_indices.append(indices)
+                kept_scores.append(evaluation['score'])
+            else:
+                # Kept as grid ranks (scalars), so no chunk outlives its evaluation
+                top.add_batch(evaluation['score'], items=np.ravel_multi_index(indices.T, sizes))
+            n_evaluated += len(indices)
+            n_viable += int(evaluation['viable'].sum())
+            print(f"  Evaluated {n_evaluated}/{4 * (num_samples // 4)} configurations...")
+        print(f"  {n_viable} viable configurations")
+
+        # Best first (ties: earlier sample)
+        if top is not None:
+            ranks = np.array(top.items, dtype=np.int64)
+            return self.materialize_results(np.stack(np.unravel_index(ranks, sizes), axis=1))
+        if not kept_indices:
+            return []
+        indices, scores = np.concatenate(kept_indices), np.concatenate(kept_scores)
+        return self.materialize_results(indices[np.argsort(-scores, kind='stable')])
+
+    def _box_indices(self, box: List[np.ndarray]) -> np.ndarray:
+        """All parameter-index rows of a box (per-key candidate indices), in enumeration order"""
+        return np.stack([grid.ravel() for grid in np.meshgrid(*box, indexing='ij')], axis=1)
+
+    def _box_upper_bound(self, box: List[np.ndarray]) -> float:
+        """
+        Upper bound of the score over a box with fixed categorical parameters:
+        SNR at the high corner, mass, power and cost at the low corner
+        """
+        high = np.array([[candidates[-1] for candidates in box]])
+        low = np.array([[candidates[0] for candidates in box]])
+        snr_db = self.calculate_link_budget_batch(self.config_columns(high))['snr_db']
+        low_columns = self.config_columns(low)
+        return float(self.score_batch(snr_db, self.calculate_mass_batch(low_columns), low_columns['tx_power'],
+                                      self.calculate_receiver_cost_batch(low_columns))[0])
+
+    def exhaustive_search(self, top_k: int = 50, leaf_size: int = 4096) -> Dict:
+        """
+        Exact top-k over the full factorial of param_ranges (branch and bound)
+
+        Configurations are enumerated in a fixed order (CONFIG_KEYS, each
+        range in its listed order; ties go to the earlier configuration).
+        Boxes of configurations are explored best-first by an upper bound on
+        their score (see MONOTONE_KEYS) and split along their widest
+        monotone parameter; boxes of at most leaf_size configurations are
+        evaluated column-wise. A box is discarded once its bound falls below
+        the current k-th best score, so the result equals brute force.
+        """
+        sizes = [len(self.param_ranges[key]) for key in self.CONFIG_KEYS]
+        n_total = int(np.prod(sizes))
+        monotone = [self.CONFIG_KEYS.index(key) for key in self.MONOTONE_KEYS]
+
+        print(f"Exhaustive search over {n_total:,} configurations (top {top_k}, branch and bound)...")
+
+        # Root boxes: one per categorical combination, monotone ranges sorted by value
+        base = [np.argsort(self.param_ranges[key], kind='stable') if key in self.MONOTONE_KEYS
+                else np.arange(len(self.param_ranges[key])) for key in self.CONFIG_KEYS]
+        categorical = [self.CONFIG_KEYS.index(key) for key in self.CATEGORICAL_KEYS]
+        heap = []
+        for choice in itertools.product(*(base[j] for j in categorical)):
+            box = list(base)
+            for j, value in zip(categorical, choice):
+                box[j] = np.array([value])
+            heapq.heappush(heap, (-self._box_upper_bound(box), len(heap), box))
+
+        top = TopK(top_k)
+        n_evaluated = 0
+        n_boxes = 0
+        counter = len(heap)
+
+        while heap:
+            bound = -heap[0][0]
+            if bound < top.threshold:
+                break
+            _, _, box = heapq.heappop(heap)
+            n_boxes += 1
+
+            size = int(np.prod([len(candidates) for candidates in box]))
+            widest = max(monotone, key=lambda j: len(box[j]))
+            if size > leaf_size and len(box[widest]) > 1:
+                half = len(box[widest]) // 2
+                for part in (box[widest][:half], box[widest][half:]):
+                    child = list(box)
+                    child[widest] = part
+                    heapq.heappush(heap, (-self._box_upper_bound(child), counter, child))
+                    counter += 1
+                continue
+
+            # Leaf: evaluate every configuration of the box
+            indices = self._box_indices(box)
+            scores = self.evaluate_configurations_batch(self.config_columns(indices))['score']
+            n_evaluated += len(indices)
+
+            # Boxes are not visited in enumeration order: ties go by rank
+            top.add_batch(scores, positions=np.ravel_multi_index(indices.T, sizes))
+
+        top_rank = np.array(top.items, dtype=np.int64)
+        results = self.materialize_results(np.stack(np.unravel_index(top_rank, sizes), axis=1))
+
+        print(f"✓ Evaluated {n_evaluated:,} of {n_total:,} configurations "
+              f"({n_boxes} boxes, {1 - n_evaluated / n_total:.1%} pruned)")
+        if results:
+            print(f"  Optimum: score {results[0]['score']:.2f}, SNR {results[0]['link_budget']['snr_db']:.1f} dB")
 
-        return results
+        return {
+            'n_configurations': n_total,
+            'n_evaluated': n_evaluated,
+            'n_boxes': n_boxes,
+            'top_results': results
+        }
 
     def create_qaoa_circuit(self, num_qubits: int = 20, depth: int = 3) -> QuantumCircuit:
         """
@@ -411,10 +666,11 @@ class QuantumCommOptimizer:
 
         return config
 
-    def run_quantum_optimization(self, use_real_backend: bool = False) -> List[Dict]:
+    def run_quantum_optimization(self, use_real_backend: bool = False, exact: bool = False) -> List[Dict]:
         """
         Run quantum optimization using IBM Torino.
-        If use_real_backend=False, uses classical simulation (for testing).
+        If use_real_backend=False, uses classical simulation (for testing):
+        the sampled grid search, or the exact top 1000 if exact=True.
         """
         print("Initializing quantum optimization...")
 
@@ -465,6 +721,8 @@ class QuantumCommOptimizer:
                 use_real_backend = False
 
         if not use_real_backend:
+            if exact:
+                return self.exhaustive_search(top_k=1000)['top_results']
             print("Running classical grid search optimization (10,000 samples)...")
             return self.classical_grid_search(num_samples=10000)
 
@@ -503,6 +761,15 @@ class QuantumCommOptimizer:
         total_viable = len(viable_results)
         avg_snr_viable = np.mean([r['link_budget']['snr_db'] for r in viable_results]) if viable_results else 0
 
+        # Pareto set: SNR vs transmitter mass vs receiver cost
+        # (among viable solutions, or all of them if none is viable)
+        pareto_pool = viable_results if viable_results else results
+        pareto_results = []
+        if pareto_pool:
+            objectives = np.array([[r['link_budget']['snr_db'], -r['mass_grams'], -r['cost_usd']]
+                                   for r in pareto_pool])
+            pareto_results = [r for r, k in zip(pareto_pool, pareto_front_mask(objectives)) if k]
+
         # Trade-off analysis
         tradeoff_analysis = {
             'best_snr': max(results, key=lambda x: x['link_budget']['snr_db']),
@@ -577,10 +844,13 @@ class QuantumCommOptimizer:
             'statistics': {
                 'viable_solutions': total_viable,
                 'average_snr_viable_db': float(avg_snr_viable),
-                'success_rate': float(total_viable / len(results)) if results else 0
+                'success_rate': float(total_viable / len(results)) if results else 0,
+                'pareto_solutions': len(pareto_results),
+                'pareto_scope': 'viable' if viable_results else 'all'
             },
             'top_50_solutions': [format_result(r) for r in top_results],
             'best_viable_solution': format_result(best_viable) if best_viable else None,
+            'pareto_frontier': [format_result(r) for r in pareto_results],
             'tradeoff_analysis': {
                 'best_snr': format_result(tradeoff_analysis['best_snr']),
                 'lowest_mass': format_result(tradeoff_analysis['lowest_mass']) if tradeoff_analysis['lowest_mass'] else None,
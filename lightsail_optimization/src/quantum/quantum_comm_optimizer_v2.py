@@ -4,6 +4,7 @@ Relaxes extreme constraints to find viable solutions for Warpeed mission
 """
 
 from quantum_comm_optimizer import QuantumCommOptimizer
+import numpy as np
 import json
 
 class QuantumCommOptimizerV2(QuantumCommOptimizer):
@@ -79,6 +80,31 @@ class QuantumCommOptimizerV2(QuantumCommOptimizer):
 
         return cost
 
+    def calculate_mass_batch(self, columns):
+        """
+        Vectorized calculate_mass (configuration columns).
+        """
+        tx_power = columns['tx_power']
+        tx_diameter = columns['tx_diameter']
+        wavelength = columns['wavelength']
+
+        laser_mass = np.select([wavelength == 1064e-9, wavelength == 1550e-9],
+                               [0.1 + tx_power * 0.05, 0.08 + tx_power * 0.03],
+                               0.09 + tx_power * 0.04)
+        optics_mass = 0.05 + (tx_diameter**2) * 0.05
+        pointing_mass = 0.10 + tx_diameter * 0.05
+
+        return laser_mass + optics_mass + pointing_mass
+
+    def calculate_receiver_cost_batch(self, columns):
+        """
+        Vectorized calculate_receiver_cost (configuration columns).
+        """
+        rx_diameter = columns['rx_diameter']
+        base_cost = np.select([rx_diameter <= 100, rx_diameter <= 1000], [10e9, 50e9], 100e9)
+
+        return base_cost * (rx_diameter / 100.0)**2.0
+
 
 def main():
     print("="*80)
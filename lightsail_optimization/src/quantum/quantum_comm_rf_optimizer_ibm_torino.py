@@ -23,15 +23,17 @@ Date: October 15, 2025
 Backend: IBM Torino (20 qubits real hardware)
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.circuit import Parameter
-from qiskit_ibm_runtime import QiskitRuntimeService, Session, Sampler, Options
 import numpy as np
 import json
 import os
 from datetime import datetime
 from typing import Dict, List, Tuple
 import warnings
+
+from quantum_backend import QuantumBackendProvider
+
 warnings.filterwarnings('ignore')
 
 
@@ -41,7 +43,11 @@ class QuantumRFCommOptimizer:
     Uses QAOA on IBM Torino to explore massive RF configuration space.
     """
 
-    def __init__(self):
+    def __init__(self, backend_provider: QuantumBackendProvider = None):
+        # IBM Quantum backend, connected on first hardware run
+        # (default: IBM Torino, or $WARPEED_QUANTUM_BACKEND)
+        self.backend_provider = backend_provider or QuantumBackendProvider()
+
         # Physical constants
         self.c = 299792458  # Speed of light (m/s)
         self.k = 1.380649e-23  # Boltzmann constant (J/K)
@@ -366,14 +372,14 @@ class QuantumRFCommOptimizer:
 
         if use_real_backend:
             try:
-                # Initialize IBM Quantum
-                service = QiskitRuntimeService()
-
-                # Get IBM Torino backend
-                backend = service.backend("ibm_torino")
-                print(f"✓ Connected to {backend.name}")
-                print(f"  Qubits: {backend.num_qubits}")
-                print(f"  Quantum Volume: {backend.quantum_volume if hasattr(backend, 'quantum_volume') else 'N/A'}")
+                # Connect to IBM Torino (lazily, once per optimizer)
+                provider = self.backend_provider
+                if not provider.available:
+                    raise RuntimeError(provider.error)
+                backend = provider.backend
+                if backend is not None:
+                    print(f"  Qubits: {backend.num_qubits}")
+                    print(f"  Quantum Volume: {backend.quantum_volume if hasattr(backend, 'quantum_volume') else 'N/A'}")
 
                 # Create QAOA circuit
                 num_qubits = 20
@@ -392,7 +398,7 @@ class QuantumRFCommOptimizer:
 
                 # Transpile for IBM Torino
                 print("\nTranspiling circuit for IBM Torino...")
-                qc_transpiled = transpile(qc_bound, backend=backend, optimization_level=3)
+                qc_transpiled = provider.transpile(qc_bound, optimization_level=3)
                 print(f"  Circuit depth: {qc_transpiled.depth()}")
                 print(f"  Circuit gates: {qc_transpiled.size()}")
 
@@ -401,14 +407,7 @@ class QuantumRFCommOptimizer:
                 print("   Shots: 10,000")
                 print("   This may take 5-10 minutes...")
 
-                with Session(backend=backend) as session:
-                    sampler = Sampler(session=session)
-
-                    job = sampler.run(qc_transpiled, shots=10000)
-                    print(f"   Job ID: {job.job_id()}")
-
-                    result = job.result()
-                    counts = result.quasi_dists[0]
+                counts = provider.sample(qc_transpiled, shots=10000)
 
                 print(f"\n✓ Quantum execution complete!")
                 print(f"  Unique configurations sampled: {len(counts)}")
@@ -10,9 +10,14 @@ from qiskit import QuantumCircuit, transpile
 from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler
 from qiskit.circuit import Parameter
 import json
+import hashlib
 from datetime import datetime
 import os
 
+from qaoa_angles import AngleCache, QAOAAngleOptimizer
+from qaoa_cost import DiagonalCost
+from qaoa_simulator import QAOASimulator
+
 class HybridCommOptimizer:
     """
     Quantum optimizer for hybrid optical-RF communication systems.
@@ -23,7 +28,10 @@ class HybridCommOptimizer:
     - Shared resources: 4 qubits (power allocation, switching logic)
     """
 
-    def __init__(self):
+    def __init__(self, angle_cache_path=None):
+        """
+        angle_cache_path: optional JSON file persisting tuned QAOA angles
+        """
         # RF Channel Parameters
         self.rf_frequencies = ['S-band', 'X-band', 'Ka-band', 'Ku-band']  # 2 qubits = 4 options
         self.rf_power_levels = np.linspace(0.5, 2.0, 8)  # 3 qubits = 8 levels
@@ -56,6 +64,53 @@ class HybridCommOptimizer:
         self.distance_au = 10  # AU - outer solar system mission (Jupiter-like distance)
         self.distance_km = self.distance_au * 1.496e8  # km
 
+        self.angle_cache = AngleCache(angle_cache_path) if angle_cache_path else None
+
+    def cost_terms(self):
+        """
+        Cost layer of create_qaoa_circuit in gate order: (qubits, weight)
+        pairs, applied as RZ/RZZ(2 * gamma * weight)
+        """
+        terms = []
+
+        # RF subsystem interactions (qubits 0-7)
+        for i in range(7):
+            terms.append(((i,), (i + 1) * 0.1))
+            if i < 6:
+                terms.append(((i, i + 1), 0.05))
+
+        # Optical subsystem interactions (qubits 8-15)
+        for i in range(8, 15):
+            terms.append(((i,), (i - 7) * 0.1))
+            if i < 14:
+                terms.append(((i, i + 1), 0.05))
+
+        # Shared resources (qubits 16-19)
+        for i in range(16, 19):
+            terms.append(((i,), 0.15))
+
+        # Cross-subsystem entanglement (RF-Optical-Shared)
+        terms.append(((3, 11), 0.08))  # Power coupling
+        terms.append(((16, 3), 0.08))  # RF to power allocation
+        terms.append(((16, 11), 0.08))  # Optical to power allocation
+        terms.append(((17, 18), 0.08))  # Switching logic coupling
+
+        return terms
+
+    def cost_diagonal(self):
+        """
+        Diagonal C = sum_t weight_t * prod_{q in t} z_q of the cost layer
+        (z_q = +1 for bit 0, -1 for bit 1), evolved as exp(-i gamma C)
+        """
+        outcomes = np.arange(2 ** 20, dtype=np.int64)
+        diagonal = np.zeros(len(outcomes))
+        for qubits, weight in self.cost_terms():
+            z = np.ones(len(outcomes))
+            for q in qubits:
+                z *= 1 - 2 * ((outcomes >> q) & 1)
+            diagonal += weight * z
+        return diagonal
+
     def create_qaoa_circuit(self, gamma, beta, num_layers=3):
         """
         Create QAOA circuit for hybrid communication system optimization.
@@ -64,38 +119,27 @@ class HybridCommOptimizer:
         - Initial superposition across all 20 qubits
         - QAOA layers encoding cost function (data volume, reliability, mass, power)
         - Measurement in computational basis
+
+        gamma, beta: one angle for every layer, or one per layer
         """
         qc = QuantumCircuit(20, 20)
+        gammas = np.broadcast_to(np.asarray(gamma, dtype=float), (num_layers,))
+        betas = np.broadcast_to(np.asarray(beta, dtype=float), (num_layers,))
 
         # Initial state: uniform superposition
         qc.h(range(20))
 
         # QAOA layers
         for layer in range(num_layers):
+            gamma, beta = gammas[layer], betas[layer]
+
             # Cost Hamiltonian - encode optimization objectives
             # This is a simplified version - full implementation would have more complex interactions
-
-            # RF subsystem interactions (qubits 0-7)
-            for i in range(7):
-                qc.rz(2 * gamma * (i + 1) * 0.1, i)
-                if i < 6:
-                    qc.rzz(2 * gamma * 0.05, i, i + 1)
-
-            # Optical subsystem interactions (qubits 8-15)
-            for i in range(8, 15):
-                qc.rz(2 * gamma * (i - 7) * 0.1, i)
-                if i < 14:
-                    qc.rzz(2 * gamma * 0.05, i, i + 1)
-
-            # Shared resources (qubits 16-19)
-            for i in range(16, 19):
-                qc.rz(2 * gamma * 0.15, i)
-
-            # Cross-subsystem entanglement (RF-Optical-Shared)
-            qc.rzz(2 * gamma * 0.08, 3, 11)  # Power coupling
-            qc.rzz(2 * gamma * 0.08, 16, 3)  # RF to power allocation
-            qc.rzz(2 * gamma * 0.08, 16, 11)  # Optical to power allocation
-            qc.rzz(2 * gamma * 0.08, 17, 18)  # Switching logic coupling
+            for qubits, weight in self.cost_terms():
+                if len(qubits) == 1:
+                    qc.rz(2 * gamma * weight, qubits[0])
+                else:
+                    qc.rzz(2 * gamma * weight, *qubits)
 
             # Mixer Hamiltonian - transitions between states
             for i in range(20):
@@ -349,9 +393,101 @@ class HybridCommOptimizer:
             }
         }
 
-    def run_optimization(self, api_token=None):
+    def outcome_scores_batch(self, outcomes):
+        """
+        Hybrid score of measurement outcomes (ints, index = outcome value),
+        vectorized: calculate_hybrid_performance(decode_bitstring(...))['score']
+        for every outcome at once. Bitstring character j is outcome bit 19 - j.
+        """
+        outcomes = np.asarray(outcomes, dtype=np.int64)
+
+        # Decode (the switching logic, bits 0-1, does not enter the score)
+        freq_ghz = np.array([2.3, 8.4, 32.0, 14.0])[(outcomes >> 18) & 3]
+        rf_power = self.rf_power_levels[(outcomes >> 15) & 7]
+        rf_antenna = self.rf_antenna_sizes[(outcomes >> 12) & 7]
+        wavelength_opt = np.array([1064e-9, 1550e-9, 850e-9, 532e-9])[(outcomes >> 10) & 3]
+        opt_power = self.optical_power_levels[(outcomes >> 7) & 7]
+        opt_aperture = self.optical_apertures[(outcomes >> 4) & 7]
+        alloc = (outcomes >> 2) & 3  # RF_heavy, Balanced, Optical_heavy, Adaptive
+        rf_duty_cycle = np.array([1.0, 0.6, 0.3, 0.9])[alloc]
+        opt_duty_cycle = np.array([0.05, 0.10, 0.15, 0.12])[alloc]
+
+        # RF link (calculate_rf_performance)
+        wavelength_rf = 3e8 / (freq_ghz * 1e9)
+        path_loss_db = 20 * np.log10(self.distance_km * 1e3) + 20 * np.log10(freq_ghz * 1e9) - 147.55
+        tx_gain_db = 10 * np.log10((np.pi * rf_antenna / wavelength_rf) ** 2 * 0.6)
+        rx_gain_db = 10 * np.log10((np.pi * 34.0 / wavelength_rf) ** 2 * 0.65)
+        rx_power_dbw = 10 * np.log10(rf_power) + tx_gain_db + rx_gain_db - path_loss_db
+        bandwidth_hz = 100
+        noise_power_dbw = 10 * np.log10(1.38e-23 * 25) + 10 * np.log10(bandwidth_hz)
+        ebn0_db = rx_power_dbw - noise_power_dbw - 10 * np.log10(bandwidth_hz)
+        rf_rate = np.where(ebn0_db >= self.min_rf_ebn0, bandwidth_hz * 0.5, 1)
+        mass_rf = 0.5 + rf_antenna * 0.8 + rf_power * 0.3
+
+        # Optical link (calculate_optical_performance)
+        beam_radius = 1.22 * wavelength_opt / opt_aperture * self.distance_km * 1e3
+        geometric_loss_db = 10 * np.log10((10.0 / (2 * beam_radius)) ** 2)
+        rx_power_opt_dbw = 10 * np.log10(opt_power) + geometric_loss_db - 3.0
+        signal_photons_per_sec = 10 ** (rx_power_opt_dbw / 10) / (6.626e-34 * 3e8 / wavelength_opt)
+        snr_db = 10 * np.log10(signal_photons_per_sec / np.sqrt(1e6) + 1e-10)
+        opt_rate = np.where(snr_db >= self.min_optical_snr, np.minimum(10000, signal_photons_per_sec * 0.001), 0)
+        mass_optical = 0.8 + opt_aperture * 1.2 + opt_power * 0.4
+
+        # Hybrid system (calculate_hybrid_performance)
+        total_mass = mass_rf + mass_optical + 0.3 + 0.4
+        avg_power = (rf_power * rf_duty_cycle + opt_power * opt_duty_cycle) / 0.88
+        peak_power = (rf_power + opt_power) / 0.88
+        seconds_per_year = 365 * 24 * 3600
+        total_data_bits_per_year = (rf_rate * seconds_per_year * self.rf_availability +
+                                    opt_rate * seconds_per_year * self.optical_availability)
+        total_violation = (np.maximum(0, total_mass - self.total_mass_budget) +
+                           np.maximum(0, avg_power - self.avg_power_budget) +
+                           np.maximum(0, peak_power - self.peak_power_budget) +
+                           np.maximum(0, self.min_rf_ebn0 - ebn0_db) * 10 +
+                           np.maximum(0, self.min_optical_snr - snr_db) * 10)
+
+        return total_data_bits_per_year / (8 * 1e9) - total_violation * 100
+
+    def outcome_scores(self):
+        """Hybrid score of every 20-bit measurement outcome (index = outcome value)"""
+        return DiagonalCost.from_batch(self.outcome_scores_batch, n_qubits=20).values
+
+    def encoding_fingerprint(self):
+        """
+        Hash of everything outcome_scores and the cost layer depend on (levels,
+        mission, constraints, cost terms): the angle cache key, so a cache hit
+        needs no scoring
+        """
+        encoding = {
+            'levels': [self.rf_frequencies, self.rf_power_levels.tolist(), self.rf_antenna_sizes.tolist(),
+                       self.optical_wavelengths, self.optical_power_levels.tolist(),
+                       self.optical_apertures.tolist(), self.power_allocation_strategies, self.switching_logics],
+            'mission': [self.distance_km, self.rf_availability, self.optical_availability],
+            'constraints': [self.total_mass_budget, self.avg_power_budget, self.peak_power_budget,
+                            self.min_rf_ebn0, self.min_optical_snr],
+            'cost_terms': self.cost_terms()
+        }
+        return hashlib.sha1(json.dumps(encoding).encode()).hexdigest()[:16]
+
+    def tune_qaoa_angles(self, num_layers=3):
+        """
+        Per-layer (gamma, beta) maximizing the expected hybrid score, tuned on
+        the local statevector simulator with warm starts (see qaoa_angles.py).
+        Expectations evolve the cost diagonal directly in single precision;
+        the outcome scores are only computed if the angle cache has no entry
+        for this encoding.
+        """
+        tuner = QAOAAngleOptimizer(
+            lambda gammas, betas: self.create_qaoa_circuit(gammas, betas, num_layers=len(gammas)),
+            self.outcome_scores, instance='hybrid_comm', simulator=QAOASimulator(dtype=np.complex64),
+            cache=self.angle_cache, cost_diagonal=self.cost_diagonal(), fingerprint=self.encoding_fingerprint())
+        return tuner.optimize(num_layers)
+
+    def run_optimization(self, api_token=None, tune_angles=True):
         """
         Run quantum optimization on IBM Torino.
+
+        tune_angles: tune the QAOA angles locally first (else gamma=0.8, beta=0.4)
         """
         print("=" * 80)
         print("HYBRID OPTICAL-RF COMMUNICATION SYSTEM QUANTUM OPTIMIZER")
@@ -374,9 +510,13 @@ class HybridCommOptimizer:
         print()
 
         # Create QAOA circuit with optimized parameters
-        # These would typically be optimized via classical loop
-        gamma = 0.8
-        beta = 0.4
+        if tune_angles:
+            print("Tuning QAOA angles on the local simulator...")
+            gamma, beta = self.tune_qaoa_angles(num_layers=3)
+            print(f"Tuned gamma: {np.round(gamma, 3)}, beta: {np.round(beta, 3)}")
+        else:
+            gamma = 0.8
+            beta = 0.4
 
         print("Building QAOA circuit...")
         qc = self.create_qaoa_circuit(gamma, beta, num_layers=3)
@@ -494,6 +634,11 @@ class HybridCommOptimizer:
             'backend': backend.name,
             'num_qubits': backend.num_qubits,
             'shots': 10000,
+            'qaoa_angles': {
+                'gamma': np.broadcast_to(gamma, (3,)).tolist(),
+                'beta': np.broadcast_to(beta, (3,)).tolist(),
+                'tuned': tune_angles
+            },
             'mission_parameters': {
                 'distance_au': self.distance_au,
                 'duration_days': self.mission_duration_days,
@@ -520,14 +665,14 @@ def main():
     """
     Main execution function.
     """
-    optimizer = HybridCommOptimizer()
+    results_dir = "/Users/heinzjungbluth/Desktop/Warp/lightsail_optimization/results"
+    optimizer = HybridCommOptimizer(angle_cache_path=os.path.join(results_dir, "qaoa_angle_cache.json"))
 
     try:
         # Run optimization (will use saved credentials)
         results = optimizer.run_optimization()
 
         # Create results directory
-        results_dir = "/Users/heinzjungbluth/Desktop/Warp/lightsail_optimization/results"
         os.makedirs(results_dir, exist_ok=True)
 
         # Save results
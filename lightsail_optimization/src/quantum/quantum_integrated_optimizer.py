@@ -16,6 +16,11 @@ Critical coupling: More capability = More mass = Lower velocity
 
 import numpy as np
 import json
+import os
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Tuple, Any
 import warnings
@@ -24,13 +29,18 @@ warnings.filterwarnings('ignore')
 # Quantum computing imports
 from qiskit import QuantumCircuit
 from qiskit.circuit import Parameter
-from qiskit_ibm_runtime import QiskitRuntimeService, Session, Sampler
 from qiskit.quantum_info import SparsePauliOp
 
 # Scientific computing
 from scipy.optimize import minimize
 import matplotlib.pyplot as plt
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+
+from pareto import ParetoArchive, pareto_front_mask
+from topk import TopK, top_indices
+from quantum_backend import QuantumBackendProvider
+from qaoa_angles import AngleCache
+from qaoa_cost import DiagonalCost, IsingModel
 
 
 @dataclass
@@ -67,10 +77,223 @@ class SpacecraftDesign:
     violation_details: Dict[str, float]
 
 
+# Constraint columns of DesignBatch.violations (same keys as violation_details)
+VIOLATION_NAMES = ('power_margin', 'rf_eb_n0', 'optical_snr', 'mass_target',
+                   'min_velocity', 'max_travel_time', 'max_cost')
+
+# SpacecraftDesign fields stored as DesignBatch columns
+DESIGN_COLUMNS = tuple(f.name for f in fields(SpacecraftDesign) if f.name != 'violation_details')
+
+
+@dataclass
+class DesignBatch:
+    """
+    Columnar batch of evaluated designs
+
+    columns: one (N,) array per SpacecraftDesign field (comm_type as str)
+    violations: (N, len(VIOLATION_NAMES)) amount over each limit, 0 if met
+    params: (N, 10) normalized parameter vectors that were evaluated
+    intermediates: model quantities behind the columns (used for gradients)
+    """
+    columns: Dict[str, np.ndarray]
+    violations: np.ndarray
+    params: np.ndarray
+    intermediates: Dict[str, np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+
+    def design(self, i: int) -> SpacecraftDesign:
+        """Materialize one row as a SpacecraftDesign"""
+        values = {name: self.columns[name][i].item() for name in DESIGN_COLUMNS}
+        values['violation_details'] = {name: float(v) for name, v in zip(VIOLATION_NAMES, self.violations[i])
+                                       if v > 0}
+        return SpacecraftDesign(**values)
+
+    def top_indices(self, k: int, key: str = 'mission_value') -> np.ndarray:
+        """Row indices of the k largest values of a column, best first (ties: lower row)"""
+        return top_indices(self.columns[key], k)
+
+    def top_k(self, k: int, key: str = 'mission_value') -> List[SpacecraftDesign]:
+        """Materialize only the k best designs (by a column), best first"""
+        return [self.design(i) for i in self.top_indices(k, key)]
+
+
+class DesignEvaluationCache:
+    """
+    Memoized design evaluation keyed on (architecture, quantized parameters)
+
+    Parameters are quantized to multiples of `resolution`; a lookup returns
+    the design evaluated for the first parameter vector seen in that cell.
+    Keep resolution well below the L-BFGS-B finite-difference step (~1e-8)
+    so gradient probes are not merged with the base point.
+
+    In memory: LRU with at most max_entries designs. With `path`, designs are
+    also persisted to an SQLite file so later sessions skip known designs;
+    the file is cleared when the optimizer's model constants change.
+    Returned SpacecraftDesign objects are shared; treat them as read-only.
+    """
+
+    def __init__(self, optimizer, max_entries: int = 100000, resolution: float = 1e-9,
+                 path: str = None, commit_every: int = 1000):
+        self.optimizer = optimizer
+        self.max_entries = max_entries
+        self.resolution = resolution
+        self.path = path
+        self.commit_every = commit_every
+        self.entries = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        self._db = None
+        self._pending = 0
+        if path is not None:
+            self._open_disk(path)
+
+    # ------------------------------------------------------------------
+    # Disk layer
+    # ------------------------------------------------------------------
+
+    def model_signature(self) -> str:
+        """Hash of everything evaluate_design depends on besides its arguments"""
+        constants = {name: value for name, value in vars(self.optimizer).items()
+                     if name.isupper() and isinstance(value, (int, float))}
+        model = {'design_space': self.optimizer.design_space,
+                 'architectures': self.optimizer.architectures,
+                 'constants': constants, 'resolution': self.resolution}
+        return hashlib.sha256(json.dumps(model, sort_keys=True).encode()).hexdigest()
+
+    def _open_disk(self, path):
+        self._db = sqlite3.connect(path)
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS designs (key TEXT PRIMARY KEY, design TEXT)")
+        signature = self.model_signature()
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'signature'").fetchone()
+        if row is None or row[0] != signature:
+            self._db.execute("DELETE FROM designs")
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (signature,))
+        self._db.commit()
+
+    def _disk_get(self, key: str):
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT design FROM designs WHERE key = ?", (key,)).fetchone()
+        return None if row is None else SpacecraftDesign(**json.loads(row[0]))
+
+    def _disk_put(self, key: str, design: SpacecraftDesign):
+        if self._db is None:
+            return
+        self._db.execute("INSERT OR REPLACE INTO designs VALUES (?, ?)", (key, json.dumps(asdict(design))))
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+    def flush(self):
+        """Commit pending disk writes"""
+        if self._db is not None and self._pending:
+            self._db.commit()
+            self._pending = 0
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def keys(self, params: np.ndarray, architecture: str) -> List[str]:
+        """Cache keys of an (N, 10) parameter array"""
+        cells = np.rint(np.atleast_2d(params) / self.resolution).astype(np.int64)
+        return [architecture + ':' + ','.join(map(str, row)) for row in cells.tolist()]
+
+    def _lookup(self, key: str):
+        design = self.entries.get(key)
+        if design is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return design
+        design = self._disk_get(key)
+        if design is not None:
+            self.disk_hits += 1
+            self._remember(key, design, persist=False)
+        return design
+
+    def _remember(self, key: str, design: SpacecraftDesign, persist: bool = True):
+        self.entries[key] = design
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        if persist:
+            self._disk_put(key, design)
+
+    def get(self, params: np.ndarray, architecture: str = 'balanced') -> SpacecraftDesign:
+        """Cached evaluate_design"""
+        key = self.keys(params, architecture)[0]
+        design = self._lookup(key)
+        if design is None:
+            self.misses += 1
+            design = self.optimizer.evaluate_design(np.asarray(params, dtype=float), architecture)
+            self._remember(key, design)
+        return design
+
+    def get_many(self, params: np.ndarray, architecture: str = 'balanced') -> List[SpacecraftDesign]:
+        """Cached evaluation of an (N, 10) array; misses share one evaluate_designs_batch call"""
+        params = np.atleast_2d(np.asarray(params, dtype=float))
+        keys = self.keys(params, architecture)
+        designs = [self._lookup(key) for key in keys]
+
+        # Misses (first row of each new cell); repeats within the call count as hits
+        missing = {}
+        for i, (key, design) in enumerate(zip(keys, designs)):
+            if design is None:
+                if key in missing:
+                    self.hits += 1
+                else:
+                    missing[key] = i
+        if missing:
+            self.misses += len(missing)
+            batch = self.optimizer.evaluate_designs_batch(params[list(missing.values())], architecture)
+            for j, key in enumerate(missing):
+                missing[key] = batch.design(j)
+                self._remember(key, missing[key])
+            self.flush()
+            designs = [missing[key] if design is None else design for key, design in zip(keys, designs)]
+        return designs
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0
+        }
+
+
 class QuantumIntegratedOptimizer:
     """Quantum optimizer for integrated spacecraft design"""
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 100000, cache_path: str = None,
+                 backend_provider: QuantumBackendProvider = None, angle_cache_path: str = None):
+        """
+        cache_size: designs kept in the in-memory evaluation cache (LRU)
+        cache_path: optional SQLite file persisting evaluations across sessions
+        backend_provider: quantum backend, connected on first quantum use
+                          (default: IBM Torino, or $WARPEED_QUANTUM_BACKEND)
+        angle_cache_path: optional JSON file persisting tuned QAOA angles
+        """
         # Physical constants
         self.SPEED_OF_LIGHT = 299792458  # m/s
         self.AU = 1.496e11  # m
@@ -116,16 +339,37 @@ class QuantumIntegratedOptimizer:
             'balanced': {'target_mass': 5.0, 'target_velocity': 0.2}
         }
 
-        # IBM Quantum setup
-        try:
-            self.service = QiskitRuntimeService(channel="ibm_quantum")
-            self.backend = self.service.backend("ibm_torino")
-            self.use_quantum = True
-            print("✓ Connected to IBM Torino (20 qubits)")
-        except Exception as e:
-            print(f"⚠ Quantum backend unavailable: {e}")
-            print("  Using classical simulation")
-            self.use_quantum = False
+        # Memoized evaluate_design for repeated QAOA measurements and refinement
+        self.evaluation_cache = DesignEvaluationCache(self, max_entries=cache_size, path=cache_path)
+
+        # Tuned QAOA angles per architecture (see tune_qaoa_angles)
+        self.angle_cache = AngleCache(angle_cache_path) if angle_cache_path else None
+        # Cost diagonals and Ising fits of the QAOA encoding (see qaoa_cost)
+        self.qaoa_costs: Dict[str, Tuple[DiagonalCost, IsingModel]] = {}
+
+        # IBM Quantum setup (lazy: no connection until the first quantum run)
+        if backend_provider is None:
+            backend_provider = QuantumBackendProvider(channel="ibm_quantum")
+        self.backend_provider = backend_provider
+
+    @property
+    def use_quantum(self) -> bool:
+        """Quantum backend available (connects on first access)"""
+        return self.backend_provider.available
+
+    def __getstate__(self):
+        """Pickle the model only (process-pool workers): no IBM session or cache database"""
+        state = {key: value for key, value in self.__dict__.items()
+                 if key not in ('backend_provider', 'evaluation_cache', 'qaoa_costs')}
+        state['backend_provider'] = QuantumBackendProvider('offline')
+        state['_cache_size'] = self.evaluation_cache.max_entries
+        return state
+
+    def __setstate__(self, state):
+        cache_size = state.pop('_cache_size')
+        self.__dict__.update(state)
+        self.evaluation_cache = DesignEvaluationCache(self, max_entries=cache_size)
+        self.qaoa_costs = {}
 
     def calculate_spacecraft_mass(self, solar_area_cm2: float, battery_wh: float,
                                   comm_type: str, tx_power: float, tx_aperture: float,
@@ -579,6 +823,318 @@ class QuantumIntegratedOptimizer:
 
         return design
 
+    def evaluate_designs_batch(self, params: np.ndarray, architecture: str = 'balanced') -> DesignBatch:
+        """
+        Evaluate many designs at once (vectorized evaluate_design)
+
+        params: (N, 10) normalized parameter vectors. Applies the same mass,
+        velocity, power, communication, value and cost models as
+        evaluate_design, column-wise; use DesignBatch.top_k / design(i) to
+        materialize SpacecraftDesign objects for the rows of interest.
+        """
+        params = np.atleast_2d(np.asarray(params, dtype=float))
+        ds = self.design_space
+        c = self.SPEED_OF_LIGHT
+
+        def decode(column, key):
+            return params[:, column] * (ds[key][1] - ds[key][0]) + ds[key][0]
+
+        # Decode parameters
+        solar_area = decode(0, 'solar_area')
+        solar_eff = decode(1, 'solar_eff')
+        battery_cap = decode(2, 'battery_cap')
+        n_comm = len(ds['comm_type'])
+        comm_idx = np.minimum((params[:, 3] * n_comm).astype(int), n_comm - 1)
+        comm_type = np.array(ds['comm_type'])[comm_idx]
+        tx_power = decode(4, 'tx_power')
+        tx_aperture = decode(5, 'tx_aperture')
+        mod_eff = decode(6, 'mod_eff')
+        struct_mass = decode(7, 'struct_mass')
+        thermal_mass = decode(8, 'thermal_mass')
+        cross_section = decode(9, 'cross_section')
+
+        is_rf = comm_idx == ds['comm_type'].index('RF')
+        is_optical = comm_idx == ds['comm_type'].index('Optical')
+        is_hybrid = comm_idx == ds['comm_type'].index('Hybrid')
+        has_rf = is_rf | is_hybrid
+        has_optical = is_optical | is_hybrid
+
+        # Mass (calculate_spacecraft_mass)
+        comm_mass = np.where(
+            is_rf, (0.5 + tx_power * 0.2) + (tx_aperture ** 2) * 1.5,
+            np.where(is_optical, (0.3 + tx_power * 0.15) + (tx_aperture ** 2) * 0.8,
+                     2.0 + tx_power * 0.3 + (tx_aperture ** 2) * 1.2))
+        total_mass = (solar_area * 0.15 + battery_cap / 0.05 + comm_mass +
+                      struct_mass + thermal_mass + 2.0)
+
+        # Final velocity (calculate_final_velocity)
+        force_n = 2 * self.LASER_POWER_W / c
+        effective_force = force_n * (1.0 - (cross_section / self.SAIL_AREA_M2))
+        beta_classical = (effective_force / (total_mass / 1000.0)) * 600 / c
+        final_velocity_c = np.minimum(np.tanh(np.arctanh(np.minimum(beta_classical, 0.99))), 0.99)
+
+        travel_time_years = (self.ALPHA_CENTAURI_DISTANCE / (final_velocity_c * c)) / (365.25 * 86400)
+
+        # Power margin (calculate_power_budget)
+        power_generated = (solar_area / 10000) * self.SOLAR_IRRADIANCE_W_M2 * solar_eff
+        total_loads = 0.5 + 0.2 + 0.3 + tx_power + 0.1 + 0.0
+        power_margin = (power_generated - total_loads) / total_loads
+
+        # Communication (calculate_communication_performance), both links for all rows
+        distance_m = self.ALPHA_CENTAURI_DISTANCE
+        wavelength = c / self.XBAND_FREQ_HZ
+        tx_gain_db = 10 * np.log10((np.pi * tx_aperture / wavelength) ** 2)
+        rx_gain_db = 10 * np.log10((np.pi * self.GROUND_APERTURE_M / wavelength) ** 2)
+        fspl_db = 20 * np.log10(4 * np.pi * distance_m / wavelength)
+        rx_power_dbm = 10 * np.log10(tx_power * 1000) + tx_gain_db + rx_gain_db - fspl_db
+        bandwidth_hz = 1e6
+        snr = 10 ** ((rx_power_dbm - 30) / 10) / (self.BOLTZMANN * self.SYSTEM_TEMP_K * bandwidth_hz)
+        rf_snr_db = 10 * np.log10(np.maximum(snr, 1e-30))
+        rf_rate = bandwidth_hz * np.log2(1 + snr) * mod_eff
+        rf_eb_n0_db = rf_snr_db + 10 * np.log10(bandwidth_hz / np.maximum(rf_rate, 1))
+        rf_margin_db = rf_eb_n0_db - 10.0
+
+        rf_snr_db = np.where(has_rf, rf_snr_db, -100)
+        rf_eb_n0_db = np.where(has_rf, rf_eb_n0_db, -100)
+        rf_rate = np.where(has_rf, rf_rate, 0)
+        rf_margin_db = np.where(has_rf, rf_margin_db, -110)
+
+        wavelength = self.OPTICAL_WAVELENGTH_M
+        beam_radius_m = distance_m * (1.22 * wavelength / tx_aperture)
+        geometric_loss = (np.pi * (self.GROUND_APERTURE_M / 2) ** 2) / (np.pi * beam_radius_m ** 2)
+        photon_energy_j = 6.62607015e-34 * c / wavelength
+        signal_photons = (tx_power * geometric_loss * 0.7) / photon_energy_j * 1.0
+        optical_snr = signal_photons / np.maximum(np.sqrt(signal_photons), 1)
+        optical_snr_db = 10 * np.log10(np.maximum(optical_snr, 1e-30))
+        optical_rate = 1e9 * mod_eff * np.minimum(optical_snr / 100, 1.0)
+        optical_margin_db = optical_snr_db - 8.0
+
+        optical_snr_db = np.where(has_optical, optical_snr_db, -100)
+        optical_rate = np.where(has_optical, optical_rate, 0)
+        optical_margin_db = np.where(has_optical, optical_margin_db, -108)
+
+        comm_snr_db = np.where(is_hybrid, np.maximum(rf_snr_db, optical_snr_db),
+                               np.where(is_rf, rf_snr_db, optical_snr_db))
+        data_rate_bps = np.where(is_hybrid, rf_rate + optical_rate,
+                                 np.where(is_rf, rf_rate, optical_rate))
+        link_margin_db = np.where(is_hybrid, np.maximum(rf_margin_db, optical_margin_db),
+                                  np.where(is_rf, rf_margin_db, optical_margin_db))
+
+        # Mission value (calculate_mission_value)
+        data_volume_gb = (data_rate_bps * travel_time_years * 365.25 * 86400 * 0.1) / 8e9
+        science_score = np.log10(np.maximum(data_volume_gb, 1))
+        timeliness_score = 1.0 / (1.0 + travel_time_years / 50.0)
+        velocity_score = final_velocity_c / 0.5
+        power_reliability = 1.0 / (1.0 + np.exp(-5 * (power_margin - 0.2)))
+        comm_reliability = 1.0 / (1.0 + np.exp(-0.5 * link_margin_db))
+        mission_value = (
+            0.4 * science_score +
+            0.3 * velocity_score +
+            0.2 * timeliness_score +
+            0.1 * (power_reliability * comm_reliability)
+        )
+
+        # Cost (calculate_cost)
+        solar_cost = (solar_area / 10000) * self.SOLAR_IRRADIANCE_W_M2 * 0.35 * 1000
+        comm_cost = np.where(
+            is_rf, 50000 + tx_power * 10000 + tx_aperture * 20000,
+            np.where(is_optical, 80000 + tx_power * 15000 + tx_aperture * 30000,
+                     120000 + tx_power * 20000 + tx_aperture * 40000))
+        hardware_cost = solar_cost + battery_cap * 500 + comm_cost + total_mass * 50 + 100000
+        cost = hardware_cost + hardware_cost * 0.3
+
+        # Constraints (columns in VIOLATION_NAMES order, 0 where met)
+        target_mass = self.architectures[architecture]['target_mass']
+        mass_excess = np.abs(total_mass - target_mass) - 2.0
+        checks = [
+            (power_margin < 0.20, 0.20 - power_margin),
+            (has_rf & (rf_eb_n0_db < -10.0), -10.0 - rf_eb_n0_db),
+            (has_optical & (optical_snr_db < -5.0), -5.0 - optical_snr_db),
+            (mass_excess > 0, mass_excess),
+            (final_velocity_c < 0.10, 0.10 - final_velocity_c),
+            (travel_time_years > 50.0, travel_time_years - 50.0),
+            (cost > 500000, cost - 500000),
+        ]
+        violated = np.stack([mask for mask, _ in checks], axis=1)
+        violations = np.where(violated, np.stack([amount for _, amount in checks], axis=1), 0.0)
+
+        columns = {
+            'solar_area_cm2': solar_area,
+            'solar_efficiency': solar_eff,
+            'battery_capacity_wh': battery_cap,
+            'comm_type': comm_type,
+            'tx_power_w': tx_power,
+            'tx_aperture_m': tx_aperture,
+            'modulation_efficiency': mod_eff,
+            'structural_mass_g': struct_mass,
+            'thermal_mass_g': thermal_mass,
+            'total_mass_g': total_mass,
+            'cross_section_m2': cross_section,
+            'power_margin': power_margin,
+            'comm_snr_db': comm_snr_db,
+            'final_velocity_c': final_velocity_c,
+            'travel_time_years': travel_time_years,
+            'data_rate_bps': data_rate_bps,
+            'mission_value': mission_value,
+            'cost_usd': cost,
+            'constraints_met': ~violated.any(axis=1),
+        }
+
+        intermediates = {
+            'comm_idx': comm_idx,
+            'beta_classical': beta_classical,
+            'power_generated': power_generated,
+            'total_loads': total_loads,
+            'rf_snr': snr,
+            'rf_eb_n0_db': rf_eb_n0_db,
+            'rf_margin_db': rf_margin_db,
+            'optical_signal_photons': signal_photons,
+            'optical_snr': optical_snr,
+            'optical_snr_db': optical_snr_db,
+            'optical_margin_db': optical_margin_db,
+            'link_margin_db': link_margin_db,
+            'data_volume_gb': data_volume_gb,
+            'power_reliability': power_reliability,
+            'comm_reliability': comm_reliability,
+            'violated': violated,
+        }
+
+        return DesignBatch(columns=columns, violations=violations, params=params,
+                           intermediates=intermediates)
+
+    def refinement_objective_batch(self, params: np.ndarray, architecture: str = 'balanced',
+                                   penalty_weight: float = 10.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Penalized refinement objective and its exact gradient
+
+        objective = -(mission_value - penalty_weight * sum of violations), the
+        quantity minimized in optimize_architecture_classical. The gradient
+        is the hand-derived chain rule through the evaluate_designs_batch
+        model, w.r.t. the normalized parameters. The discrete comm_type
+        parameter and saturated branches (velocity cap, SNR floors, rate
+        caps) have zero slope; at kinks (abs, max) the active branch is used.
+
+        Returns (objective (N,), gradient (N, 10)).
+        """
+        batch = self.evaluate_designs_batch(params, architecture)
+        col, aux = batch.columns, batch.intermediates
+        n = len(batch)
+        ds = self.design_space
+        ln10, ln2 = np.log(10), np.log(2)
+
+        # Derivatives below are w.r.t. the decoded physical parameters
+        # (columns in params order), converted to normalized ones at the end
+        def zeros():
+            return np.zeros((n, 10))
+
+        area, eff = col['solar_area_cm2'], col['solar_efficiency']
+        tx_power, aperture, mod_eff = col['tx_power_w'], col['tx_aperture_m'], col['modulation_efficiency']
+        cross_section, mass = col['cross_section_m2'], col['total_mass_g']
+        velocity, travel_time = col['final_velocity_c'], col['travel_time_years']
+
+        comm_idx = aux['comm_idx']
+        is_rf = comm_idx == ds['comm_type'].index('RF')
+        is_optical = comm_idx == ds['comm_type'].index('Optical')
+        is_hybrid = comm_idx == ds['comm_type'].index('Hybrid')
+        has_rf = (is_rf | is_hybrid)[:, None]
+        has_optical = (is_optical | is_hybrid)[:, None]
+
+        # Mass
+        d_mass = zeros()
+        d_mass[:, 0] = 0.15
+        d_mass[:, 2] = 1 / 0.05
+        d_mass[:, 4] = np.where(is_rf, 0.2, np.where(is_optical, 0.15, 0.3))
+        d_mass[:, 5] = 2 * aperture * np.where(is_rf, 1.5, np.where(is_optical, 0.8, 1.2))
+        d_mass[:, 7] = 1.0
+        d_mass[:, 8] = 1.0
+
+        # Velocity (beta ~ (1 - X/A_sail) / m, capped at 0.99) and travel time
+        beta = aux['beta_classical']
+        d_beta = -(beta / mass)[:, None] * d_mass
+        d_beta[:, 9] -= beta / (self.SAIL_AREA_M2 - cross_section)
+        d_velocity = np.where((beta < 0.99)[:, None], d_beta, 0.0)
+        d_travel = -(travel_time / velocity)[:, None] * d_velocity
+
+        # Power margin = generated / loads - 1
+        generated, loads = aux['power_generated'], aux['total_loads']
+        d_margin = zeros()
+        d_margin[:, 0] = generated / area / loads
+        d_margin[:, 1] = generated / eff / loads
+        d_margin[:, 4] = -generated / loads ** 2
+
+        # RF link: SNR ~ P * D^2
+        snr = aux['rf_snr']
+        d_snr = zeros()
+        d_snr[:, 4] = snr / tx_power
+        d_snr[:, 5] = 2 * snr / aperture
+        d_rf_snr_db = np.where((snr > 1e-30)[:, None], 10 / ln10 * d_snr / snr[:, None], 0.0)
+        rf_rate = 1e6 * np.log2(1 + snr) * mod_eff
+        d_rf_rate = (1e6 * mod_eff / ((1 + snr) * ln2))[:, None] * d_snr
+        d_rf_rate[:, 6] += 1e6 * np.log2(1 + snr)
+        d_rf_eb_n0 = d_rf_snr_db - np.where((rf_rate > 1)[:, None],
+                                            10 / ln10 * d_rf_rate / np.maximum(rf_rate, 1)[:, None], 0.0)
+        d_rf_rate = np.where(has_rf, d_rf_rate, 0.0)
+        d_rf_eb_n0 = np.where(has_rf, d_rf_eb_n0, 0.0)
+
+        # Optical link: photons ~ P * D^2, SNR = sqrt(photons) above one photon
+        photons, optical_snr = aux['optical_signal_photons'], aux['optical_snr']
+        d_photons = zeros()
+        d_photons[:, 4] = photons / tx_power
+        d_photons[:, 5] = 2 * photons / aperture
+        root = np.sqrt(photons)
+        d_optical_snr = np.where((root > 1)[:, None], d_photons / (2 * np.maximum(root, 1))[:, None], d_photons)
+        d_optical_snr_db = np.where((optical_snr > 1e-30)[:, None],
+                                    10 / ln10 * d_optical_snr / np.maximum(optical_snr, 1e-30)[:, None], 0.0)
+        d_optical_rate = np.where((optical_snr < 100)[:, None], (1e9 * mod_eff / 100)[:, None] * d_optical_snr, 0.0)
+        d_optical_rate[:, 6] += 1e9 * np.minimum(optical_snr / 100, 1.0)
+        d_optical_rate = np.where(has_optical, d_optical_rate, 0.0)
+        d_optical_snr_db = np.where(has_optical, d_optical_snr_db, 0.0)
+
+        # Combined link (hybrid: summed rate, best margin)
+        d_rate = d_rf_rate + d_optical_rate
+        rf_link = is_rf | (is_hybrid & (aux['rf_margin_db'] >= aux['optical_margin_db']))
+        d_link_margin = np.where(rf_link[:, None], d_rf_eb_n0, d_optical_snr_db)
+
+        # Mission value
+        rate = col['data_rate_bps']
+        d_science = np.where((aux['data_volume_gb'] > 1)[:, None],
+                             (d_rate / np.where(rate > 0, rate, 1)[:, None] +
+                              d_travel / travel_time[:, None]) / ln10, 0.0)
+        d_timeliness = -(1 / 50.0) / (1.0 + travel_time / 50.0)[:, None] ** 2 * d_travel
+        power_rel, comm_rel = aux['power_reliability'], aux['comm_reliability']
+        d_power_rel = (5 * power_rel * (1 - power_rel))[:, None] * d_margin
+        d_comm_rel = (0.5 * comm_rel * (1 - comm_rel))[:, None] * d_link_margin
+        d_value = (0.4 * d_science + 0.3 * d_velocity / 0.5 + 0.2 * d_timeliness +
+                   0.1 * (d_power_rel * comm_rel[:, None] + power_rel[:, None] * d_comm_rel))
+
+        # Cost
+        d_cost = 50 * d_mass
+        d_cost[:, 0] += self.SOLAR_IRRADIANCE_W_M2 * 0.35 * 1000 / 10000
+        d_cost[:, 2] += 500
+        d_cost[:, 4] += np.where(is_rf, 10000, np.where(is_optical, 15000, 20000))
+        d_cost[:, 5] += np.where(is_rf, 20000, np.where(is_optical, 30000, 40000))
+        d_cost *= 1.3
+
+        # Active constraint violations (VIOLATION_NAMES order)
+        target_mass = self.architectures[architecture]['target_mass']
+        violated = aux['violated'][:, :, None]
+        d_violations = (violated[:, 0] * -d_margin +
+                        violated[:, 1] * -d_rf_eb_n0 +
+                        violated[:, 2] * -d_optical_snr_db +
+                        violated[:, 3] * np.sign(mass - target_mass)[:, None] * d_mass +
+                        violated[:, 4] * -d_velocity +
+                        violated[:, 5] * d_travel +
+                        violated[:, 6] * d_cost)
+
+        objective = -(col['mission_value'] - penalty_weight * batch.violations.sum(axis=1))
+        scale = np.array([ds[key][1] - ds[key][0] for key in
+                          ('solar_area', 'solar_eff', 'battery_cap')] + [0.0] +
+                         [ds[key][1] - ds[key][0] for key in
+                          ('tx_power', 'tx_aperture', 'mod_eff', 'struct_mass', 'thermal_mass', 'cross_section')])
+        gradient = -(d_value - penalty_weight * d_violations) * scale
+
+        return objective, gradient
+
     def create_qaoa_circuit(self, params: np.ndarray, architecture: str = 'balanced') -> QuantumCircuit:
         """
         Create QAOA circuit for integrated optimization
@@ -598,8 +1154,8 @@ class QuantumIntegratedOptimizer:
         # Problem Hamiltonian: encode mission value maximization
         # We want to maximize mission value, which depends on all subsystems
 
-        # QAOA layers
-        n_layers = 3
+        # QAOA layers (params = [beta_1..beta_p, gamma_1..gamma_p])
+        n_layers = len(params) // 2
         beta = params[:n_layers]
         gamma = params[n_layers:2*n_layers]
 
@@ -671,8 +1227,71 @@ class QuantumIntegratedOptimizer:
 
         return np.array(params)
 
-    def optimize_architecture_quantum(self, architecture: str, n_shots: int = 10000) -> List[SpacecraftDesign]:
-        """Run quantum optimization for a specific architecture"""
+    def decode_measurements_batch(self, bitstrings: List[str]) -> np.ndarray:
+        """Decode many 20-bit measurement strings to an (N, 10) parameter array"""
+        bits = np.array([[b == '1' for b in bitstring[:20]] for bitstring in bitstrings], dtype=int)
+        bits = bits.reshape(len(bitstrings), 10, 2)
+        return (2 * bits[:, :, 0] + bits[:, :, 1]) / 3.0
+
+    def qaoa_objective_values(self, architecture: str, penalty_weight: float = 10.0,
+                              chunk_size: int = 65536) -> np.ndarray:
+        """
+        Penalized mission value of every 20-bit QAOA outcome
+
+        Outcome k decodes to lattice point k (decode_measurement of
+        format(k, '020b')), so the vector is the lattice evaluated in chunks:
+        mission_value - penalty_weight * sum of constraint violations.
+        """
+        def evaluate(index):
+            batch = self.evaluate_designs_batch(self.lattice_params(index), architecture)
+            return batch['mission_value'] - penalty_weight * batch.violations.sum(axis=1)
+
+        return DiagonalCost.from_batch(evaluate, n_qubits=20, chunk_size=chunk_size).values
+
+    def qaoa_cost(self, architecture: str) -> Tuple[DiagonalCost, IsingModel]:
+        """
+        Cost diagonal of the 20-qubit encoding and its RZ/RZZ (order-2)
+        Ising fit, computed once per architecture
+        """
+        if architecture not in self.qaoa_costs:
+            cost = DiagonalCost(self.qaoa_objective_values(architecture))
+            model = cost.fit_ising(max_order=2)
+            print(f"QAOA cost Hamiltonian ({architecture}): {len(model.terms)} Ising terms, "
+                  f"{model.explained_variance:.1%} of the objective variance")
+            self.qaoa_costs[architecture] = (cost, model)
+        return self.qaoa_costs[architecture]
+
+    def create_cost_qaoa_circuit(self, params: np.ndarray, architecture: str = 'balanced') -> QuantumCircuit:
+        """
+        QAOA circuit whose cost layers implement the Ising fit of the actual
+        penalized mission value (params = [betas, gammas] as in
+        create_qaoa_circuit; mixers are RX(2 beta))
+        """
+        cost, model = self.qaoa_cost(architecture)
+        n_layers = len(params) // 2
+        return cost.circuit(params[n_layers:2*n_layers], params[:n_layers], model)
+
+    def tune_qaoa_angles(self, architecture: str, n_layers: int = 3) -> np.ndarray:
+        """
+        QAOA angles of create_cost_qaoa_circuit maximizing the expected
+        penalized mission value
+
+        Tuned on the local simulator by evolving the fitted cost diagonal
+        directly, warm-started layer by layer and cached per architecture
+        (see qaoa_angles.py, qaoa_cost.py).
+        Returns params in create_qaoa_circuit order [betas, gammas].
+        """
+        cost, model = self.qaoa_cost(architecture)
+        tuner = cost.angle_optimizer(model, instance=f'integrated:{architecture}', cache=self.angle_cache)
+        gammas, betas = tuner.optimize(n_layers)
+        tuned = tuner.cache.get(tuner.key, n_layers)
+        print(f"QAOA angles tuned (p={n_layers}): expected objective {tuned['expected_objective']:.3f} "
+              f"vs {cost.mean:.3f} uniform ({tuner.n_evaluations} simulator evaluations)")
+        return np.concatenate([betas, gammas])
+
+    def optimize_architecture_quantum(self, architecture: str, n_shots: int = 10000,
+                                      seed=None) -> List[SpacecraftDesign]:
+        """Run quantum optimization for a specific architecture (seed: classical fallback sampling)"""
 
         print(f"\n{'='*70}")
         print(f"QUANTUM OPTIMIZATION: {architecture.upper()} Architecture")
@@ -682,156 +1301,257 @@ class QuantumIntegratedOptimizer:
 
         if not self.use_quantum:
             print("⚠ Using classical simulation (quantum backend unavailable)")
-            return self.optimize_architecture_classical(architecture, n_samples=1000)
+            return self.optimize_architecture_classical(architecture, n_samples=1000, seed=seed)
 
-        # QAOA parameters (will be optimized classically)
+        # QAOA parameters, tuned classically on the local simulator
         n_layers = 3
-        initial_params = np.random.random(2 * n_layers) * 2 * np.pi
+        initial_params = self.tune_qaoa_angles(architecture, n_layers)
 
-        # Create QAOA circuit
-        qc = self.create_qaoa_circuit(initial_params, architecture)
+        # QAOA circuit of the fitted cost Hamiltonian
+        qc = self.create_cost_qaoa_circuit(initial_params, architecture)
 
         print(f"\nQuantum Circuit: {qc.num_qubits} qubits, {qc.depth()} depth")
-        print(f"Running {n_shots} shots on IBM Torino...")
+        print(f"Running {n_shots} shots on {self.backend_provider.label}...")
 
         try:
-            # Run on IBM Torino
-            with Session(service=self.service, backend=self.backend) as session:
-                sampler = Sampler(session=session)
-                job = sampler.run(qc, shots=n_shots)
-                result = job.result()
-
-                print("✓ Quantum execution completed")
+            # Run on the configured backend (IBM Torino or local stand-in)
+            quasi_dists = self.backend_provider.sample(self.backend_provider.transpile(qc), shots=n_shots)
 
-                # Extract measurements
-                quasi_dists = result.quasi_dists[0]
+            print("✓ Quantum execution completed")
 
-                # Decode top measurements to designs
-                designs = []
-                for bitstring, probability in sorted(quasi_dists.items(),
-                                                    key=lambda x: x[1], reverse=True)[:100]:
-                    # Convert integer to bitstring
-                    bits = format(bitstring, f'0{qc.num_qubits}b')
-                    params = self.decode_measurement(bits)
+            # Decode top measurements to designs (one batched evaluation)
+            top = TopK(100)
+            for measurement in quasi_dists.items():
+                top.add(measurement[1], measurement)
+            top_measurements = top.items
+            params = self.decode_measurements_batch(
+                [format(bitstring, f'0{qc.num_qubits}b') for bitstring, _ in top_measurements])
+            designs = self.evaluation_cache.get_many(params, architecture)
 
-                    design = self.evaluate_design(params, architecture)
-                    designs.append(design)
-
-                print(f"✓ Evaluated {len(designs)} quantum-generated designs")
+            print(f"✓ Evaluated {len(designs)} quantum-generated designs")
 
         except Exception as e:
             print(f"⚠ Quantum execution failed: {e}")
             print("  Falling back to classical optimization")
-            return self.optimize_architecture_classical(architecture, n_samples=1000)
+            return self.optimize_architecture_classical(architecture, n_samples=1000, seed=seed)
 
         return designs
 
-    def optimize_architecture_classical(self, architecture: str, n_samples: int = 1000) -> List[SpacecraftDesign]:
-        """Classical optimization fallback using Monte Carlo + local search"""
+    def design_to_params(self, design: SpacecraftDesign) -> np.ndarray:
+        """Normalized parameter vector of a design (inverse of the decoding in evaluate_design)"""
+        return np.array([
+            (design.solar_area_cm2 - self.design_space['solar_area'][0]) /
+            (self.design_space['solar_area'][1] - self.design_space['solar_area'][0]),
+            (design.solar_efficiency - self.design_space['solar_eff'][0]) /
+            (self.design_space['solar_eff'][1] - self.design_space['solar_eff'][0]),
+            (design.battery_capacity_wh - self.design_space['battery_cap'][0]) /
+            (self.design_space['battery_cap'][1] - self.design_space['battery_cap'][0]),
+            self.design_space['comm_type'].index(design.comm_type) /
+            (len(self.design_space['comm_type']) - 1),
+            (design.tx_power_w - self.design_space['tx_power'][0]) /
+            (self.design_space['tx_power'][1] - self.design_space['tx_power'][0]),
+            (design.tx_aperture_m - self.design_space['tx_aperture'][0]) /
+            (self.design_space['tx_aperture'][1] - self.design_space['tx_aperture'][0]),
+            (design.modulation_efficiency - self.design_space['mod_eff'][0]) /
+            (self.design_space['mod_eff'][1] - self.design_space['mod_eff'][0]),
+            (design.structural_mass_g - self.design_space['struct_mass'][0]) /
+            (self.design_space['struct_mass'][1] - self.design_space['struct_mass'][0]),
+            (design.thermal_mass_g - self.design_space['thermal_mass'][0]) /
+            (self.design_space['thermal_mass'][1] - self.design_space['thermal_mass'][0]),
+            (design.cross_section_m2 - self.design_space['cross_section'][0]) /
+            (self.design_space['cross_section'][1] - self.design_space['cross_section'][0])
+        ])
+
+    def refine_design(self, params_init: np.ndarray, architecture: str) -> Tuple[SpacecraftDesign, int]:
+        """
+        Local L-BFGS-B refinement of one start (exact gradients)
+
+        Deterministic given params_init, so it can run in any worker process.
+        Returns (refined design, objective evaluations).
+        """
+        # Objective (negative mission value plus constraint penalty) with exact gradient
+        def objective(params):
+            value, gradient = self.refinement_objective_batch(params, architecture, penalty_weight=10)
+            return value[0], gradient[0]
 
+        result = minimize(objective, params_init, jac=True, method='L-BFGS-B',
+                          bounds=[(0, 1)] * 10, options={'maxiter': 50})
+
+        return self.evaluation_cache.get(result.x, architecture), result.nfev
+
+    def start_architecture_classical(self, architecture: str, n_samples: int = 1000,
+                                     rng: np.random.Generator = None, executor=None) -> Dict:
+        """
+        Phase 1 of the classical optimization and dispatch of phase 2
+
+        Samples with rng (legacy global np.random stream if None) and queues
+        the refinement of the top 50 candidates, on executor if given
+        (see run_integrated_optimization), lazily in-process otherwise.
+        """
         print(f"\n{'='*70}")
         print(f"CLASSICAL OPTIMIZATION: {architecture.upper()} Architecture")
         print(f"{'='*70}")
 
-        designs = []
-
-        # Random sampling
+        # Random sampling (one batched evaluation; same draws as sampling row by row)
         print(f"Phase 1: Random sampling ({n_samples} samples)...")
-        for i in range(n_samples):
-            params = np.random.random(10)
-            design = self.evaluate_design(params, architecture)
-            designs.append(design)
+        samples = np.random.random((n_samples, 10)) if rng is None else rng.random((n_samples, 10))
+        batch = self.evaluate_designs_batch(samples, architecture)
+        print(f"  Evaluated {len(batch)} designs "
+              f"({int(batch['constraints_met'].sum())} satisfy all constraints)")
 
-            if (i + 1) % 100 == 0:
-                print(f"  Progress: {i+1}/{n_samples}")
+        # Only the candidates that can reach the returned top 100 are materialized
+        designs = batch.top_k(100)
 
         # Local refinement of top candidates
-        print("\nPhase 2: Local refinement of top 50 candidates...")
-        designs_sorted = sorted(designs, key=lambda d: d.mission_value, reverse=True)
-        top_designs = designs_sorted[:50]
+        starts = [self.design_to_params(design) for design in designs[:50]]
+        if executor is None:
+            refinements = (self.refine_design(params_init, architecture) for params_init in starts)
+        else:
+            refinements = executor.map(_refine_design_task, [(architecture, params_init) for params_init in starts],
+                                       chunksize=5)
+
+        return {'architecture': architecture, 'n_sampled': len(batch), 'designs': designs,
+                'refinements': refinements}
+
+    def finish_architecture_classical(self, job: Dict) -> List[SpacecraftDesign]:
+        """Collect the phase 2 refinements of a started job and rank all designs"""
+        print(f"\nPhase 2: Local refinement of top 50 candidates ({job['architecture']})...")
 
         refined_designs = []
-        for i, design in enumerate(top_designs):
-            # Convert design to params
-            params_init = np.array([
-                (design.solar_area_cm2 - self.design_space['solar_area'][0]) /
-                (self.design_space['solar_area'][1] - self.design_space['solar_area'][0]),
-                (design.solar_efficiency - self.design_space['solar_eff'][0]) /
-                (self.design_space['solar_eff'][1] - self.design_space['solar_eff'][0]),
-                (design.battery_capacity_wh - self.design_space['battery_cap'][0]) /
-                (self.design_space['battery_cap'][1] - self.design_space['battery_cap'][0]),
-                self.design_space['comm_type'].index(design.comm_type) /
-                (len(self.design_space['comm_type']) - 1),
-                (design.tx_power_w - self.design_space['tx_power'][0]) /
-                (self.design_space['tx_power'][1] - self.design_space['tx_power'][0]),
-                (design.tx_aperture_m - self.design_space['tx_aperture'][0]) /
-                (self.design_space['tx_aperture'][1] - self.design_space['tx_aperture'][0]),
-                (design.modulation_efficiency - self.design_space['mod_eff'][0]) /
-                (self.design_space['mod_eff'][1] - self.design_space['mod_eff'][0]),
-                (design.structural_mass_g - self.design_space['struct_mass'][0]) /
-                (self.design_space['struct_mass'][1] - self.design_space['struct_mass'][0]),
-                (design.thermal_mass_g - self.design_space['thermal_mass'][0]) /
-                (self.design_space['thermal_mass'][1] - self.design_space['thermal_mass'][0]),
-                (design.cross_section_m2 - self.design_space['cross_section'][0]) /
-                (self.design_space['cross_section'][1] - self.design_space['cross_section'][0])
-            ])
-
-            # Objective function (negative because minimize)
-            def objective(params):
-                d = self.evaluate_design(params, architecture)
-                # Penalize constraint violations
-                penalty = sum(d.violation_details.values()) * 10
-                return -(d.mission_value - penalty)
-
-            # Local optimization
-            result = minimize(objective, params_init, method='L-BFGS-B',
-                            bounds=[(0, 1)] * 10, options={'maxiter': 50})
-
-            refined_design = self.evaluate_design(result.x, architecture)
+        n_refinement_evaluations = 0
+        for i, (refined_design, nfev) in enumerate(job['refinements']):
             refined_designs.append(refined_design)
+            n_refinement_evaluations += nfev
 
             if (i + 1) % 10 == 0:
                 print(f"  Progress: {i+1}/50")
 
         # Combine and return best
-        all_designs = designs + refined_designs
-        all_designs_sorted = sorted(all_designs, key=lambda d: d.mission_value, reverse=True)
+        top = TopK(100)
+        for design in job['designs'] + refined_designs:
+            top.add(design.mission_value, design)
 
-        print(f"✓ Generated {len(all_designs)} total designs")
+        print(f"  Refinement objective evaluations: {n_refinement_evaluations} (with gradients)")
+        print(f"✓ Generated {job['n_sampled'] + len(refined_designs)} total designs")
 
-        return all_designs_sorted[:100]
+        return top.items
 
-    def generate_pareto_frontier(self, designs: List[SpacecraftDesign]) -> List[SpacecraftDesign]:
-        """Extract Pareto-optimal designs (velocity vs science capability)"""
+    def optimize_architecture_classical(self, architecture: str, n_samples: int = 1000,
+                                        seed=None) -> List[SpacecraftDesign]:
+        """
+        Classical optimization fallback using Monte Carlo + local search
 
-        # Science capability = data_rate * power_margin
-        pareto_designs = []
+        seed: int or SeedSequence for the sampling (None: global np.random)
+        """
+        rng = None if seed is None else np.random.default_rng(seed)
+        job = self.start_architecture_classical(architecture, n_samples, rng=rng)
+        return self.finish_architecture_classical(job)
 
-        for design in designs:
-            science_capability = design.data_rate_bps * (1 + design.power_margin)
-            velocity = design.final_velocity_c
+    def lattice_params(self, index: np.ndarray) -> np.ndarray:
+        """
+        (N, 10) parameters of points of the 4^10 design lattice
 
-            # Check if dominated by any existing Pareto design
-            dominated = False
-            for pareto_design in pareto_designs:
-                pareto_science = pareto_design.data_rate_bps * (1 + pareto_design.power_margin)
-                pareto_velocity = pareto_design.final_velocity_c
+        Point i is the design decode_measurement produces for the 20-bit
+        measurement format(i, '020b'), so lattice and QAOA results share indices.
+        """
+        index = np.asarray(index, dtype=np.int64)
+        shifts = 2 * np.arange(9, -1, -1, dtype=np.int64)
+        return ((index[:, None] >> shifts) & 3) / 3.0
 
-                if pareto_science >= science_capability and pareto_velocity >= velocity:
-                    dominated = True
-                    break
+    def optimize_architecture_exhaustive(self, architecture: str, top_k: int = 100,
+                                         chunk_size: int = 65536) -> Dict:
+        """
+        Evaluate every design of the 4^10 lattice (all 20-bit measurements)
 
-            if not dominated:
-                # Remove any designs dominated by this one
-                pareto_designs = [d for d in pareto_designs
-                                 if not (science_capability >= d.data_rate_bps * (1 + d.power_margin)
-                                        and velocity >= d.final_velocity_c)]
-                pareto_designs.append(design)
+        Chunks of chunk_size designs are evaluated with evaluate_designs_batch;
+        only the running top-k, best feasible design and Pareto set
+        (velocity vs science capability) are kept between chunks.
+        Returns the ground-truth optimum, top_k designs and Pareto frontier.
+        """
+        n_lattice = 4 ** 10
+
+        print(f"\n{'='*70}")
+        print(f"EXHAUSTIVE LATTICE SEARCH: {architecture.upper()} Architecture")
+        print(f"{'='*70}")
+        print(f"Evaluating all {n_lattice:,} lattice designs in chunks of {chunk_size:,}...")
+
+        top = TopK(top_k)
+        front = ParetoArchive(keep_duplicates=False)
+        feasible_index, feasible_value = -1, -np.inf
+        n_feasible = 0
+
+        for start in range(0, n_lattice, chunk_size):
+            stop = min(start + chunk_size, n_lattice)
+            index = np.arange(start, stop, dtype=np.int64)
+            batch = self.evaluate_designs_batch(self.lattice_params(index), architecture)
+            value = batch['mission_value']
+
+            # Running top-k (ties resolved towards the lower lattice index)
+            top.add_batch(value, positions=index)
+
+            # Best design meeting all constraints
+            feasible = batch['constraints_met']
+            n_feasible += int(feasible.sum())
+            if feasible.any():
+                best = np.flatnonzero(feasible)[np.argmax(value[feasible])]
+                if value[best] > feasible_value:
+                    feasible_index, feasible_value = index[best], value[best]
+
+            # Running Pareto set: same objectives as generate_pareto_frontier
+            objectives = np.column_stack([batch['final_velocity_c'],
+                                          batch['data_rate_bps'] * (1 + batch['power_margin'])])
+            front.add_batch(objectives, index)
+
+        def materialize(indices):
+            batch = self.evaluate_designs_batch(self.lattice_params(indices), architecture)
+            return [batch.design(i) for i in range(len(batch))]
+
+        top_index = np.array(top.items, dtype=np.int64)
+        top_designs = materialize(top_index)
+        pareto_frontier = materialize(np.array(front.items, dtype=np.int64))
+        best_feasible = materialize(np.array([feasible_index]))[0] if feasible_index >= 0 else None
+
+        print(f"✓ Evaluated {n_lattice:,} designs ({n_feasible:,} satisfy all constraints)")
+        print(f"  Optimum: mission value {top_designs[0].mission_value:.3f} "
+              f"(lattice point {format(int(top_index[0]), '020b')})")
+        print(f"  Pareto-optimal designs: {len(pareto_frontier)}")
+
+        return {
+            'architecture': architecture,
+            'n_evaluated': n_lattice,
+            'n_feasible': n_feasible,
+            'optimum': top_designs[0],
+            'optimum_bitstring': format(int(top_index[0]), '020b'),
+            'best_feasible': best_feasible,
+            'top_designs': top_designs,
+            'pareto_frontier': pareto_frontier,
+        }
 
-        return pareto_designs
+    def generate_pareto_frontier(self, designs: List[SpacecraftDesign]) -> List[SpacecraftDesign]:
+        """Extract Pareto-optimal designs (velocity vs science capability)"""
+
+        # Science capability = data_rate * power_margin
+        objectives = np.array([[d.final_velocity_c, d.data_rate_bps * (1 + d.power_margin)]
+                               for d in designs]).reshape(-1, 2)
 
-    def run_integrated_optimization(self) -> Dict:
-        """Run complete integrated optimization across all architectures"""
+        # Repeated objective vectors: the first design is kept
+        keep = pareto_front_mask(objectives, keep_duplicates=False)
+
+        return [design for design, k in zip(designs, keep) if k]
+
+    def run_integrated_optimization(self, exhaustive: bool = False, n_workers: int = 1,
+                                    seed=None) -> Dict:
+        """
+        Run complete integrated optimization across all architectures
+
+        exhaustive: evaluate the full 4^10 design lattice per architecture
+        (optimize_architecture_exhaustive) instead of QAOA / random sampling
+        n_workers: process pool size for the classical optimizations (None:
+        os.cpu_count(), 1: serial). All architectures are sampled first and
+        their refinement starts share the pool; results equal a serial run.
+        seed: int or SeedSequence; architecture i samples with
+        SeedSequence(seed).spawn(3)[i] (None: global np.random stream)
+        """
 
         print("\n" + "="*70)
         print("QUANTUM INTEGRATED SPACECRAFT OPTIMIZATION")
@@ -839,20 +1559,52 @@ class QuantumIntegratedOptimizer:
         print(f"Mission: Alpha Centauri ({self.ALPHA_CENTAURI_DISTANCE/self.LIGHT_YEAR:.2f} LY)")
         print(f"Laser Power: {self.LASER_POWER_W/1e9:.0f} GW")
         print(f"Sail Area: {self.SAIL_AREA_M2:.1f} m²")
-        print(f"Backend: {'IBM Torino (20 qubits)' if self.use_quantum else 'Classical simulation'}")
+        if exhaustive:
+            backend = 'Exhaustive lattice search (4^10 designs)'
+        else:
+            backend = self.backend_provider.label if self.use_quantum else 'Classical simulation'
+        print(f"Backend: {backend}")
 
         all_designs = []
         architecture_results = {}
+        exhaustive_results = {}
+
+        arch_names = ['speed_priority', 'balanced', 'science_priority']
+        arch_seeds = dict.fromkeys(arch_names)
+        if seed is not None:
+            arch_seeds = dict(zip(arch_names, np.random.SeedSequence(seed).spawn(len(arch_names))))
+        parallel = not exhaustive and not self.use_quantum and n_workers != 1
 
         # Optimize each architecture
-        for arch_name in ['speed_priority', 'balanced', 'science_priority']:
-            designs = self.optimize_architecture_quantum(arch_name, n_shots=10000)
-            architecture_results[arch_name] = designs
-            all_designs.extend(designs)
+        if parallel:
+            n_workers = n_workers or os.cpu_count()
+            print(f"Process pool: {n_workers} workers")
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_refinement_worker,
+                                     initargs=(self,)) as executor:
+                jobs = [self.start_architecture_classical(
+                            arch_name, 1000,
+                            rng=None if arch_seeds[arch_name] is None else np.random.default_rng(arch_seeds[arch_name]),
+                            executor=executor)
+                        for arch_name in arch_names]
+                for arch_name, job in zip(arch_names, jobs):
+                    architecture_results[arch_name] = self.finish_architecture_classical(job)
+        else:
+            for arch_name in arch_names:
+                if exhaustive:
+                    exhaustive_results[arch_name] = self.optimize_architecture_exhaustive(arch_name)
+                    architecture_results[arch_name] = exhaustive_results[arch_name]['top_designs']
+                else:
+                    architecture_results[arch_name] = self.optimize_architecture_quantum(
+                        arch_name, n_shots=10000, seed=arch_seeds[arch_name])
+
+        for arch_name in arch_names:
+            all_designs.extend(architecture_results[arch_name])
 
         # Find global best designs
-        all_designs_sorted = sorted(all_designs, key=lambda d: d.mission_value, reverse=True)
-        top_50_designs = all_designs_sorted[:50]
+        top = TopK(50)
+        for design in all_designs:
+            top.add(design.mission_value, design)
+        top_50_designs = top.items
 
         # Filter for constraint-satisfying designs
         valid_designs = [d for d in top_50_designs if d.constraints_met]
@@ -878,9 +1630,14 @@ class QuantumIntegratedOptimizer:
         print(f"Constraint-satisfying designs: {len(valid_designs)}")
         print(f"Pareto-optimal designs: {len(pareto_frontier)}")
 
+        self.evaluation_cache.flush()
+        cache_stats = self.evaluation_cache.stats()
+        print(f"Evaluation cache: {cache_stats['hits'] + cache_stats['disk_hits']} hits, "
+              f"{cache_stats['misses']} misses ({cache_stats['hit_rate']*100:.1f}% hit rate)")
+
         results = {
             'timestamp': datetime.now().isoformat(),
-            'backend': 'IBM Torino (20 qubits)' if self.use_quantum else 'Classical simulation',
+            'backend': backend,
             'mission_parameters': {
                 'destination': 'Alpha Centauri',
                 'distance_ly': self.ALPHA_CENTAURI_DISTANCE / self.LIGHT_YEAR,
@@ -894,12 +1651,40 @@ class QuantumIntegratedOptimizer:
             'top_50_designs': [asdict(d) for d in top_50_designs],
             'valid_designs': [asdict(d) for d in valid_designs],
             'pareto_frontier': [asdict(d) for d in pareto_frontier],
-            'sweet_spot': asdict(sweet_spot)
+            'sweet_spot': asdict(sweet_spot),
+            'evaluation_cache': cache_stats
         }
 
+        if exhaustive:
+            results['exhaustive'] = {
+                arch: {
+                    'n_evaluated': result['n_evaluated'],
+                    'n_feasible': result['n_feasible'],
+                    'optimum_bitstring': result['optimum_bitstring'],
+                    'optimum': asdict(result['optimum']),
+                    'best_feasible': asdict(result['best_feasible']) if result['best_feasible'] else None,
+                    'pareto_frontier': [asdict(d) for d in result['pareto_frontier']]
+                }
+                for arch, result in exhaustive_results.items()
+            }
+
         return results
 
 
+# Process-pool workers hold one optimizer copy (sent once by the initializer)
+_WORKER_OPTIMIZER = None
+
+
+def _init_refinement_worker(optimizer):
+    global _WORKER_OPTIMIZER
+    _WORKER_OPTIMIZER = optimizer
+
+
+def _refine_design_task(task):
+    architecture, params_init = task
+    return _WORKER_OPTIMIZER.refine_design(params_init, architecture)
+
+
 def main():
     """Main execution"""
 
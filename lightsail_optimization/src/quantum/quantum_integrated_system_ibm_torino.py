@@ -21,9 +21,8 @@ Date: October 15, 2025
 Backend: IBM Torino (20 qubits real hardware)
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.circuit import Parameter
-from qiskit_ibm_runtime import QiskitRuntimeService, Session, Sampler, Options
 import numpy as np
 import json
 import os
@@ -31,6 +30,9 @@ from datetime import datetime
 from typing import Dict, List, Tuple
 from dataclasses import dataclass, asdict
 import warnings
+
+from quantum_backend import QuantumBackendProvider
+
 warnings.filterwarnings('ignore')
 
 
@@ -80,7 +82,11 @@ class QuantumIntegratedOptimizer:
     Balances power, communications, and mass constraints.
     """
 
-    def __init__(self):
+    def __init__(self, backend_provider: QuantumBackendProvider = None):
+        # IBM Quantum backend, connected on first hardware run
+        # (default: IBM Torino, or $WARPEED_QUANTUM_BACKEND)
+        self.backend_provider = backend_provider or QuantumBackendProvider()
+
         # Physical constants
         self.c = 299792458  # m/s
         self.SOLAR_CONSTANT = 1361  # W/m² at 1 AU
@@ -473,24 +479,19 @@ class QuantumIntegratedOptimizer:
 
         if use_real_backend:
             try:
-                service = QiskitRuntimeService()
-                backend = service.backend("ibm_torino")
-                print(f"✓ Connected to {backend.name} ({backend.num_qubits} qubits)")
+                provider = self.backend_provider
+                if not provider.available:
+                    raise RuntimeError(provider.error)
 
                 qc = self.create_qaoa_circuit(num_qubits=20, depth=3)
                 qc_bound = qc.assign_parameters({'γ': 0.7, 'β': 0.5})
 
                 print("\nTranspiling for IBM Torino...")
-                qc_transpiled = transpile(qc_bound, backend=backend, optimization_level=3)
+                qc_transpiled = provider.transpile(qc_bound, optimization_level=3)
                 print(f"  Depth: {qc_transpiled.depth()}, Gates: {qc_transpiled.size()}")
 
                 print("\n🚀 Executing on IBM Torino (10,000 shots)...")
-                with Session(backend=backend) as session:
-                    sampler = Sampler(session=session)
-                    job = sampler.run(qc_transpiled, shots=10000)
-                    print(f"   Job ID: {job.job_id()}")
-                    result = job.result()
-                    counts = result.quasi_dists[0]
+                counts = provider.sample(qc_transpiled, shots=10000)
 
                 print(f"✓ Execution complete! Sampled {len(counts)} configurations")
 
@@ -27,6 +27,9 @@ import json
 from datetime import datetime
 from typing import Dict, List, Tuple
 import warnings
+
+from qaoa_cost import DiagonalCost
+
 warnings.filterwarnings('ignore')
 
 # Try to import Qiskit (will simulate if not available)
@@ -161,6 +164,38 @@ class QuantumParameterSpace:
             "substrate": substrate
         }
 
+    @staticmethod
+    def decode_solutions_batch(outcomes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Decode measured outcome integers (bit i = bitstring[::-1][i]) to
+        column arrays; options are returned as indices into their tables
+        """
+        outcomes = np.asarray(outcomes, dtype=np.int64)
+        space = QuantumParameterSpace
+        fields = {}
+        idx = 0
+        for name, width in (("area", space.AREA_BITS), ("eff", space.EFF_BITS),
+                            ("cell_type", space.CELL_TYPE_BITS), ("battery", space.BATTERY_BITS),
+                            ("concentrator", space.CONCENTRATOR_BITS), ("substrate", space.SUBSTRATE_BITS)):
+            # decode_solution reads each field MSB first from the reversed bitstring
+            value = np.zeros(outcomes.shape, dtype=np.int64)
+            for j in range(width):
+                value |= ((outcomes >> (idx + j)) & 1) << (width - 1 - j)
+            fields[name] = value
+            idx += width
+
+        return {
+            "area_cm2": space.AREA_MIN + (fields["area"] / (2**space.AREA_BITS - 1)) *
+                        (space.AREA_MAX - space.AREA_MIN),
+            "efficiency_bol": space.EFF_MIN + (fields["eff"] / (2**space.EFF_BITS - 1)) *
+                              (space.EFF_MAX - space.EFF_MIN),
+            "cell_type": fields["cell_type"],
+            "battery_wh": space.BATTERY_MIN + (fields["battery"] / (2**space.BATTERY_BITS - 1)) *
+                          (space.BATTERY_MAX - space.BATTERY_MIN),
+            "concentrator": fields["concentrator"],
+            "substrate": fields["substrate"]
+        }
+
 
 class PowerSystemEvaluator:
     """Evaluate power system configurations"""
@@ -278,6 +313,43 @@ class PowerSystemEvaluator:
             }
         }
 
+    def evaluate_scores_batch(self, outcomes: np.ndarray) -> np.ndarray:
+        """Ranking score of evaluate_configuration for many measured outcome integers"""
+        config = QuantumParameterSpace.decode_solutions_batch(outcomes)
+
+        def table(options, key):
+            return np.array([options[i][key] for i in range(len(options))], dtype=float)
+
+        cells, concentrators = QuantumParameterSpace.CELL_TYPES, QuantumParameterSpace.CONCENTRATORS
+        substrates = QuantumParameterSpace.SUBSTRATES
+        cell, conc, sub = config["cell_type"], config["concentrator"], config["substrate"]
+        area_cm2, battery_wh = config["area_cm2"], config["battery_wh"]
+
+        actual_eff_bol = np.minimum(config["efficiency_bol"], table(cells, "eff")[cell])
+        eff_eol = actual_eff_bol * ((1 - table(cells, "degradation")[cell]) ** MISSION_DURATION_YEARS)
+        effective_irradiance = self.alpha_cen_irradiance * table(concentrators, "factor")[conc]
+        power_eol = effective_irradiance * (area_cm2 * 1e-4) * eff_eol
+
+        total_mass = (area_cm2 * table(cells, "mass_per_cm2")[cell] + battery_wh * 15.0 +
+                      area_cm2 * table(substrates, "mass_per_cm2")[sub] +
+                      table(concentrators, "mass")[conc] + 0.5)
+        total_cost = (area_cm2 * table(cells, "cost_per_cm2")[cell] + battery_wh * 500 +
+                      area_cm2 * table(substrates, "cost_per_cm2")[sub] +
+                      table(concentrators, "cost")[conc] + 500 + 1000)
+        power_margin = ((power_eol - PEAK_POWER) / PEAK_POWER) * 100
+
+        mass_ok = total_mass <= 5.0
+        margin_ok = power_margin >= 25.0
+        power_ok = power_eol >= PEAK_POWER
+        cost_ok = total_cost <= 200000
+        viable = mass_ok & margin_ok & power_ok & cost_ok
+
+        penalty = (np.where(mass_ok, 0.0, (total_mass - 5.0) * 100) +
+                   np.where(margin_ok, 0.0, (25.0 - power_margin) * 10) +
+                   np.where(power_ok, 0.0, (PEAK_POWER - power_eol) * 1000) +
+                   np.where(cost_ok, 0.0, (total_cost - 200000) / 100))
+        return np.where(viable, power_margin - (total_mass * 10) - (total_cost / 1000), -1000 - penalty)
+
 
 class QuantumPowerOptimizer:
     """Quantum optimizer for power system using IBM Torino"""
@@ -285,6 +357,8 @@ class QuantumPowerOptimizer:
     def __init__(self, use_real_quantum: bool = False):
         self.use_real_quantum = use_real_quantum and QISKIT_AVAILABLE
         self.evaluator = PowerSystemEvaluator()
+        self.cost = None
+        self.cost_model = None
 
         if self.use_real_quantum:
             try:
@@ -323,6 +397,26 @@ class QuantumPowerOptimizer:
 
         return qc
 
+    def tune_cost_circuit(self, n_layers: int = 2) -> QuantumCircuit:
+        """
+        QAOA circuit whose cost layers implement the Ising fit of the actual
+        configuration score, with angles tuned on the local simulator
+
+        The score of all 2^20 outcomes is evaluated once (vectorized) and
+        fitted to fields and couplings (see qaoa_cost.py).
+        """
+        if self.cost is None:
+            self.cost = DiagonalCost.from_batch(self.evaluator.evaluate_scores_batch,
+                                                n_qubits=QuantumParameterSpace.TOTAL_BITS)
+            self.cost_model = self.cost.fit_ising(max_order=2)
+            print(f"Cost Hamiltonian: {len(self.cost_model.terms)} Ising terms, "
+                  f"{self.cost_model.explained_variance:.1%} of the score variance")
+
+        gammas, betas = self.cost.angle_optimizer(self.cost_model, instance='power').optimize(n_layers)
+        print(f"QAOA angles tuned (p={n_layers}): expected score "
+              f"{self.cost.expectation(gammas, betas, self.cost_model):.1f} vs {self.cost.mean:.1f} uniform")
+        return self.cost.circuit(gammas, betas, self.cost_model)
+
     def classical_sampling(self, num_samples: int = 10000) -> List[Tuple[str, int]]:
         """Classical sampling of solution space"""
         print(f"Running classical simulation with {num_samples} samples...")
@@ -378,7 +472,7 @@ class QuantumPowerOptimizer:
         print(f"Running on IBM Torino with {shots} shots...")
 
         try:
-            qc = self.create_qaoa_circuit(QuantumParameterSpace.TOTAL_BITS)
+            qc = self.tune_cost_circuit()
 
             with Session(service=self.service, backend=self.backend) as session:
                 sampler = Sampler(session=session)
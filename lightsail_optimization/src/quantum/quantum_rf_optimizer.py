@@ -13,6 +13,9 @@ import json
 import os
 from datetime import datetime
 
+from solution_store import SolutionStore
+from topk import TopK
+
 # Physical constants
 C = 299792458  # m/s
 K_BOLTZMANN = 1.380649e-23  # J/K
@@ -59,6 +62,17 @@ class RFArchitectureOptimizer:
         # Results storage
         self.all_solutions = []
         self.quantum_samples = []
+        self.solution_store = SolutionStore()  # columnar copy of all_solutions (unsorted)
+        # Running totals over every evaluated solution, including those a
+        # bounded search does not keep
+        self.search_statistics = {
+            'evaluated': 0,
+            'feasible': 0,
+            'best_eb_n0_db': -np.inf,
+            'best_data_rate_bps': -np.inf,
+            'min_mass_g': np.inf,
+            'dsn_compatible_count': 0
+        }
 
     def compute_rf_link_budget(self, config):
         """
@@ -282,6 +296,50 @@ class RFArchitectureOptimizer:
 
         return fitness
 
+    def is_feasible(self, solution):
+        """Solution meets all mission constraints (Eb/N0, data rate, mass, ground cost)"""
+        return (solution['eb_n0_db'] >= 10.0
+                and solution['data_rate_bps'] >= 10.0
+                and solution['mass_g'] <= 3.0
+                and solution['cost_b'] <= 10.0)
+
+    def _record_solution(self, solution, top=None):
+        """
+        Keep an evaluated solution: in all_solutions and the solution store,
+        or only offer it to a running top (see classical_exhaustive_search).
+        Either way it is counted in search_statistics.
+        """
+        stats = self.search_statistics
+        stats['evaluated'] += 1
+        stats['feasible'] += int(self.is_feasible(solution))
+        stats['best_eb_n0_db'] = max(stats['best_eb_n0_db'], solution['eb_n0_db'])
+        stats['best_data_rate_bps'] = max(stats['best_data_rate_bps'], solution['data_rate_bps'])
+        stats['min_mass_g'] = min(stats['min_mass_g'], solution['mass_g'])
+        stats['dsn_compatible_count'] += int(bool(solution['metrics']['dsn_compatible']))
+
+        if top is not None:
+            top.add(solution['fitness'], solution)
+            return
+        self.all_solutions.append(solution)
+        self._store_solution(solution)
+
+    def _store_solution(self, solution):
+        """Append a solution to the columnar solution store"""
+        config = solution['config']
+        self.solution_store.append({
+            'band': config['frequency_band'],
+            'tx_power_w': config['tx_power_w'],
+            'tx_antenna_m': config['tx_antenna_m'],
+            'rx_antenna_m': config['rx_antenna_m'],
+            'eb_n0_db': solution['eb_n0_db'],
+            'data_rate_bps': solution['data_rate_bps'],
+            'mass_g': solution['mass_g'],
+            'cost_m': solution['cost_b'] * 1e9,
+            'dsn_compatible': bool(solution['metrics']['dsn_compatible']),
+            'feasible': self.is_feasible(solution),
+            'fitness': solution['fitness']
+        })
+
     def create_qaoa_circuit(self, num_qubits=20, p=2):
         """
         Create QAOA circuit for RF architecture optimization
@@ -408,7 +466,7 @@ class RFArchitectureOptimizer:
                                for k, v in metrics.items()}
                 }
 
-                self.all_solutions.append(solution)
+                self._record_solution(solution)
 
             except Exception as e:
                 print(f"Error evaluating config {bitstring}: {e}")
@@ -421,13 +479,23 @@ class RFArchitectureOptimizer:
 
         return self.all_solutions
 
-    def classical_exhaustive_search(self, num_samples=10000):
+    def classical_exhaustive_search(self, num_samples=10000, top_k=None):
         """
         Fallback: Classical random sampling of configuration space
+
+        top_k: keep only the top_k solutions (running top, see topk.py;
+        all if None), in all_solutions and in solution_store, so memory
+        stays O(top_k) however many samples are drawn.
         """
         print("\nRunning classical exhaustive search...")
         print(f"Sampling {num_samples} random configurations...")
 
+        top = None
+        if top_k is not None:
+            top = TopK(top_k)
+            for solution in self.all_solutions:
+                top.add(solution['fitness'], solution)
+
         for i in range(num_samples):
             # Generate random 20-bit string
             bitstring = ''.join([str(np.random.randint(0, 2)) for _ in range(20)])
@@ -451,7 +519,7 @@ class RFArchitectureOptimizer:
                            for k, v in metrics.items()}
                 }
 
-                self.all_solutions.append(solution)
+                self._record_solution(solution, top)
 
             except:
                 continue
@@ -459,28 +527,35 @@ class RFArchitectureOptimizer:
             if (i + 1) % 1000 == 0:
                 print(f"  Processed {i+1}/{num_samples} configurations...")
 
-        self.all_solutions.sort(key=lambda x: x['fitness'], reverse=True)
-        print(f"Completed! Found {len(self.all_solutions)} valid solutions.")
+        if top is None:
+            self.all_solutions.sort(key=lambda x: x['fitness'], reverse=True)
+        else:
+            # Store only the retained samples (earlier solutions are stored already)
+            stored = {id(solution) for solution in self.all_solutions}
+            self.all_solutions = top.items
+            for solution in self.all_solutions:
+                if id(solution) not in stored:
+                    self._store_solution(solution)
+        print(f"Completed! Kept {len(self.all_solutions)} valid solutions of {num_samples} samples.")
 
         return self.all_solutions
 
     def save_results(self, output_path):
-        """Save optimization results to JSON"""
+        """Save optimization results to JSON (and the solution store in <name>_store/)"""
 
         # Create results directory
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        store_path = os.path.splitext(output_path)[0] + '_store'
+        self.solution_store.save(store_path)
 
         # Filter top 50 solutions
         top_solutions = self.all_solutions[:50]
 
-        # Find feasible solutions (meet all constraints)
-        feasible_solutions = [
-            s for s in self.all_solutions
-            if s['eb_n0_db'] >= 10.0
-            and s['data_rate_bps'] >= 10.0
-            and s['mass_g'] <= 3.0
-            and s['cost_b'] <= 10.0
-        ]
+        # Find feasible solutions (meet all constraints) among the kept dicts;
+        # counts and statistics cover every evaluated solution, also those a
+        # bounded search did not keep
+        feasible_solutions = [s for s in self.all_solutions if self.is_feasible(s)]
+        stats = self.search_statistics
 
         # Optical system comparison (from problem statement)
         optical_system = {
@@ -496,19 +571,20 @@ class RFArchitectureOptimizer:
                 'quantum_backend': 'IBM Torino (or simulator)',
                 'num_qubits': 20,
                 'num_shots': 10000,
-                'total_solutions_evaluated': len(self.all_solutions),
-                'feasible_solutions_found': len(feasible_solutions),
+                'total_solutions_evaluated': stats['evaluated'],
+                'feasible_solutions_found': stats['feasible'],
                 'distance_ly': DISTANCE_LY,
                 'distance_m': DISTANCE_M
             },
             'optical_system_comparison': optical_system,
             'top_50_solutions': top_solutions,
             'feasible_solutions': feasible_solutions,
+            'solution_store': store_path,
             'statistics': {
-                'best_eb_n0_db': float(max([s['eb_n0_db'] for s in self.all_solutions])),
-                'best_data_rate_bps': float(max([s['data_rate_bps'] for s in self.all_solutions])),
-                'min_mass_g': float(min([s['mass_g'] for s in self.all_solutions])),
-                'dsn_compatible_count': sum([1 for s in self.all_solutions if s['metrics']['dsn_compatible']])
+                'best_eb_n0_db': float(stats['best_eb_n0_db']),
+                'best_data_rate_bps': float(stats['best_data_rate_bps']),
+                'min_mass_g': float(stats['min_mass_g']),
+                'dsn_compatible_count': stats['dsn_compatible_count']
             }
         }
 
@@ -595,7 +671,7 @@ def main():
     # Summary statistics
     feasible_count = results['metadata']['feasible_solutions_found']
     print(f"SUMMARY:")
-    print(f"  Total configurations evaluated: {len(solutions)}")
+    print(f"  Total configurations evaluated: {results['metadata']['total_solutions_evaluated']}")
     print(f"  Feasible solutions found: {feasible_count}")
     print(f"  Best Eb/N0: {results['statistics']['best_eb_n0_db']:.2f} dB")
     print(f"  Best data rate: {results['statistics']['best_data_rate_bps']:.2f} bps")
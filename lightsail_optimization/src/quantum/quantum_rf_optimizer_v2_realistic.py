@@ -16,6 +16,10 @@ import json
 import os
 from datetime import datetime
 
+from pareto import pareto_front_mask
+from solution_store import SolutionStore
+from topk import top_indices
+
 # Physical constants
 C = 299792458  # m/s
 K_BOLTZMANN = 1.380649e-23  # J/K
@@ -54,6 +58,8 @@ class RealisticRFOptimizer:
         self.feed_loss_db = 0.8  # Good design
 
         self.all_solutions = []
+        self.failed_configurations = []
+        self.solution_store = SolutionStore()
 
     def compute_link_budget(self, config):
         """Detailed link budget calculation"""
@@ -172,8 +178,111 @@ class RealisticRFOptimizer:
 
         return effective_eb_n0_db, coded_rate, total_mass_g, ground_cost_m, metrics
 
-    def exhaustive_search(self):
-        """Exhaustive search over realistic parameter space"""
+    def link_budget_tensor(self):
+        """
+        compute_link_budget and the search fitness for every combination at once
+
+        The link budget is additive in dB, with each term depending on one or
+        two axes; per-axis contribution vectors are combined by broadcasting
+        over axes (band, tx_power, tx_antenna, rx_antenna, modulation, fec).
+        Returns the axis values and full-shape arrays of the metrics.
+        """
+        band_names = list(self.freq_bands.keys())
+        mod_names = list(self.modulation_schemes.keys())
+        fec_names = list(self.fec_schemes.keys())
+        bands = [self.freq_bands[name] for name in band_names]
+        mods = [self.modulation_schemes[name] for name in mod_names]
+        fecs = [self.fec_schemes[name] for name in fec_names]
+
+        def axis(values, position):
+            """Vector along one of the six axes"""
+            shape = [1] * 6
+            shape[position] = -1
+            return np.asarray(values, dtype=float).reshape(shape)
+
+        wavelength = axis([band['wavelength_m'] for band in bands], 0)
+        freq_hz = axis([band['freq_ghz'] * 1e9 for band in bands], 0)
+        tx_power_w = axis(self.tx_power_range, 1)
+        tx_antenna_m = axis(self.tx_antenna_range, 2)
+        rx_antenna_m = axis(self.rx_antenna_range, 3)
+        bits_per_symbol = axis([mod['bits_per_symbol'] for mod in mods], 4)
+        required_ebn0_db = axis([mod['required_ebn0_db'] for mod in mods], 4)
+        code_rate = axis([fec['code_rate'] for fec in fecs], 5)
+        coding_gain_db = axis([fec['coding_gain_db'] for fec in fecs], 5)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # dB contributions: (band, tx_antenna), tx_power, band, (band, rx_antenna)
+            tx_gain_db = 10 * np.log10(self.antenna_efficiency * (np.pi * tx_antenna_m / wavelength)**2)
+            tx_power_dbw = 10 * np.log10(tx_power_w)
+            eirp_dbw = tx_power_dbw + tx_gain_db - self.feed_loss_db
+            path_loss_db = 20 * np.log10(4 * np.pi * DISTANCE_M / wavelength)
+            rx_gain_db = 10 * np.log10(self.antenna_efficiency * (np.pi * rx_antenna_m / wavelength)**2)
+            atmos_loss_db = axis([band['atmos_loss_db'] for band in bands], 0)
+            rx_power_dbw = eirp_dbw - path_loss_db + rx_gain_db - atmos_loss_db
+
+            # Noise (band) and coded data rate (band, modulation, fec)
+            system_temp_k = 2.7 + axis([band['galactic_noise_k'] for band in bands], 0) + 20
+            n0_dbw_hz = 10 * np.log10(K_BOLTZMANN * system_temp_k)
+            bandwidth_hz = freq_hz * 0.001
+            coded_rate = bandwidth_hz / 1.2 * bits_per_symbol * code_rate
+            eb_n0_db = np.where(coded_rate > 0, rx_power_dbw - 10 * np.log10(coded_rate) - n0_dbw_hz, -999.0)
+            effective_eb_n0_db = np.where(coded_rate > 0, eb_n0_db + coding_gain_db, -999.0)
+            margin_db = effective_eb_n0_db - required_ebn0_db
+
+            # Spacecraft mass (tx_power, tx_antenna), DC power, ground segment (rx_antenna)
+            total_mass_g = (tx_power_w / self.amp_efficiency) * 2.0 + np.pi * (tx_antenna_m/2)**2 * 50 + 50 + 20
+            dc_power_w = tx_power_w / self.amp_efficiency
+            dsn_compatible = rx_antenna_m <= 70
+            ground_cost_m = np.where(dsn_compatible, 0.0, 100e6 * (rx_antenna_m / 70)**2)
+
+            fitness = (effective_eb_n0_db * 20 + np.log10(coded_rate + 1) * 10 - total_mass_g * 0.1
+                       - ground_cost_m / 1e8 + np.where(dsn_compatible, 100, 0))
+
+        shape = (len(bands), len(self.tx_power_range), len(self.tx_antenna_range),
+                 len(self.rx_antenna_range), len(mods), len(fecs))
+        metrics = {
+            'eirp_dbw': eirp_dbw,
+            'path_loss_db': path_loss_db,
+            'rx_power_dbw': rx_power_dbw,
+            'system_temp_k': system_temp_k,
+            'g_over_t_db': rx_gain_db - 10 * np.log10(system_temp_k),
+            'bandwidth_hz': bandwidth_hz,
+            'coded_data_rate_bps': coded_rate,
+            'eb_n0_db': eb_n0_db,
+            'effective_eb_n0_db': effective_eb_n0_db,
+            'margin_db': margin_db,
+            'ber': np.select([margin_db >= 3, margin_db >= 0, margin_db >= -3], [1e-9, 1e-6, 1e-3], 1e-1),
+            'tx_antenna_gain_db': tx_gain_db,
+            'rx_antenna_gain_db': rx_gain_db,
+            'total_mass_g': total_mass_g,
+            'dc_power_w': dc_power_w,
+            'ground_cost_m': ground_cost_m,
+            'dsn_compatible': dsn_compatible.astype(int),
+            'fitness': fitness,
+            'feasible': ((effective_eb_n0_db >= 9.0) & (coded_rate >= 10.0) & (total_mass_g <= 500.0) &
+                         (dc_power_w <= 200.0) & (ground_cost_m <= 10e9))
+        }
+        metrics = {key: np.broadcast_to(value, shape) for key, value in metrics.items()}
+
+        return {
+            'axes': {
+                'frequency_band': band_names,
+                'tx_power_w': list(self.tx_power_range),
+                'tx_antenna_m': list(self.tx_antenna_range),
+                'rx_antenna_m': list(self.rx_antenna_range),
+                'modulation': mod_names,
+                'fec': fec_names
+            },
+            'metrics': metrics
+        }
+
+    def exhaustive_search(self, top_k=None):
+        """
+        Exhaustive search over realistic parameter space
+
+        Every combination goes to solution_store; only the top_k by fitness
+        (all if None) are materialized as solution dicts, best first.
+        """
 
         print("="*100)
         print("REALISTIC RF ARCHITECTURE OPTIMIZATION")
@@ -184,102 +293,123 @@ class RealisticRFOptimizer:
         print(f"RX Antenna options: {self.rx_antenna_range}")
         print("="*100)
 
-        total_configs = 0
-        feasible_configs = 0
-
-        for band_name in self.freq_bands.keys():
-            for tx_power in self.tx_power_range:
-                for tx_antenna in self.tx_antenna_range:
-                    for rx_antenna in self.rx_antenna_range:
-                        for mod_name in self.modulation_schemes.keys():
-                            for fec_name in self.fec_schemes.keys():
-
-                                config = {
-                                    'frequency_band': band_name,
-                                    'tx_power_w': tx_power,
-                                    'tx_antenna_m': tx_antenna,
-                                    'rx_antenna_m': rx_antenna,
-                                    'modulation': mod_name,
-                                    'fec': fec_name
-                                }
-
-                                try:
-                                    eb_n0, data_rate, mass_g, cost_m, metrics = self.compute_link_budget(config)
-
-                                    # Feasibility check
-                                    dc_power_w = metrics['dc_power_w']
-                                    feasible = (
-                                        eb_n0 >= 9.0 and  # Slightly relaxed
-                                        data_rate >= 10.0 and
-                                        mass_g <= 500.0 and
-                                        dc_power_w <= 200.0 and
-                                        cost_m <= 10e9  # $10B
-                                    )
-
-                                    if feasible:
-                                        feasible_configs += 1
-
-                                    # Calculate fitness
-                                    fitness = 0
-                                    fitness += eb_n0 * 20  # High priority
-                                    fitness += np.log10(data_rate + 1) * 10
-                                    fitness -= mass_g * 0.1
-                                    fitness -= cost_m / 1e8
-
-                                    if metrics['dsn_compatible']:
-                                        fitness += 100  # Big bonus
-
-                                    solution = {
-                                        'config': config,
-                                        'eb_n0_db': float(eb_n0),
-                                        'data_rate_bps': float(data_rate),
-                                        'mass_g': float(mass_g),
-                                        'cost_m': float(cost_m),
-                                        'metrics': metrics,
-                                        'fitness': float(fitness),
-                                        'feasible': int(feasible)  # Convert bool to int for JSON
-                                    }
-
-                                    self.all_solutions.append(solution)
-                                    total_configs += 1
-
-                                except:
-                                    continue
-
-                if total_configs % 500 == 0:
-                    print(f"  Evaluated {total_configs} configurations, {feasible_configs} feasible...")
-
+        # Each search replaces the results of the previous one
+        self.all_solutions = []
+        self.failed_configurations = []
+        self.solution_store = SolutionStore()
+
+        # All combinations at once; flattened in loop order (band outermost, fec innermost)
+        tensor = self.link_budget_tensor()
+        axes = tensor['axes']
+        columns = {key: value.ravel() for key, value in tensor['metrics'].items()}
+        combos = np.stack(np.unravel_index(np.arange(columns['fitness'].size), tensor['metrics']['fitness'].shape),
+                          axis=1)
+
+        # Combinations whose link budget is not finite (e.g. zero power or aperture)
+        checked = ('effective_eb_n0_db', 'coded_data_rate_bps', 'total_mass_g', 'ground_cost_m', 'fitness')
+        finite = np.logical_and.reduce([np.isfinite(columns[key]) for key in checked])
+
+        for i in np.flatnonzero(~finite):
+            config = {key: axes[key][j] for key, j in zip(axes, combos[i])}
+            bad = [key for key in checked if not np.isfinite(columns[key][i])]
+            self.failed_configurations.append({'config': config, 'reason': f"non-finite {', '.join(bad)}"})
+
+        # Columnar copy of the remaining combinations (see solution_store.py)
+        keep = np.flatnonzero(finite)
+        self.solution_store.extend({
+            'band': np.array(axes['frequency_band'])[combos[keep, 0]],
+            'tx_power_w': np.asarray(axes['tx_power_w'])[combos[keep, 1]],
+            'tx_antenna_m': np.asarray(axes['tx_antenna_m'])[combos[keep, 2]],
+            'rx_antenna_m': np.asarray(axes['rx_antenna_m'])[combos[keep, 3]],
+            'eb_n0_db': columns['effective_eb_n0_db'][keep],
+            'data_rate_bps': columns['coded_data_rate_bps'][keep],
+            'mass_g': columns['total_mass_g'][keep],
+            'cost_m': columns['ground_cost_m'][keep],
+            'dsn_compatible': columns['dsn_compatible'][keep],
+            'feasible': columns['feasible'][keep],
+            'fitness': columns['fitness'][keep]
+        })
+
+        # Ranked by fitness on the column (ties: loop order), materializing only the requested top
+        if top_k is None:
+            keep = keep[np.argsort(-columns['fitness'][keep], kind='stable')]
+        else:
+            keep = keep[top_indices(columns['fitness'][keep], top_k)]
+
+        # Solution dicts of the selected combinations (row-wise over Python lists)
+        heritage = [self.freq_bands[name]['heritage'] for name in axes['frequency_band']]
+        metric_keys = [key for key in columns if key not in ('fitness', 'feasible')]
+        config_keys = list(axes)
+        rows = zip(combos[keep].tolist(), zip(*(columns[key][keep].tolist() for key in metric_keys)),
+                   columns['fitness'][keep].tolist(), columns['feasible'][keep].tolist())
+        for combo, metric_values, fitness, feasible in rows:
+            metrics = dict(zip(metric_keys, metric_values))
+            metrics['heritage'] = heritage[combo[0]]
+            self.all_solutions.append({
+                'config': {key: axes[key][j] for key, j in zip(config_keys, combo)},
+                'eb_n0_db': metrics['effective_eb_n0_db'],
+                'data_rate_bps': metrics['coded_data_rate_bps'],
+                'mass_g': metrics['total_mass_g'],
+                'cost_m': metrics['ground_cost_m'],
+                'metrics': metrics,
+                'fitness': fitness,
+                'feasible': int(feasible)  # Convert bool to int for JSON
+            })
+
+        total_configs = int(finite.sum())
+        feasible_configs = int(np.sum(columns['feasible'] & finite))
         print(f"\nCompleted! Total: {total_configs}, Feasible: {feasible_configs}")
-
-        # Sort by fitness
-        self.all_solutions.sort(key=lambda x: x['fitness'], reverse=True)
+        if self.failed_configurations:
+            print(f"⚠ {len(self.failed_configurations)} combinations failed and were excluded, e.g. "
+                  f"{self.failed_configurations[0]['config']}: {self.failed_configurations[0]['reason']}")
 
         return self.all_solutions
 
     def save_results(self, output_path):
-        """Save results"""
+        """Save results (JSON summary, plus the queryable solution store in <name>_store/)"""
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        store_path = os.path.splitext(output_path)[0] + '_store'
+        self.solution_store.save(store_path)
+        store = self.solution_store
 
+        # Solution lists cover the materialized dicts; counts and statistics
+        # cover every combination (solution store)
         feasible = [s for s in self.all_solutions if s['feasible']]
         top_50 = self.all_solutions[:50]
 
+        # Pareto set: Eb/N0 and data rate vs mass and cost
+        # (among feasible solutions, or all of them if none is feasible)
+        pareto_pool = feasible if feasible else self.all_solutions
+        pareto = []
+        if pareto_pool:
+            objectives = np.array([[s['eb_n0_db'], s['data_rate_bps'], -s['mass_g'], -s['cost_m']]
+                                   for s in pareto_pool])
+            pareto = [s for s, k in zip(pareto_pool, pareto_front_mask(objectives)) if k]
+
         results = {
             'metadata': {
                 'timestamp': datetime.now().isoformat(),
                 'optimization_type': 'REALISTIC RF with relaxed constraints',
-                'total_configurations': len(self.all_solutions),
-                'feasible_configurations': len(feasible),
+                'total_configurations': len(store),
+                'feasible_configurations': int(store['feasible'].sum()),
+                'failed_configurations': len(self.failed_configurations),
                 'distance_ly': DISTANCE_LY,
                 'distance_m': DISTANCE_M
             },
             'top_50_solutions': top_50,
             'all_feasible_solutions': feasible,
+            'pareto_frontier': pareto,
+            'failed_configurations': self.failed_configurations,
+            'solution_store': store_path,
             'statistics': {
-                'best_eb_n0_db': max([s['eb_n0_db'] for s in self.all_solutions]),
-                'best_data_rate_bps': max([s['data_rate_bps'] for s in self.all_solutions]),
-                'lowest_mass_feasible': min([s['mass_g'] for s in feasible]) if feasible else None,
-                'dsn_compatible_feasible': len([s for s in feasible if s['metrics']['dsn_compatible']])
+                'best_eb_n0_db': float(store['eb_n0_db'].max()),
+                'best_data_rate_bps': float(store['data_rate_bps'].max()),
+                'lowest_mass_feasible': float(store['mass_g'][store['feasible']].min())
+                                        if store['feasible'].any() else None,
+                'dsn_compatible_feasible': int(np.sum(store['feasible'] & store['dsn_compatible'])),
+                'pareto_solutions': len(pareto),
+                'pareto_scope': 'feasible' if feasible else 'all'
             }
         }
 
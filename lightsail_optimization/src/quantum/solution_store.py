@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Columnar Solution Store for the RF/Comm Sweeps
+==============================================
+
+Evaluated configurations kept as typed columns instead of nested dicts, so
+sweeps of any size can be filtered, ranked and grouped without building or
+deserializing one dict per solution.
+
+- SOLUTION_COLUMNS: the shared schema (band is stored as category codes)
+- SolutionStore:    append rows or column batches; filter / top_k /
+                    group_by return views over the same columns; rows()
+                    materializes dicts only for the selected solutions
+- Persistence:      one .npy file per column plus store.json (schema,
+                    categories, row count); open() memory-maps the columns,
+                    so a query only reads the pages it touches
+
+store = SolutionStore.open('results/realistic_rf_store')
+light = store.filter(store['feasible'] & (store['mass_g'] <= 500))
+best = {band: group.top_k(1).rows()[0] for band, group in light.group_by('band').items()}
+"""
+
+import json
+import os
+import numpy as np
+from typing import Dict, List
+
+from topk import top_indices
+
+# Column name -> dtype ('category': string stored as int16 codes)
+SOLUTION_COLUMNS = {
+    'band': 'category',
+    'tx_power_w': np.float64,
+    'tx_antenna_m': np.float64,
+    'rx_antenna_m': np.float64,
+    'eb_n0_db': np.float64,
+    'data_rate_bps': np.float64,
+    'mass_g': np.float64,
+    'cost_m': np.float64,          # ground segment cost ($)
+    'dsn_compatible': np.bool_,
+    'feasible': np.bool_,
+    'fitness': np.float64,
+}
+
+METADATA_FILE = 'store.json'
+
+# Appended rows are buffered as dicts and packed into column chunks at this size
+FLUSH_ROWS = 4096
+
+
+class SolutionStore:
+    """
+    Typed columns of evaluated configurations
+
+    schema: column name -> dtype or 'category' (default SOLUTION_COLUMNS)
+    """
+
+    def __init__(self, schema: Dict = None):
+        self.schema = dict(SOLUTION_COLUMNS if schema is None else schema)
+        self.categories: Dict[str, List[str]] = {name: [] for name, dtype in self.schema.items()
+                                                 if dtype == 'category'}
+        self._chunks: Dict[str, List[np.ndarray]] = {name: [] for name in self.schema}
+        self._pending: List[Dict] = []
+        self._columns: Dict[str, np.ndarray] = None
+        self._index: np.ndarray = None
+        self._parent: 'SolutionStore' = None
+        self._read_only = False
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def _check_writable(self):
+        if self._parent is not None or self._read_only:
+            raise ValueError("Views and opened stores are read-only")
+
+    def _encode(self, name: str, values) -> np.ndarray:
+        if self.schema[name] != 'category':
+            return np.asarray(values, dtype=self.schema[name])
+        categories = self.categories[name]
+        lookup = {value: code for code, value in enumerate(categories)}
+        codes = np.empty(len(values), dtype=np.int16)
+        for i, value in enumerate(values):
+            if value not in lookup:
+                lookup[value] = len(categories)
+                categories.append(value)
+            codes[i] = lookup[value]
+        return codes
+
+    def extend(self, columns: Dict[str, np.ndarray]):
+        """Append a batch of rows given as equal-length columns (all schema columns)"""
+        self._check_writable()
+        self._flush_pending()
+        missing = set(self.schema) - set(columns)
+        if missing:
+            raise KeyError(f"Missing columns: {sorted(missing)}")
+        encoded = {name: np.atleast_1d(self._encode(name, np.atleast_1d(columns[name]).tolist()
+                                                    if self.schema[name] == 'category' else columns[name]))
+                   for name in self.schema}
+        lengths = {len(values) for values in encoded.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        for name, values in encoded.items():
+            self._chunks[name].append(values)
+        self._columns = None
+
+    def append(self, row: Dict):
+        """Append one row (buffered up to FLUSH_ROWS rows; schema columns only)"""
+        self._check_writable()
+        self._pending.append({name: row[name] for name in self.schema})
+        self._columns = None
+        if len(self._pending) >= FLUSH_ROWS:
+            self._flush_pending()
+
+    def _flush_pending(self):
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self.extend({name: [row[name] for row in pending] for name in self.schema})
+
+    def _consolidate(self) -> Dict[str, np.ndarray]:
+        if self._parent is not None:
+            return self._parent._consolidate()
+        if self._columns is None:
+            if self._pending:
+                self._flush_pending()
+            self._columns = {}
+            for name in self.schema:
+                dtype = np.int16 if self.schema[name] == 'category' else self.schema[name]
+                chunks = self._chunks[name]
+                self._columns[name] = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+            self._chunks = {name: [column] for name, column in self._columns.items()}
+        return self._columns
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        if self._index is not None:
+            return len(self._index)
+        columns = self._consolidate()
+        return len(next(iter(columns.values()))) if columns else 0
+
+    def codes(self, name: str) -> np.ndarray:
+        """Raw column values of the rows in this store (category codes for categories)"""
+        column = self._consolidate()[name]
+        return np.asarray(column if self._index is None else column[self._index])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Column values of the rows in this store (strings for categories)"""
+        values = self.codes(name)
+        if self.schema[name] == 'category':
+            return np.array(self.categories[name], dtype=object)[values]
+        return values
+
+    @property
+    def row_ids(self) -> np.ndarray:
+        """Positions of this store's rows in the underlying columns"""
+        return np.arange(len(self)) if self._index is None else self._index
+
+    def _view(self, index: np.ndarray) -> 'SolutionStore':
+        view = SolutionStore.__new__(SolutionStore)
+        view.schema = self.schema
+        view.categories = self.categories
+        view._chunks = None
+        view._pending = []
+        view._columns = None
+        view._index = np.asarray(index, dtype=np.int64)
+        view._parent = self if self._parent is None else self._parent
+        view._read_only = True
+        return view
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def filter(self, mask: np.ndarray) -> 'SolutionStore':
+        """View of the rows where mask (over this store's rows) is True"""
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError(f"mask must have shape ({len(self)},), got {mask.shape}")
+        return self._view(self.row_ids[mask])
+
+    def top_k(self, k: int, key: str = 'fitness', largest: bool = True) -> 'SolutionStore':
+        """View of the k rows with the largest (or smallest) key, best first (ties: earlier row)"""
+        return self._view(self.row_ids[top_indices(self.codes(key), k, largest)])
+
+    def group_by(self, key: str) -> Dict:
+        """Views per distinct value of key, in order of first appearance"""
+        values = self.codes(key)
+        if len(values) == 0:
+            return {}
+        distinct, first, inverse = np.unique(values, return_index=True, return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.cumsum(np.bincount(inverse, minlength=len(distinct)))[:-1]
+        groups = dict(zip(distinct.tolist(), np.split(self.row_ids[order], bounds)))
+        labels = self.categories[key] if self.schema[key] == 'category' else None
+        return {(labels[value] if labels else value): self._view(groups[value])
+                for value in distinct[np.argsort(first)].tolist()}
+
+    def rows(self, limit: int = None) -> List[Dict]:
+        """Flat dicts (JSON-ready Python values) of the first limit rows"""
+        n = len(self) if limit is None else min(limit, len(self))
+        columns = {name: self[name][:n].tolist() for name in self.schema}
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: str):
+        """Write the store's rows to a directory (one .npy file per column)"""
+        os.makedirs(path, exist_ok=True)
+        for name in self.schema:
+            np.save(os.path.join(path, f'{name}.npy'), self.codes(name))
+        metadata = {
+            'n_rows': len(self),
+            'schema': {name: dtype if dtype == 'category' else np.dtype(dtype).str
+                       for name, dtype in self.schema.items()},
+            'categories': self.categories
+        }
+        with open(os.path.join(path, METADATA_FILE), 'w') as f:
+            json.dump(metadata, f, indent=2)
+
+    @classmethod
+    def open(cls, path: str) -> 'SolutionStore':
+        """Read-only store over memory-mapped columns of a saved store"""
+        with open(os.path.join(path, METADATA_FILE)) as f:
+            metadata = json.load(f)
+        schema = {name: dtype if dtype == 'category' else np.dtype(dtype)
+                  for name, dtype in metadata['schema'].items()}
+        store = cls(schema)
+        store.categories = metadata['categories']
+        # (numpy cannot memory-map zero-length arrays)
+        mmap_mode = 'r' if metadata['n_rows'] > 0 else None
+        store._columns = {name: np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+                          for name in schema}
+        store._read_only = True
+        store._chunks = {name: [column] for name, column in store._columns.items()}
+        return store
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Bounded Top-k Selection for the Optimizer Sweeps
+================================================
+
+Shared best-k handling for the comm, RF and integrated optimizers, which
+only ever keep their 50-1000 best results. Candidates are ranked by one
+score, MAXIMIZED by default (largest=False to minimize, e.g. mass).
+
+- top_indices:  indices of the k best values of an array, best first
+                (argpartition + a sort of the k candidates, O(N + k log k))
+- TopK:         streaming selection for candidates produced one at a time
+                or in chunks; holds at most k (score, item) pairs in a heap,
+                so memory is O(k) however long the sweep runs
+
+Ties go to the earlier candidate (lower index / arrival order), i.e. the
+result equals the head of a stable sort of everything seen; pass
+positions to break ties by another order (e.g. enumeration rank when
+chunks arrive out of order). NaN scores are never selected.
+"""
+
+import heapq
+import numpy as np
+from typing import Any, List
+
+
+def top_indices(values, k: int, largest: bool = True, positions=None) -> np.ndarray:
+    """
+    Indices of the k best entries of a 1-D array, best first (ties: lower
+    index, or lower positions if given)
+    """
+    keys = np.asarray(values, dtype=float).ravel()
+    keys = -keys if largest else keys
+    index = np.arange(len(keys))
+    positions = index if positions is None else np.asarray(positions).ravel()
+    valid = ~np.isnan(keys)
+    if not valid.all():
+        index, keys, positions = index[valid], keys[valid], positions[valid]
+
+    k = min(k, len(keys))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(keys):
+        kth = np.partition(keys, k - 1)[k - 1]
+        candidates = np.flatnonzero(keys <= kth)
+    else:
+        candidates = np.arange(len(keys))
+    order = candidates[np.lexsort((positions[candidates], keys[candidates]))][:k]
+    return index[order]
+
+
+class TopK:
+    """
+    Best k of streamed candidates
+
+    top = TopK(50)
+    top.add(score, item)                 # single candidate
+    top.add_batch(scores, items)         # chunk of M candidates
+    top.items, top.scores                # current best k, best first
+
+    item defaults to the candidate's position: its arrival order (n_seen
+    before it) unless positions are given.
+    """
+
+    def __init__(self, k: int, largest: bool = True):
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k}")
+        self.k = k
+        self.largest = largest
+        self.n_seen = 0
+        # Min-heap of (key, -position, item): the root is the worst kept candidate
+        self._heap = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def full(self) -> bool:
+        return len(self._heap) == self.k
+
+    @property
+    def threshold(self) -> float:
+        """Score a new candidate must beat to enter (worst kept score once full)"""
+        if not self.full:
+            return -np.inf if self.largest else np.inf
+        key = self._heap[0][0]
+        return key if self.largest else -key
+
+    def _offer(self, key: float, position: int, item: Any) -> bool:
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (key, -position, item))
+            return True
+        if (key, -position) > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, (key, -position, item))
+            return True
+        return False
+
+    def add(self, score: float, item: Any = None, position: int = None) -> bool:
+        """Offer one candidate; returns True if it entered the top k"""
+        position = self.n_seen if position is None else int(position)
+        self.n_seen += 1
+        score = float(score)
+        if np.isnan(score):
+            return False
+        return self._offer(score if self.largest else -score, position,
+                           position if item is None else item)
+
+    def add_batch(self, scores, items=None, positions=None) -> int:
+        """
+        Offer a chunk of candidates (items and positions indexable like
+        scores); returns how many entered. Only the chunk's own best k that
+        reach the current threshold are offered to the heap.
+        """
+        scores = np.asarray(scores, dtype=float).ravel()
+        if positions is None:
+            positions = np.arange(self.n_seen, self.n_seen + len(scores))
+        positions = np.asarray(positions, dtype=np.int64).ravel()
+        self.n_seen += len(scores)
+
+        keys = scores if self.largest else -scores
+        candidates = np.flatnonzero(keys >= self._heap[0][0]) if self.full else np.arange(len(keys))
+        candidates = candidates[top_indices(keys[candidates], self.k, positions=positions[candidates])]
+
+        entered = 0
+        for i in candidates.tolist():
+            position = int(positions[i])
+            if not self._offer(float(keys[i]), position, position if items is None else items[i]):
+                break  # candidates are best first: none of the rest can enter
+            entered += 1
+        return entered
+
+    def _ordered(self) -> List[tuple]:
+        return sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+
+    @property
+    def items(self) -> List[Any]:
+        """Kept items, best first"""
+        return [entry[2] for entry in self._ordered()]
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Kept scores, best first"""
+        keys = np.array([entry[0] for entry in self._ordered()], dtype=float)
+        return keys if self.largest else -keys
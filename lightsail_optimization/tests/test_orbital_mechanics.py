@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+ORBITAL MECHANICS TEST SUITE
+Tests the trajectory simulator in code/orbital_mechanics_simulation.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import contextlib
+import csv
+import json
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code'))
+
+import orbital_mechanics_simulation as om
+import orbital_monte_carlo as mc
+import trajectory_store as ts
+import orbital_benchmarks as ob
+
+def _quiet(func, *args, **kwargs):
+    """Run a simulator function with its console report suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def test_batch_rhs_matches_scalar():
+    """Test vectorized equations of motion against the scalar RHS"""
+    print("\n" + "="*70)
+    print("TEST 1: Batched RHS Parity (equations_of_motion_batch)")
+    print("="*70)
+
+    rng = np.random.default_rng(42)
+    states = om.nominal_initial_state() + rng.normal(size=(8, 6)) * [1e6, 1e6, 1e6, 1e3, 1e8, 1e3]
+    states[0, 3:6] = 0.0  # At rest: tangential push branch
+
+    worst = 0.0
+    for t in (0.0, 600.0, 2*om.acceleration_time):
+        for phase in (True, False):
+            expected = np.array([om.equations_of_motion(t, s, acceleration_phase=phase) for s in states])
+            actual = om.equations_of_motion_batch(t, states, acceleration_phase=phase)
+            worst = max(worst, np.max(np.abs(actual - expected) / np.maximum(np.abs(expected), 1e-30)))
+
+    print(f"  Worst relative deviation: {worst:.2e}")
+
+    assert worst < 1e-12, f"FAIL: Batched RHS deviates by {worst:.2e}"
+
+    print(f"\n  ✓ PASS: Batched RHS matches scalar physics")
+    return True
+
+def test_ensemble_acceleration_phase():
+    """Test ensemble acceleration phase reproduces the single-trajectory result"""
+    print("\n" + "="*70)
+    print("TEST 2: Ensemble Acceleration Phase")
+    print("="*70)
+
+    reference = _quiet(om.simulate_acceleration_phase)
+    states0 = np.repeat(om.nominal_initial_state()[None, :], 4, axis=0)
+    states0[1:, 4] += np.array([-10.0, 0.0, 10.0])  # Launch velocity dispersion [m/s]
+
+    ensemble = _quiet(om.simulate_acceleration_phase_ensemble, states0)
+
+    print(f"  Reference v_final: {reference['v_final_c']:.9f}c")
+    print(f"  Ensemble v_final:  {ensemble['v_final_c'][0]:.9f}c")
+    print(f"  Stacked position shape: {ensemble['position'].shape}")
+
+    assert ensemble['position'].shape == (4, 3, 1000), "FAIL: Wrong stacked shape"
+    assert abs(ensemble['v_final_c'][0] - reference['v_final_c']) < 1e-7, "FAIL: Ensemble disagrees with DOP853"
+    assert np.all(np.diff(ensemble['v_final'][1:]) > 0), "FAIL: Dispersion not propagated"
+
+    print(f"\n  ✓ PASS: Ensemble matches nominal trajectory")
+    return True
+
+def test_ensemble_coast_phase():
+    """Test ensemble coast phase (normalized time) against simulate_coast_phase"""
+    print("\n" + "="*70)
+    print("TEST 3: Ensemble Coast Phase")
+    print("="*70)
+
+    reference_accel = _quiet(om.simulate_acceleration_phase)
+    reference = _quiet(om.simulate_coast_phase, reference_accel['final_state'])
+    ensemble = _quiet(om.simulate_coast_phase_ensemble,
+                      np.repeat(reference_accel['final_state'][None, :], 3, axis=0))
+
+    error = abs(ensemble['targeting_error_AU'][0] - reference['targeting_error_AU'])
+    print(f"  Reference targeting error: {reference['targeting_error_AU']:.6f} AU")
+    print(f"  Ensemble targeting error:  {ensemble['targeting_error_AU'][0]:.6f} AU")
+
+    assert error < 1e-3, f"FAIL: Targeting error differs by {error:.2e} AU"
+    assert np.allclose(ensemble['time'][:, -1], reference['time'][-1]), "FAIL: Coast duration differs"
+
+    print(f"\n  ✓ PASS: Ensemble coast phase matches")
+    return True
+
+def test_ephemeris_cache():
+    """Test Chebyshev ephemeris against the analytic circular orbits"""
+    print("\n" + "="*70)
+    print("TEST 4: Planetary Ephemeris Cache")
+    print("="*70)
+
+    ephemeris = om.PlanetaryEphemeris(bodies=('sun', 'earth', 'jupiter', 'saturn'),
+                                      t_end=10.0 * om.T_earth)
+    measured = ephemeris.max_interpolation_error()
+    bounds = ephemeris.error_bound()
+
+    for name in ephemeris.bodies:
+        print(f"  {name:8s} measured error: {measured[name]:.3e} m (bound {bounds[name]:.3e} m)")
+
+    # The bound includes the floating-point floor (rounding of ω·t over many orbits)
+    for name in ephemeris.bodies:
+        assert measured[name] <= bounds[name], f"FAIL: {name} exceeds error bound"
+
+    # Outside the tabulated interval the analytic orbit is used
+    t_late = 12.0 * om.T_earth
+    assert np.allclose(ephemeris.positions(t_late), ephemeris.exact_positions(t_late)), "FAIL: Fallback broken"
+
+    # Gravity with the default body list reproduces the analytic model
+    state = om.nominal_initial_state()
+    default = om.default_ephemeris()
+    for t in (0.0, 1234.5, 3.0 * om.T_earth):
+        exact = om.gravitational_acceleration(state[0:3], t)
+        cached = om.gravitational_acceleration(state[0:3], t, default)
+        assert np.allclose(cached, exact, rtol=1e-12, atol=0.0), f"FAIL: Gravity differs at t={t}"
+
+    print(f"\n  ✓ PASS: Ephemeris within error bound")
+    return True
+
+def test_encke_coast_propagator():
+    """Test Encke coast propagation against the Cowell (full-state) integration"""
+    print("\n" + "="*70)
+    print("TEST 5: Encke Coast Propagator")
+    print("="*70)
+
+    # Universal-variable Kepler propagation vs numerical two-body solution
+    mu = om.G * om.M_sun
+    r0 = np.array([om.AU, 1.4 * om.AU, 0.0])
+    v0 = np.array([-100.0, 0.5 * om.c, 0.0])
+    r_kepler, v_kepler = om.kepler_propagate(r0, v0, 1e6, mu)
+    two_body = om.solve_ivp(lambda t, y: np.concatenate([y[3:6], -mu * y[0:3] / np.linalg.norm(y[0:3])**3]),
+                            (0.0, 1e6), np.concatenate([r0, v0]), method='DOP853', rtol=1e-13, atol=1e-6)
+    kepler_error = np.linalg.norm(r_kepler - two_body.y[0:3, -1])
+    print(f"  Kepler propagation error (1e6 s): {kepler_error:.3f} m")
+    assert kepler_error < 10.0, f"FAIL: Kepler propagation off by {kepler_error:.1f} m"
+
+    accel = _quiet(om.simulate_acceleration_phase)
+    cowell = _quiet(om.simulate_coast_phase, accel['final_state'], propagator='cowell')
+    encke = _quiet(om.simulate_coast_phase, accel['final_state'], propagator='encke')
+
+    difference = abs(encke['targeting_error_AU'] - cowell['targeting_error_AU'])
+    print(f"  Cowell: {cowell['nfev']} evaluations, targeting error {cowell['targeting_error_AU']:.9f} AU")
+    print(f"  Encke:  {encke['nfev']} evaluations, targeting error {encke['targeting_error_AU']:.9f} AU")
+
+    assert difference < 1e-6, f"FAIL: Targeting error differs by {difference:.2e} AU"
+    assert encke['nfev'] < cowell['nfev'], "FAIL: Encke did not reduce RHS evaluations"
+
+    # Starting inside Jupiter's Hill sphere hands off to plain propagation
+    state = np.array([om.a_jupiter - 1e10, -3e10, 0.0, 0.0, 0.5 * om.c, 0.0])
+    near_jupiter = om.propagate_coast_encke(state, 1e6)
+    assert near_jupiter.success and near_jupiter.n_cowell_segments == 1, "FAIL: No Cowell fallback near Jupiter"
+
+    print(f"\n  ✓ PASS: Encke propagation matches Cowell")
+    return True
+
+def test_compiled_rhs_parity():
+    """Test the compiled (or fallback) RHS against equations_of_motion"""
+    print("\n" + "="*70)
+    print("TEST 6: Compiled RHS Parity")
+    print("="*70)
+
+    rng = np.random.default_rng(7)
+    states = om.nominal_initial_state() + rng.normal(size=(20, 6)) * [1e9, 1e9, 1e9, 1e3, 5e7, 1e3]
+    states[0, 3:6] = 0.0                        # At rest: tangential push
+    states[1, 3:6] = [0.0, 0.97 * om.c, 0.0]    # Inside the velocity limiter
+
+    worst = 0.0
+    for t in (0.0, 100.0, 2000.0, 1e8):
+        for phase in (True, False):
+            for state in states:
+                expected = om.equations_of_motion(t, state, acceleration_phase=phase)
+                actual = om.equations_of_motion_compiled(t, state, acceleration_phase=phase)
+                worst = max(worst, np.max(np.abs(actual - expected) / np.maximum(np.abs(expected), 1e-300)))
+
+    print(f"  Numba available: {om.NUMBA_AVAILABLE}")
+    print(f"  Worst relative deviation: {worst:.2e}")
+
+    assert worst < 1e-12, f"FAIL: Compiled RHS deviates by {worst:.2e}"
+
+    # Without Numba the wrapper must fall back to the NumPy implementation
+    available = om.NUMBA_AVAILABLE
+    om.NUMBA_AVAILABLE = False
+    try:
+        fallback = om.equations_of_motion_compiled(100.0, states[2])
+    finally:
+        om.NUMBA_AVAILABLE = available
+    assert np.array_equal(fallback, om.equations_of_motion(100.0, states[2])), "FAIL: Fallback differs"
+
+    print(f"\n  ✓ PASS: Compiled RHS matches NumPy physics")
+    return True
+
+def test_state_transition_matrix():
+    """Test STM-predicted arrival deltas against perturbed re-integrations"""
+    print("\n" + "="*70)
+    print("TEST 7: State Transition Matrix")
+    print("="*70)
+
+    ephemeris = om.default_ephemeris()
+
+    # Analytic Jacobian vs central finite differences of the RHS
+    def finite_difference_jacobian(t, state, phase):
+        J = np.zeros((6, 6))
+        for j in range(6):
+            h = 1e-6 * max(abs(state[j]), 1.0)
+            step = np.zeros(6)
+            step[j] = h
+            J[:, j] = (om.equations_of_motion(t, state + step, phase, ephemeris)
+                       - om.equations_of_motion(t, state - step, phase, ephemeris)) / (2 * h)
+        return J
+
+    cruise = om.nominal_initial_state() + [0.0, 0.0, 0.0, 0.0, 1e8, 0.0]
+    limited = np.array([1e11, 2e11, 3e9, 0.0, 0.97 * om.c, 0.0])
+    for t, state, phase in ((100.0, om.nominal_initial_state(), True), (1500.0, cruise, True),
+                            (1500.0, cruise, False), (10.0, limited, True)):
+        expected = finite_difference_jacobian(t, state, phase)
+        actual = om.equations_of_motion_jacobian(t, state, phase, ephemeris)
+        assert np.max(np.abs(actual - expected)) < 1e-6 * max(np.max(np.abs(expected[3:6])), 1e-3), \
+            f"FAIL: Jacobian mismatch at t={t}"
+
+    mission = om.mission_state_transition(ephemeris=ephemeris)
+    assert mission['success'], "FAIL: STM propagation failed"
+
+    def arrival(state0):
+        accel = om.solve_ivp(lambda t, y: om.equations_of_motion(t, y, True, ephemeris),
+                             (0.0, om.acceleration_time), state0, method='DOP853', rtol=1e-10, atol=1e-12)
+        coast = om.solve_ivp(lambda t, y: om.equations_of_motion(t, y, False, ephemeris),
+                             (0.0, mission['coast_duration']), accel.y[:, -1],
+                             method='DOP853', rtol=1e-8, atol=1e-10)
+        return coast.y[0:3, -1]
+
+    # Cross-track kicks stay small (the response to a pointing change is only
+    # linear for tiny angles); the along-track kick must be large enough to
+    # rise above the integrator noise in the burnout speed.
+    nominal = arrival(mission['launch_state'])
+    worst = {}
+    for label, delta, axis in (('cross-track x', [0.0, 0.0, 0.0, 0.01, 0.0, 0.0], 0),
+                               ('cross-track z', [0.0, 0.0, 0.0, 0.0, 0.0, 0.01], 2),
+                               ('along-track', [0.0, 0.0, 0.0, 0.0, 100.0, 0.0], 1)):
+        predicted = om.arrival_position_deltas(mission['stm'], delta)[axis]
+        actual = (arrival(mission['launch_state'] + delta) - nominal)[axis]
+        worst[label] = abs(predicted - actual) / abs(actual)
+        print(f"  {label:14s} arrival delta {actual:.4e} m, linear error {worst[label]:.2e}")
+
+    print(f"  Launch-to-arrival STM: {mission['nfev']} RHS evaluations")
+
+    assert worst['cross-track x'] < 1e-4 and worst['cross-track z'] < 1e-4, "FAIL: Cross-track prediction off"
+    assert worst['along-track'] < 1e-2, "FAIL: Along-track prediction off"
+
+    # Batched dispersion mapping and differential correction
+    dispersions = np.random.default_rng(5).normal(size=(1000, 6)) * [1.0, 1.0, 1.0, 1e-3, 1e-3, 1e-3]
+    assert om.arrival_position_deltas(mission['stm'], dispersions).shape == (1000, 3), "FAIL: Batch shape"
+    error = om.arrival_position_deltas(mission['stm'], dispersions[0])
+    correction = om.differential_correction(mission['stm'], error)
+    residual = om.arrival_position_deltas(mission['stm'], dispersions[0] + correction)
+    assert np.linalg.norm(residual) < 1e-6 * np.linalg.norm(error), "FAIL: Correction does not null error"
+
+    print(f"\n  ✓ PASS: STM reproduces perturbed trajectories")
+    return True
+
+def test_monte_carlo_campaign():
+    """Test dispersion campaign streaming, seeding and incremental percentiles"""
+    print("\n" + "="*70)
+    print("TEST 8: Monte Carlo Dispersion Campaign")
+    print("="*70)
+
+    # Zero pointing error reproduces the velocity-aligned push
+    states = om.nominal_initial_state() + np.random.default_rng(1).normal(size=(5, 6)) * [1e6, 1e6, 1e6, 1e3, 1e8, 1e3]
+    aligned = om.equations_of_motion_batch(100.0, states)
+    tilted = om.equations_of_motion_batch(100.0, states, pointing_error=np.zeros((5, 2)))
+    assert np.allclose(aligned, tilted, rtol=1e-12, atol=0.0), "FAIL: Zero pointing error changes RHS"
+
+    # P² percentiles against exact quantiles
+    values = np.random.default_rng(2).lognormal(size=20000)
+    stats = mc.StreamingStatistics()
+    for chunk in np.array_split(values, 7):
+        stats.update(chunk)
+    summary = stats.summary()
+    for p in mc.DEFAULT_QUANTILES:
+        exact = np.quantile(values, p)
+        estimate = summary['percentiles'][f"p{100 * p:g}"]
+        print(f"  p{100 * p:g}: exact {exact:.4f}, streaming {estimate:.4f}")
+        assert abs(estimate - exact) < 0.03 * exact, f"FAIL: p{100 * p:g} off by {estimate / exact - 1:.2%}"
+    assert np.isclose(summary['mean'], values.mean()) and np.isclose(summary['std'], values.std(ddof=1)), \
+        "FAIL: Streaming moments"
+
+    # Same seed gives the same samples in-process and on a process pool
+    with tempfile.TemporaryDirectory() as tmp:
+        serial = _quiet(mc.run_campaign, 60, os.path.join(tmp, 'serial.csv'), batch_size=20, n_workers=1, seed=3)
+        pooled = _quiet(mc.run_campaign, 60, os.path.join(tmp, 'pooled.csv'), batch_size=20, n_workers=2, seed=3)
+
+        def rows(name):
+            with open(os.path.join(tmp, name), newline='') as f:
+                return sorted(csv.DictReader(f), key=lambda row: int(row['sample']))
+
+        serial_rows, pooled_rows = rows('serial.csv'), rows('pooled.csv')
+
+    print(f"  Campaign: {len(serial_rows)} rows, v_final p50 = "
+          f"{serial['statistics']['v_final_c']['percentiles']['p50']:.6f}c")
+
+    assert len(serial_rows) == 60 and [r['sample'] for r in serial_rows] == [str(i) for i in range(60)], \
+        "FAIL: Missing samples"
+    assert serial_rows == pooled_rows, "FAIL: Results depend on worker count"
+    assert serial['statistics'] == pooled['statistics'], "FAIL: Statistics depend on worker count"
+    assert serial['statistics']['v_final_c']['count'] == 60, "FAIL: Statistics count"
+    assert len({r['laser_power_scale'] for r in serial_rows}) == 60, "FAIL: Batches share RNG streams"
+
+    print(f"\n  ✓ PASS: Campaign is reproducible and streamed")
+    return True
+
+def test_event_driven_propagation():
+    """Test event-driven phases, dense output and checkpoint reuse"""
+    print("\n" + "="*70)
+    print("TEST 9: Event-Driven Propagation")
+    print("="*70)
+
+    ephemeris = om.default_ephemeris()
+
+    # Launch just below 0.95c: the limiter onset must split the acceleration phase
+    state0 = np.array([om.AU, 0.0, 0.0, 0.0, 0.949 * om.c, 0.0])
+    trajectory = om.propagate_phase(state0, (0.0, 600.0), acceleration_phase=True, ephemeris=ephemeris)
+    reference = om.solve_ivp(lambda t, y: om.equations_of_motion(t, y, True, ephemeris), (0.0, 600.0), state0,
+                             method='DOP853', rtol=1e-13, atol=1e-12)
+
+    t_onset, onset_state = trajectory.checkpoint('limiter_onset')
+    error = np.linalg.norm(trajectory.state(600.0)[0:3] - reference.y[0:3, -1])
+    print(f"  Limiter onset at t = {t_onset:.3f} s, {len(trajectory.segments)} segments")
+    print(f"  Final position error vs rtol=1e-13 reference: {error:.3e} m")
+
+    assert len(trajectory.segments) == 2, "FAIL: Limiter onset did not restart the solver"
+    assert abs(np.linalg.norm(onset_state[3:6]) / om.c - 0.95) < 1e-9, "FAIL: Onset state off threshold"
+    assert error < 0.05, f"FAIL: Event-driven solution off by {error:.3e} m"
+
+    # Full mission: distance crossings, dense output and checkpoint reuse
+    mission = om.propagate_mission(ephemeris=ephemeris)
+    crossings = [name for name, _, _ in mission.events]
+    assert {'jupiter_orbit', 'saturn_orbit', 'heliopause'} <= set(crossings), "FAIL: Missing distance crossings"
+    assert mission.checkpoint('laser_cutoff')[0] == om.acceleration_time, "FAIL: Laser cutoff checkpoint"
+
+    t_query = np.array([0.0, 1234.5, om.acceleration_time, 1e8, mission.t_end])
+    states = mission.state(t_query)
+    assert states.shape == (6, 5), "FAIL: Dense output shape"
+    assert np.allclose(states[:, 0], mission.checkpoint('launch')[1]), "FAIL: Dense output at launch"
+    assert np.allclose(states[:, -1], mission.checkpoint('coast_end')[1]), "FAIL: Dense output at arrival"
+
+    variant = om.propagate_mission(ephemeris=ephemeris, acceleration=mission, coast_duration=1e8)
+    assert variant.segments[0] is mission.segments[0], "FAIL: Acceleration phase not reused"
+    assert variant.t_end == om.acceleration_time + 1e8, "FAIL: Coast variant span"
+
+    print(f"  Mission: {mission.nfev} RHS evaluations, crossings: {', '.join(crossings)}")
+
+    print(f"\n  ✓ PASS: Event-driven propagation")
+    return True
+
+def test_laser_doppler_and_force_table():
+    """Test array-aware laser force with Doppler factor and the (distance, β) table"""
+    print("\n" + "="*70)
+    print("TEST 10: Laser Doppler Factor and Force Table")
+    print("="*70)
+
+    rng = np.random.default_rng(11)
+    distance = rng.uniform(0.0, 4e11, 500)
+    velocity = rng.uniform(0.0, 0.9 * om.c, 500)
+
+    # Array evaluation matches scalar calls; Doppler is (1-β)/(1+β)
+    scalar = np.array([om.laser_acceleration_force(float(d), float(v)) for d, v in zip(distance, velocity)])
+    array = om.laser_acceleration_force(distance, velocity)
+    assert np.allclose(array, scalar, rtol=1e-14, atol=0.0), "FAIL: Array force differs from scalar"
+    assert np.allclose(om.laser_acceleration_force_batch(distance, velocity), array, rtol=1e-14), "FAIL: Batch force"
+
+    no_doppler = om.laser_acceleration_force(distance, velocity, doppler=False)
+    beta = velocity / om.c
+    assert np.allclose(array / no_doppler, (1 - beta) / (1 + beta), rtol=1e-12), "FAIL: Doppler factor"
+    assert abs(om.doppler_factor(0.5) - 1.0 / 3.0) < 1e-15, "FAIL: Doppler factor at 0.5c"
+
+    # Table interpolation within its error bound
+    table = om.LaserForceTable()
+    bound = table.error_bound()
+    measured = table.max_interpolation_error()
+    print(f"  Force table: {table.values.shape} grid, error bound {bound:.3e}, measured {measured:.3e}")
+    assert measured <= bound, "FAIL: Table exceeds error bound"
+    assert bound < 1e-6, "FAIL: Table error bound too loose"
+    assert abs(table(1e9, 0.3) - table(np.array([1e9]), np.array([0.3]))[0]) < 1e-15, "FAIL: Scalar table path"
+
+    # Trajectories with the table reproduce the analytic force model
+    analytic = _quiet(om.simulate_acceleration_phase)
+    tabulated = _quiet(om.simulate_acceleration_phase, laser_table=table)
+    print(f"  v_final analytic: {analytic['v_final_c']:.9f}c, table: {tabulated['v_final_c']:.9f}c")
+    assert abs(analytic['v_final_c'] - tabulated['v_final_c']) < 1e-6, "FAIL: Table trajectory differs"
+
+    states = np.repeat(om.nominal_initial_state()[None, :], 3, axis=0) + [0.0, 0.0, 0.0, 0.0, 1e8, 0.0]
+    batch = om.equations_of_motion_batch(600.0, states, laser_table=table)
+    reference = om.equations_of_motion_batch(600.0, states)
+    assert np.allclose(batch, reference, rtol=1e-5), "FAIL: Batched table RHS differs"
+
+    print(f"\n  ✓ PASS: Doppler-corrected laser force and table")
+    return True
+
+def test_trajectory_store():
+    """Test columnar trajectory store append, reopen and zero-copy slicing"""
+    print("\n" + "="*70)
+    print("TEST 11: Binary Trajectory Store")
+    print("="*70)
+
+    accel = _quiet(om.simulate_acceleration_phase)
+    rng = np.random.default_rng(4)
+    ensemble_position = rng.normal(size=(50, 3, 20))
+    ensemble_velocity = rng.normal(size=(50, 3, 20))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'store')
+        store = ts.TrajectoryStore(path)
+        store.append_result(accel, name='acceleration', metadata={'v_final_c': float(accel['v_final_c'])})
+        store.append_ensemble(np.linspace(0.0, 1.0, 20), ensemble_position, ensemble_velocity)
+
+        # Reopen from disk: manifest and memory-mapped columns
+        reopened = ts.TrajectoryStore(path)
+        view = reopened.trajectory('acceleration')
+        member = reopened.trajectory(31)
+        window = reopened.trajectory('acceleration', t_range=(600.0, 1200.0))
+
+        print(f"  Stored {len(reopened)} trajectories, {reopened.manifest['rows']} samples")
+
+        assert len(reopened) == 51, "FAIL: Wrong trajectory count"
+        assert isinstance(view['position'], np.memmap) or isinstance(view['position'].base, np.memmap), \
+            "FAIL: Views are not memory-mapped"
+        assert np.array_equal(view['position'], accel['position']), "FAIL: Position round trip"
+        assert np.array_equal(view['velocity'], accel['velocity']), "FAIL: Velocity round trip"
+        assert view['metadata']['v_final_c'] == float(accel['v_final_c']), "FAIL: Metadata round trip"
+        assert np.array_equal(member['velocity'], ensemble_velocity[30]), "FAIL: Ensemble member"
+        assert window['time'][0] >= 600.0 and window['time'][-1] <= 1200.0, "FAIL: Time window"
+        assert np.array_equal(reopened.final_states()[0], accel['final_state']), "FAIL: Final states"
+
+        # Appending after reopening extends the same files
+        reopened.append(accel['time'][:10], accel['position'][:, :10], accel['velocity'][:, :10], name='head')
+        assert np.array_equal(ts.TrajectoryStore(path).trajectory('head')['time'], accel['time'][:10]), \
+            "FAIL: Append after reopen"
+        assert np.load(os.path.join(path, 'position.npy')).shape == (reopened.manifest['rows'], 3), \
+            "FAIL: Column file is not a valid .npy"
+
+        # Plots render straight from the store views
+        _quiet(om.plot_trajectory, reopened.trajectory('acceleration'), None, tmp)
+        assert os.path.exists(os.path.join(tmp, 'trajectory_plots.png')), "FAIL: Plot from store"
+
+    print(f"\n  ✓ PASS: Trajectory store round trip")
+    return True
+
+def test_integrator_benchmark_report():
+    """Test integrator sweep report, settings selection and regression check"""
+    print("\n" + "="*70)
+    print("TEST 12: Integrator Benchmark Report")
+    print("="*70)
+
+    results = _quiet(ob.benchmark_integrators, acceleration_sweep=[('DOP853', 1e-8), ('DOP853', 1e-11)],
+                     coast_sweep=[('DOP853', 1e-8)], repeats=1, ensemble_size=4)
+    cases = results['cases']
+    accel = {case['rtol']: case for case in cases if case['phase'] == 'acceleration' and case['method'] == 'DOP853'}
+
+    for case in cases:
+        print(f"  {case['phase']:13s} {case['method']:36s} rtol={case['rtol']:.0e} nfev={case['nfev']:5d} "
+              f"pos err={case['position_error_m']:.2e} m")
+
+    assert all(case['success'] for case in cases), "FAIL: Benchmark case failed"
+    assert accel[1e-11]['position_error_m'] < accel[1e-8]['position_error_m'], "FAIL: Tighter rtol not more accurate"
+    assert accel[1e-11]['nfev'] > accel[1e-8]['nfev'], "FAIL: Tighter rtol not more expensive"
+    assert {'Encke (DOP853)', 'RK45 (ensemble x4, per trajectory)'} <= {case['method'] for case in cases}, \
+        "FAIL: Missing propagator paths"
+    assert ob.cheapest_within_tolerance(cases, 'acceleration', 1e-30) is None, "FAIL: Impossible target selected"
+
+    # Machine-readable report and regression detection
+    with tempfile.TemporaryDirectory() as tmp:
+        report = ob.write_report({'integrators': results}, os.path.join(tmp, 'report.json'))
+        with open(os.path.join(tmp, 'report.json')) as f:
+            reloaded = json.load(f)
+
+    assert reloaded['integrators']['cases'] == report['integrators']['cases'], "FAIL: Report round trip"
+    assert ob.compare_reports(reloaded, reloaded) == [], "FAIL: Report regresses against itself"
+
+    slower = json.loads(json.dumps(reloaded))
+    slower['integrators']['cases'][0]['wall_time_s'] *= 3.0
+    slower['integrators']['cases'][0]['nfev'] += 10
+    assert len(ob.compare_reports(reloaded, slower)) == 2, "FAIL: Regression not detected"
+
+    print(f"\n  ✓ PASS: Benchmark report and regression check")
+    return True
+
+def run_all_tests():
+    """Run all orbital mechanics tests"""
+    print("\n" + "#"*70)
+    print("# ORBITAL MECHANICS TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_batch_rhs_matches_scalar,
+        test_ensemble_acceleration_phase,
+        test_ensemble_coast_phase,
+        test_ephemeris_cache,
+        test_encke_coast_propagator,
+        test_compiled_rhs_parity,
+        test_state_transition_matrix,
+        test_monte_carlo_campaign,
+        test_event_driven_propagation,
+        test_laser_doppler_and_force_table,
+        test_trajectory_store,
+        test_integrator_benchmark_report
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+PARETO RANKING TEST SUITE
+Tests the shared non-dominated sorting module in src/quantum/pareto.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import time
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+import pareto
+import quantum_integrated_optimizer as qio
+
+def _reference_ranks(objectives):
+    """Front ranks by repeated pairwise peeling (quadratic reference)"""
+    ranks = np.full(len(objectives), -1)
+    remaining = np.arange(len(objectives))
+    rank = 0
+    while len(remaining):
+        front = objectives[remaining]
+        dominated = np.array([np.any(np.all(front >= p, axis=1) & np.any(front > p, axis=1)) for p in front])
+        ranks[remaining[~dominated]] = rank
+        remaining = remaining[dominated]
+        rank += 1
+    return ranks
+
+def test_non_dominated_sorting():
+    """Test front ranks, front masks and the archive against pairwise peeling"""
+    print("\n" + "="*70)
+    print("TEST 1: Non-Dominated Sorting (pareto.non_dominated_sort)")
+    print("="*70)
+
+    rng = np.random.default_rng(5)
+    cases = 0
+    for k in (1, 2, 3, 4):
+        for trial in range(20):
+            # Integer grids exercise ties and duplicates
+            if trial % 2:
+                objectives = rng.integers(0, 6, (150, k)).astype(float)
+            else:
+                objectives = rng.random((150, k))
+            expected = _reference_ranks(objectives)
+
+            assert np.array_equal(pareto.non_dominated_sort(objectives), expected)
+            assert np.array_equal(pareto.pareto_front_mask(objectives), expected == 0)
+
+            # First occurrence of each front vector, streamed one by one and in chunks
+            first = pareto.pareto_front_mask(objectives, keep_duplicates=False)
+            seen = set()
+            for i in np.flatnonzero(expected == 0):
+                assert first[i] == (tuple(objectives[i]) not in seen)
+                seen.add(tuple(objectives[i]))
+
+            single = pareto.ParetoArchive(keep_duplicates=False)
+            for i, point in enumerate(objectives):
+                single.add(point, i)
+            chunked = pareto.ParetoArchive(keep_duplicates=False)
+            for start in range(0, len(objectives), 40):
+                chunked.add_batch(objectives[start:start + 40], range(start, min(start + 40, len(objectives))))
+            assert sorted(single.items) == sorted(chunked.items) == list(np.flatnonzero(first))
+            cases += 1
+
+    print(f"  Random cases checked: {cases} (k = 1..4, with ties)")
+
+    # Crowding distance: boundary points infinite, interior by neighbour gaps
+    distance = pareto.crowding_distance([[0, 3], [1, 2], [2, 1], [3, 0]])
+    assert np.isinf(distance[[0, 3]]).all() and np.allclose(distance[1:3], 4 / 3)
+
+    # Capacity-bounded archive keeps the extremes
+    archive = pareto.ParetoArchive(capacity=10)
+    angles = rng.uniform(0, np.pi / 2, 200)
+    archive.add_batch(np.column_stack([np.cos(angles), np.sin(angles)]))
+    assert len(archive) == 10
+    assert archive.objectives[:, 0].max() == np.cos(angles).max()
+
+    # O(N log N) two-objective front on a large set
+    objectives = rng.random((200000, 2))
+    start = time.perf_counter()
+    mask = pareto.pareto_front_mask(objectives)
+    elapsed = time.perf_counter() - start
+    print(f"  200,000-point two-objective front: {mask.sum()} points in {elapsed*1e3:.0f} ms")
+    assert elapsed < 2.0
+
+    print(f"\n  ✓ Non-dominated sorting matches pairwise reference")
+    return True
+
+def test_integrated_pareto_frontier():
+    """Test generate_pareto_frontier against the original pairwise scan"""
+    print("\n" + "="*70)
+    print("TEST 2: Integrated Optimizer Pareto Frontier (generate_pareto_frontier)")
+    print("="*70)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        optimizer = qio.QuantumIntegratedOptimizer()
+
+    def science(d):
+        return d.data_rate_bps * (1 + d.power_margin)
+
+    def pairwise_frontier(designs):
+        frontier = []
+        for design in designs:
+            if any(science(p) >= science(design) and p.final_velocity_c >= design.final_velocity_c
+                   for p in frontier):
+                continue
+            frontier = [p for p in frontier if not (science(design) >= science(p) and
+                                                    design.final_velocity_c >= p.final_velocity_c)]
+            frontier.append(design)
+        return frontier
+
+    rng = np.random.default_rng(9)
+    lattice = optimizer.lattice_params(rng.integers(0, 4**10, 3000))
+    designs = optimizer.evaluate_designs_batch(np.vstack([lattice, lattice[:500]]), 'balanced').top_k(3500)
+    designs = [designs[i] for i in rng.permutation(len(designs))]
+
+    frontier = optimizer.generate_pareto_frontier(designs)
+    expected = pairwise_frontier(designs)
+    print(f"  Designs: {len(designs)}, Pareto-optimal: {len(frontier)}")
+    assert [id(d) for d in frontier] == [id(d) for d in expected]
+    assert optimizer.generate_pareto_frontier([]) == []
+
+    print(f"\n  ✓ Frontier identical to the pairwise scan")
+    return True
+
+def run_all_tests():
+    """Run all Pareto ranking tests"""
+    print("\n" + "#"*70)
+    print("# PARETO RANKING TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_non_dominated_sorting,
+        test_integrated_pareto_frontier
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+QAOA COST HAMILTONIAN TEST SUITE
+Tests the diagonal cost vectors and Ising fits in src/quantum/qaoa_cost.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from qaoa_angles import AngleCache
+from qaoa_cost import DiagonalCost, walsh_hadamard
+from qaoa_simulator import QAOASimulator
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import quantum_power_optimizer as qpo
+
+N_QUBITS = 8
+
+def _quadratic_values(outcomes):
+    """Quadratic objective of 8-bit outcomes (exactly an order-2 Ising model)"""
+    bits = (outcomes[:, None] >> np.arange(N_QUBITS)) & 1
+    return 3.0 * bits[:, 0] - 2.0 * bits[:, 1] * bits[:, 5] + bits[:, 2:].sum(axis=1) * bits[:, 7]
+
+def test_ising_fit():
+    """Test the Walsh-Hadamard transform and Ising fits of cost diagonals"""
+    print("\n" + "="*70)
+    print("TEST 1: Cost Diagonals and Ising Fits (DiagonalCost)")
+    print("="*70)
+
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=2 ** N_QUBITS)
+    assert np.allclose(walsh_hadamard(walsh_hadamard(values)) / values.size, values)
+
+    # A quadratic objective is reproduced exactly by the order-2 fit
+    cost = DiagonalCost.from_batch(_quadratic_values, n_qubits=N_QUBITS, chunk_size=100)
+    assert np.allclose(cost.values, _quadratic_values(np.arange(2 ** N_QUBITS)))
+    model = cost.fit_ising(max_order=2)
+    print(f"  Quadratic cost: {len(model.terms)} terms, "
+          f"{model.explained_variance:.1%} of the variance explained")
+    assert np.isclose(model.explained_variance, 1.0) and model.max_order == 2
+    assert np.allclose(model.diagonal(), cost.values)
+
+    # Truncations keep the largest coefficients and report what they lose
+    partial = DiagonalCost(values).fit_ising(max_order=2, max_terms=5)
+    assert len(partial.terms) == 5 and 0.0 < partial.explained_variance < 1.0
+    try:
+        cost.circuit([0.1], [0.1], DiagonalCost(values).fit_ising(max_order=3))
+        assert False, "order-3 models have no RZ/RZZ circuit"
+    except ValueError:
+        pass
+
+    print(f"\n  ✓ Ising fits are exact up to their order")
+    return True
+
+def test_direct_expectation():
+    """Test direct cost-diagonal evolution against the circuits and angle tuning"""
+    print("\n" + "="*70)
+    print("TEST 2: Direct Expectations and Angle Tuning")
+    print("="*70)
+
+    cost = DiagonalCost.from_batch(_quadratic_values, n_qubits=N_QUBITS)
+    model = cost.fit_ising(max_order=2)
+    gammas, betas = [0.7, 0.3], [0.4, 0.9]
+
+    circuit_probs = QAOASimulator().probabilities(cost.circuit(gammas, betas, model))
+    fast = cost.expectation(gammas, betas, model)
+    print(f"  Expected objective: circuit {circuit_probs @ cost.values:.6f}, direct {fast:.6f}")
+    assert np.isclose(fast, circuit_probs @ cost.values, atol=1e-4)
+
+    tuner = cost.angle_optimizer(model, instance='quadratic8', cache=AngleCache())
+    gammas, betas = tuner.optimize(n_layers=2)
+    tuned = cost.expectation(gammas, betas, model)
+    print(f"  Tuned (p=2): {tuned:.3f} vs {cost.mean:.3f} uniform, max {cost.values.max():.3f}")
+    assert tuned > cost.mean + 0.25 * (cost.values.max() - cost.mean)
+    # A different cost Hamiltonian (circuit family) is a different instance
+    assert tuner.key != cost.angle_optimizer(cost.fit_ising(max_order=1), instance='quadratic8').key
+
+    print(f"\n  ✓ Direct expectations match the faithful circuits")
+    return True
+
+def test_power_scores_batch():
+    """Test the vectorized power-system score against evaluate_configuration"""
+    print("\n" + "="*70)
+    print("TEST 3: Vectorized Power Configuration Scores")
+    print("="*70)
+
+    evaluator = qpo.PowerSystemEvaluator()
+    outcomes = np.random.default_rng(7).integers(0, 2 ** qpo.QuantumParameterSpace.TOTAL_BITS, 2000)
+    batch = evaluator.evaluate_scores_batch(outcomes)
+    scalar = [evaluator.evaluate_configuration(qpo.QuantumParameterSpace.decode_solution(
+        format(int(k), f'0{qpo.QuantumParameterSpace.TOTAL_BITS}b')))['score'] for k in outcomes]
+    assert np.allclose(batch, scalar)
+    print(f"  {len(outcomes)} outcomes match, {np.sum(batch > -1000)} viable")
+
+    print(f"\n  ✓ Batch scores match the per-configuration evaluation")
+    return True
+
+def run_all_tests():
+    """Run all QAOA cost Hamiltonian tests"""
+    print("\n" + "#"*70)
+    print("# QAOA COST HAMILTONIAN TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_ising_fit,
+        test_direct_expectation,
+        test_power_scores_batch
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
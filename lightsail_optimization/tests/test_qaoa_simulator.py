@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+QAOA STATEVECTOR SIMULATOR TEST SUITE
+Tests the local NumPy simulator in src/quantum/qaoa_simulator.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import time
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister
+from qiskit.quantum_info import Statevector
+
+from qaoa_simulator import QAOASimulator, UnsupportedCircuitError
+from quantum_backend import QuantumBackendProvider
+import quantum_integrated_optimizer as qio
+import quantum_comm_optimizer as qco
+
+def _random_circuit(rng, n_qubits, n_gates=40):
+    qc = QuantumCircuit(n_qubits)
+    for _ in range(n_gates):
+        gate = rng.choice(['h', 'x', 'rx', 'ry', 'rz', 'rzz', 'cx', 'cx-rz-cx'])
+        a, b = (int(q) for q in rng.choice(n_qubits, 2, replace=False))
+        theta = float(rng.normal() * 3)
+        if gate in ('h', 'x'):
+            getattr(qc, gate)(a)
+        elif gate in ('rx', 'ry', 'rz'):
+            getattr(qc, gate)(theta, a)
+        elif gate == 'rzz':
+            qc.rzz(theta, a, b)
+        elif gate == 'cx':
+            qc.cx(a, b)
+        else:
+            qc.cx(a, b)
+            qc.rz(theta, b)
+            qc.cx(a, b)
+    return qc
+
+def test_statevector_matches_qiskit():
+    """Test statevectors, measurement mapping and sampling against qiskit"""
+    print("\n" + "="*70)
+    print("TEST 1: Statevector Parity with qiskit (QAOASimulator)")
+    print("="*70)
+
+    rng = np.random.default_rng(11)
+    sim = QAOASimulator(seed=4)
+    for trial in range(30):
+        qc = _random_circuit(rng, int(rng.integers(2, 9)))
+        assert np.allclose(sim.statevector(qc), Statevector(qc).data), f"Circuit {trial} differs"
+    print(f"  Random H/X/RX/RY/RZ/RZZ/CX circuits: 30 match")
+
+    # Reduced QAOA circuit of the comm optimizer (10 qubits)
+    with contextlib.redirect_stdout(io.StringIO()):
+        qc = qco.QuantumCommOptimizer().create_qaoa_circuit(num_qubits=10, depth=3)
+    qc = qc.assign_parameters([0.8, 0.4])
+    expected = Statevector(qc.remove_final_measurements(inplace=False)).probabilities()
+    assert np.allclose(sim.probabilities(qc), expected)
+
+    # Measurement into a permuted, partial classical register
+    qr, cr = QuantumRegister(3), ClassicalRegister(2)
+    qc = QuantumCircuit(qr, cr)
+    qc.x(0)
+    qc.h(2)
+    qc.measure(qr[0], cr[1])
+    qc.measure(qr[2], cr[0])
+    assert np.allclose(sim.probabilities(qc), [0, 0, 0.5, 0.5])
+
+    counts = sim.sample(qc, shots=20000)
+    assert set(counts) == {2, 3} and abs(counts[2] - 0.5) < 0.02
+
+    # Unsupported gates and unbound parameters are rejected
+    qc = QuantumCircuit(2)
+    qc.cz(0, 1)
+    for circuit in (qc, qco.QuantumCommOptimizer.create_qaoa_circuit(None, num_qubits=4)):
+        try:
+            sim.statevector(circuit)
+            assert False, "circuit should be rejected"
+        except UnsupportedCircuitError:
+            pass
+
+    print(f"\n  ✓ Simulator matches qiskit Statevector")
+    return True
+
+def test_design_circuit_simulation():
+    """Test the 20-qubit integrated-design QAOA circuit and the local backend"""
+    print("\n" + "="*70)
+    print("TEST 2: 20-Qubit Design Circuit Simulation (local backend)")
+    print("="*70)
+
+    optimizer = qio.QuantumIntegratedOptimizer(backend_provider=QuantumBackendProvider('offline'))
+    qc = optimizer.create_qaoa_circuit(np.random.default_rng(2).random(6) * 2 * np.pi, 'balanced')
+
+    sim = QAOASimulator(seed=5)
+    start = time.perf_counter()
+    probs = sim.probabilities(qc)
+    elapsed = time.perf_counter() - start
+    print(f"  {qc.num_qubits} qubits, {qc.size()} gates: {elapsed:.2f} s")
+    assert len(probs) == 2**20 and np.isclose(probs.sum(), 1.0)
+    assert elapsed < 10.0
+
+    # Cost layers share one cached phase vector up to their angle
+    assert len(sim._phase_cache) == 1
+
+    provider = QuantumBackendProvider('local', seed=5)
+    with contextlib.redirect_stdout(io.StringIO()):
+        counts = provider.sample(provider.transpile(qc), shots=10000)
+    assert np.isclose(sum(counts.values()), 1.0) and max(counts) < 2**20
+    print(f"  Local backend: {len(counts)} distinct outcomes from 10,000 shots")
+
+    print(f"\n  ✓ Design circuits simulate locally in seconds")
+    return True
+
+def run_all_tests():
+    """Run all QAOA simulator tests"""
+    print("\n" + "#"*70)
+    print("# QAOA STATEVECTOR SIMULATOR TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_statevector_matches_qiskit,
+        test_design_circuit_simulation
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
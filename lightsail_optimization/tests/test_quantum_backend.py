@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+QUANTUM BACKEND PROVIDER TEST SUITE
+Tests the lazy backend connection in src/quantum/quantum_backend.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import time
+import pickle
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from qiskit import QuantumCircuit
+
+import quantum_backend
+from quantum_backend import QuantumBackendProvider
+import quantum_integrated_optimizer as qio
+
+def test_lazy_backend_provider():
+    """Test lazy connection, backend selection and the local stand-in"""
+    print("\n" + "="*70)
+    print("TEST 1: Lazy Quantum Backend Provider (QuantumBackendProvider)")
+    print("="*70)
+
+    # Construction never connects
+    start = time.perf_counter()
+    optimizer = qio.QuantumIntegratedOptimizer()
+    elapsed = time.perf_counter() - start
+    print(f"  Optimizer construction: {elapsed*1e3:.1f} ms")
+    assert not optimizer.backend_provider.connected
+    assert optimizer.backend_provider.service is None
+    assert elapsed < 1.0
+
+    # Backend selection through the environment
+    saved = os.environ.get(quantum_backend.BACKEND_ENV_VAR)
+    try:
+        os.environ[quantum_backend.BACKEND_ENV_VAR] = 'offline'
+        assert QuantumBackendProvider().is_offline
+        assert QuantumBackendProvider('local').is_local
+    finally:
+        if saved is None:
+            os.environ.pop(quantum_backend.BACKEND_ENV_VAR)
+        else:
+            os.environ[quantum_backend.BACKEND_ENV_VAR] = saved
+
+    offline = QuantumBackendProvider('offline')
+    assert not offline.available and offline.label == 'Classical simulation'
+    try:
+        offline.sample(QuantumCircuit(1))
+        assert False, "offline provider sampled a circuit"
+    except RuntimeError:
+        pass
+
+    # Local stand-in: Bell state, outcomes 00 and 11 only
+    local = QuantumBackendProvider('local', seed=3)
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure_all()
+    with contextlib.redirect_stdout(io.StringIO()):
+        counts = local.sample(local.transpile(qc), shots=4000)
+    print(f"  Local Bell-state distribution: {counts}")
+    assert set(counts) == {0, 3}
+    assert np.isclose(sum(counts.values()), 1.0) and abs(counts[0] - 0.5) < 0.05
+    assert local.connected
+
+    # Pickled copies keep the configuration, not the connection
+    copy = pickle.loads(pickle.dumps(local))
+    assert copy.is_local and copy.seed == 3 and not copy.connected
+
+    print(f"\n  ✓ Backend connects lazily; local stand-in samples correctly")
+    return True
+
+def run_all_tests():
+    """Run all quantum backend tests"""
+    print("\n" + "#"*70)
+    print("# QUANTUM BACKEND PROVIDER TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_lazy_backend_provider
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
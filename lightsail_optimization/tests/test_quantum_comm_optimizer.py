@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+QUANTUM COMMUNICATION OPTIMIZER TEST SUITE
+Tests the classical search engines of src/quantum/quantum_comm_optimizer.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from quantum_comm_optimizer import QuantumCommOptimizer
+from quantum_comm_optimizer_v2 import QuantumCommOptimizerV2
+
+def _quiet(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def test_columnar_grid_search():
+    """Test the columnar evaluation against evaluate_configuration and top-N materialization"""
+    print("\n" + "="*70)
+    print("TEST 1: Columnar Grid Search (classical_grid_search)")
+    print("="*70)
+
+    for optimizer in (QuantumCommOptimizer(), QuantumCommOptimizerV2()):
+        indices = optimizer.sample_indices(2000, np.random.default_rng(3))
+        assert len(indices) == 2000
+
+        # Every materialized result matches the per-dict evaluation
+        for row, result in zip(indices, optimizer.materialize_results(indices)):
+            score, expected = optimizer.evaluate_configuration(optimizer.config_from_indices(row))
+            assert result['config'] == expected['config']
+            assert np.isclose(result['score'], score) and result['viable'] == expected['viable']
+            assert np.isclose(result['mass_grams'], expected['mass_grams'])
+            assert np.isclose(result['cost_usd'], expected['cost_usd'])
+            for key, value in expected['link_budget'].items():
+                assert np.isclose(result['link_budget'][key], value), key
+
+        # Strategies keep their restrictions (strategy 3: space receivers)
+        space = optimizer.param_ranges['rx_location'].index('space')
+        assert np.all(indices[1000:1500, QuantumCommOptimizer.CONFIG_KEYS.index('rx_location')] == space)
+        print(f"  {type(optimizer).__name__}: 2000 configurations match")
+
+    # Chunked sampling draws the same samples as one draw
+    optimizer = QuantumCommOptimizer()
+    chunks = list(optimizer.iter_sample_indices(2000, np.random.default_rng(3), 300))
+    assert max(len(chunk) for chunk in chunks) == 300
+    assert np.array_equal(np.concatenate(chunks), optimizer.sample_indices(2000, np.random.default_rng(3)))
+
+    # Top-N of a sweep equals the head of the fully materialized ranking
+    full = _quiet(optimizer.classical_grid_search, 20000, seed=5, chunk_size=3000)
+    top = _quiet(optimizer.classical_grid_search, 20000, top_n=25, seed=5, chunk_size=3000)
+    assert len(full) == 20000 and len(top) == 25
+    assert [r['score'] for r in top] == [r['score'] for r in full[:25]]
+    assert [r['config'] for r in top] == [r['config'] for r in full[:25]]
+    small = _quiet(optimizer.classical_grid_search, 20000, top_n=25, seed=5, chunk_size=777)
+    assert [r['config'] for r in small] == [r['config'] for r in top]
+    assert all(a['score'] >= b['score'] for a, b in zip(full, full[1:]))
+    print(f"  Top 25 of 20,000: best score {top[0]['score']:.2f}")
+
+    print(f"\n  ✓ Columnar engine reproduces the per-configuration evaluation")
+    return True
+
+def test_exhaustive_search():
+    """Test the branch-and-bound top-k against brute-force enumeration"""
+    print("\n" + "="*70)
+    print("TEST 2: Exact Branch-and-Bound Search (exhaustive_search)")
+    print("="*70)
+
+    for optimizer in (QuantumCommOptimizer(), QuantumCommOptimizerV2()):
+        sizes = [len(optimizer.param_ranges[key]) for key in QuantumCommOptimizer.CONFIG_KEYS]
+        indices = np.stack(np.unravel_index(np.arange(np.prod(sizes)), sizes), axis=1)
+        scores = optimizer.evaluate_configurations_batch(optimizer.config_columns(indices))['score']
+        expected = np.lexsort((np.arange(len(scores)), -scores))[:40]
+
+        search = _quiet(optimizer.exhaustive_search, top_k=40, leaf_size=64)
+        ranks = [np.ravel_multi_index([optimizer.param_ranges[key].index(r['config'][key])
+                                       for key in QuantumCommOptimizer.CONFIG_KEYS], sizes)
+                 for r in search['top_results']]
+        assert ranks == list(expected)
+        assert np.allclose([r['score'] for r in search['top_results']], scores[expected])
+        assert search['n_configurations'] == len(scores)
+        assert search['n_evaluated'] < 0.1 * len(scores)
+        print(f"  {type(optimizer).__name__}: top 40 of {len(scores):,} exact, "
+              f"{search['n_evaluated']:,} evaluated")
+
+    print(f"\n  ✓ Pruned search returns the brute-force top-k")
+    return True
+
+def run_all_tests():
+    """Run all communication optimizer tests"""
+    print("\n" + "#"*70)
+    print("# QUANTUM COMMUNICATION OPTIMIZER TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_columnar_grid_search,
+        test_exhaustive_search
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
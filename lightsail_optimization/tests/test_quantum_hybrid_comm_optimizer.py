@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+HYBRID COMM OPTIMIZER TEST SUITE
+Tests the outcome scoring and QAOA angle tuning of src/quantum/quantum_hybrid_comm_optimizer.py
+"""
+
+import numpy as np
+import sys
+import os
+import json
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from qaoa_simulator import QAOASimulator
+from quantum_hybrid_comm_optimizer import HybridCommOptimizer
+
+def test_vectorized_scoring():
+    """Test batch scores and the cost diagonal against the scalar model and the circuit"""
+    print("\n" + "="*70)
+    print("TEST 1: Vectorized Outcome Scores and Cost Diagonal")
+    print("="*70)
+
+    optimizer = HybridCommOptimizer()
+    outcomes = np.random.default_rng(3).integers(0, 2 ** 20, 2000)
+    expected = [optimizer.calculate_hybrid_performance(optimizer.decode_bitstring(format(int(k), '020b')))['score']
+                for k in outcomes]
+    scores = optimizer.outcome_scores()
+    assert scores.shape == (2 ** 20,)
+    assert np.allclose(scores[outcomes], expected, rtol=1e-12, atol=0)
+    print(f"  2000 outcomes: batch scores equal calculate_hybrid_performance "
+          f"(range {min(expected):.0f} to {max(expected):.0f})")
+
+    sim = QAOASimulator()
+    gammas, betas = [0.3, 0.7], [0.5, 0.2]
+    circuit = sim.probabilities(optimizer.create_qaoa_circuit(gammas, betas, num_layers=2))
+    evolved = sim.qaoa_probabilities(optimizer.cost_diagonal(), gammas, betas)
+    assert np.allclose(circuit, evolved, atol=1e-12)
+    print(f"  Cost diagonal evolution equals the 2-layer circuit distribution")
+
+    print(f"\n  ✓ Scores and cost layer need no per-outcome Python loop")
+    return True
+
+def test_angle_cache_wiring():
+    """Test that tuned angles persist per encoding and a cache hit skips scoring"""
+    print("\n" + "="*70)
+    print("TEST 2: Persistent Angle Cache Keyed on the Encoding")
+    print("="*70)
+
+    def counting(optimizer):
+        calls = []
+        score = optimizer.outcome_scores_batch
+        optimizer.outcome_scores_batch = lambda outcomes: calls.append(len(outcomes)) or score(outcomes)
+        return calls
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'angles.json')
+        first = HybridCommOptimizer(angle_cache_path=path)
+        calls = counting(first)
+        gammas, betas = first.tune_qaoa_angles(num_layers=1)
+        assert sum(calls) == 2 ** 20
+        with open(path) as f:
+            assert list(json.load(f)) == [f"hybrid_comm:{first.encoding_fingerprint()}"]
+
+        again = HybridCommOptimizer(angle_cache_path=path)
+        calls = counting(again)
+        cached = again.tune_qaoa_angles(num_layers=1)
+        assert not calls
+        assert np.allclose(cached[0], gammas) and np.allclose(cached[1], betas)
+        print(f"  Depth 1 tuned (gamma {gammas[0]:.3f}, beta {betas[0]:.3f}), reloaded without scoring")
+
+        # A different encoding is a different instance
+        changed = HybridCommOptimizer(angle_cache_path=path)
+        changed.total_mass_budget = 5.0
+        assert changed.encoding_fingerprint() != first.encoding_fingerprint()
+
+    print(f"\n  ✓ Angle cache hits skip outcome scoring")
+    return True
+
+def run_all_tests():
+    """Run all hybrid comm optimizer tests"""
+    print("\n" + "#"*70)
+    print("# HYBRID COMM OPTIMIZER TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_vectorized_scoring,
+        test_angle_cache_wiring
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
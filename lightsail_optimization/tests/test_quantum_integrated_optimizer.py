@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+QUANTUM INTEGRATED OPTIMIZER TEST SUITE
+Tests the design evaluation and search in src/quantum/quantum_integrated_optimizer.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import time
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+import quantum_integrated_optimizer as qio
+from quantum_backend import QuantumBackendProvider
+
+def _quiet(func, *args, **kwargs):
+    """Run an optimizer function with its console report suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def _optimizer():
+    return _quiet(qio.QuantumIntegratedOptimizer, backend_provider=QuantumBackendProvider('offline'))
+
+def test_batch_evaluation_matches_scalar():
+    """Test evaluate_designs_batch against evaluate_design row by row"""
+    print("\n" + "="*70)
+    print("TEST 1: Batched Design Evaluation Parity (evaluate_designs_batch)")
+    print("="*70)
+
+    optimizer = _optimizer()
+    rng = np.random.default_rng(7)
+    params = np.vstack([
+        rng.random((400, 10)),
+        np.zeros((1, 10)),
+        np.ones((1, 10)),
+        optimizer.decode_measurements_batch([format(int(b), '020b') for b in rng.integers(0, 2**20, 100)]),
+    ])
+
+    worst = 0.0
+    for architecture in optimizer.architectures:
+        batch = optimizer.evaluate_designs_batch(params, architecture)
+        assert len(batch) == len(params)
+        assert batch.violations.shape == (len(params), len(qio.VIOLATION_NAMES))
+
+        for i in range(len(params)):
+            reference = optimizer.evaluate_design(params[i], architecture)
+            design = batch.design(i)
+            assert design.comm_type == reference.comm_type
+            assert design.constraints_met == reference.constraints_met
+            assert design.violation_details.keys() == reference.violation_details.keys()
+            for name in qio.DESIGN_COLUMNS:
+                value, expected = getattr(design, name), getattr(reference, name)
+                if isinstance(expected, float):
+                    worst = max(worst, abs(value - expected) / max(abs(expected), 1e-300))
+            for name, expected in reference.violation_details.items():
+                worst = max(worst, abs(design.violation_details[name] - expected) / abs(expected))
+
+    print(f"  Designs compared: {len(params)} x {len(optimizer.architectures)} architectures")
+    print(f"  Max relative deviation: {worst:.2e}")
+    assert worst < 1e-12, "Batched evaluation deviates from evaluate_design"
+
+    # Top-k materialization is ordered and matches a full sort
+    batch = optimizer.evaluate_designs_batch(params, 'balanced')
+    top = batch.top_k(10)
+    expected = np.sort(batch['mission_value'])[::-1][:10]
+    assert np.array_equal([d.mission_value for d in top], expected)
+
+    # Measurement decoding matches the scalar decoder
+    bitstrings = [format(i * 5741, '020b') for i in range(64)]
+    assert np.array_equal(optimizer.decode_measurements_batch(bitstrings),
+                          np.array([optimizer.decode_measurement(b) for b in bitstrings]))
+
+    # 1000 samples x 3 architectures, evaluated and ranked
+    start = time.perf_counter()
+    for architecture in optimizer.architectures:
+        optimizer.evaluate_designs_batch(np.random.random((1000, 10)), architecture).top_k(100)
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+    print(f"  1000 samples x 3 architectures: {elapsed_ms:.1f} ms")
+    assert elapsed_ms < 1000
+
+    print(f"\n  ✓ Batched evaluation reproduces evaluate_design")
+    return True
+
+def test_exhaustive_lattice_search():
+    """Test the chunked 4^10 lattice search against a single full evaluation"""
+    print("\n" + "="*70)
+    print("TEST 2: Exhaustive Lattice Search (optimize_architecture_exhaustive)")
+    print("="*70)
+
+    optimizer = _optimizer()
+
+    # Lattice indexing follows the measurement bitstrings
+    index = np.array([0, 1, 4, 777, 123456, 4**10 - 1])
+    assert np.array_equal(optimizer.lattice_params(index),
+                          np.array([optimizer.decode_measurement(format(i, '020b')) for i in index]))
+
+    start = time.perf_counter()
+    result = _quiet(optimizer.optimize_architecture_exhaustive, 'balanced', top_k=20, chunk_size=50000)
+    elapsed = time.perf_counter() - start
+    print(f"  Lattice designs: {result['n_evaluated']:,} in {elapsed:.2f} s")
+    print(f"  Optimum: {result['optimum'].mission_value:.4f} ({result['optimum_bitstring']})")
+    print(f"  Pareto-optimal designs: {len(result['pareto_frontier'])}")
+    assert result['n_evaluated'] == 4**10
+
+    # Ground truth: the whole lattice in one batch
+    full = optimizer.evaluate_designs_batch(optimizer.lattice_params(np.arange(4**10)), 'balanced')
+    values = full['mission_value']
+    assert result['optimum'].mission_value == values.max()
+    assert np.array_equal([d.mission_value for d in result['top_designs']], np.sort(values)[::-1][:20])
+    assert result['n_feasible'] == int(full['constraints_met'].sum())
+
+    # No lattice design dominates a Pareto design, and every front point is distinct
+    velocity = full['final_velocity_c']
+    science = full['data_rate_bps'] * (1 + full['power_margin'])
+    front = [(d.final_velocity_c, d.data_rate_bps * (1 + d.power_margin)) for d in result['pareto_frontier']]
+    for v, s in front:
+        dominated = (velocity >= v) & (science >= s) & ((velocity > v) | (science > s))
+        assert not dominated.any(), "Pareto design dominated by a lattice design"
+    assert len(set(front)) == len(front)
+
+    # The best velocity and the best science capability are on the front
+    assert max(v for v, _ in front) == velocity.max()
+    assert max(s for _, s in front) == science.max()
+
+    print(f"\n  ✓ Chunked lattice search matches full enumeration")
+    return True
+
+def test_evaluation_cache():
+    """Test the LRU evaluation cache and its on-disk layer"""
+    print("\n" + "="*70)
+    print("TEST 3: Design Evaluation Cache (DesignEvaluationCache)")
+    print("="*70)
+
+    optimizer = _optimizer()
+    cache = qio.DesignEvaluationCache(optimizer, max_entries=50)
+    rng = np.random.default_rng(3)
+    params = rng.random((80, 10))
+
+    # Misses are evaluated exactly, repeats within a quantization cell hit
+    first = cache.get(params[0], 'balanced')
+    assert first == optimizer.evaluate_design(params[0], 'balanced')
+    assert cache.get(params[0] + 1e-11, 'balanced') is first
+    assert cache.get(params[0], 'speed_priority') is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Batched lookups: one evaluation per new cell, LRU bound respected
+    designs = cache.get_many(np.vstack([params, params[:10]]), 'balanced')
+    assert designs[:80] == [optimizer.evaluate_design(p, 'balanced') for p in params]
+    assert designs[80:] == designs[:10]
+    stats = cache.stats()
+    print(f"  In-memory: {stats}")
+    assert stats['entries'] == 50 and stats['evictions'] == 2 + 79 - 50
+    assert stats['misses'] == 2 + 79 and stats['hits'] == 1 + 1 + 10
+
+    # Disk layer: a new session reuses the stored evaluations
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'evaluations.sqlite')
+        cache = qio.DesignEvaluationCache(optimizer, max_entries=10, path=path)
+        stored = cache.get_many(params, 'balanced')
+        cache.close()
+
+        cache = qio.DesignEvaluationCache(optimizer, max_entries=10, path=path)
+        assert cache.get_many(params, 'balanced') == stored
+        stats = cache.stats()
+        print(f"  Second session: {stats}")
+        assert stats['misses'] == 0 and stats['disk_hits'] == len(params)
+        cache.close()
+
+        # Changing the model invalidates the stored designs
+        optimizer.LASER_POWER_W *= 2
+        cache = qio.DesignEvaluationCache(optimizer, path=path)
+        cache.get(params[0], 'balanced')
+        assert cache.stats()['disk_hits'] == 0 and cache.misses == 1
+        cache.close()
+
+    print(f"\n  ✓ Cache returns exact evaluations and persists across sessions")
+    return True
+
+def test_refinement_gradient():
+    """Test the analytic refinement gradient against finite differences"""
+    print("\n" + "="*70)
+    print("TEST 4: Analytic Refinement Gradient (refinement_objective_batch)")
+    print("="*70)
+
+    optimizer = _optimizer()
+    rng = np.random.default_rng(11)
+    params = rng.uniform(0.02, 0.98, (200, 10))
+
+    worst = 0.0
+    for architecture in optimizer.architectures:
+        objective, gradient = optimizer.refinement_objective_batch(params, architecture)
+
+        # Objective is the penalized value minimized by the classical refinement
+        for i in range(10):
+            design = optimizer.evaluate_design(params[i], architecture)
+            expected = -(design.mission_value - sum(design.violation_details.values()) * 10)
+            assert abs(objective[i] - expected) <= 1e-12 * max(1.0, abs(expected))
+
+        # Central differences (comm_type is discrete: zero slope)
+        assert np.all(gradient[:, 3] == 0)
+        h = 1e-6
+        for k in [0, 1, 2, 4, 5, 6, 7, 8, 9]:
+            step = np.zeros(10)
+            step[k] = h
+            numeric = (optimizer.refinement_objective_batch(params + step, architecture)[0] -
+                       optimizer.refinement_objective_batch(params - step, architecture)[0]) / (2 * h)
+            worst = max(worst, np.max(np.abs(numeric - gradient[:, k]) / np.maximum(1.0, np.abs(numeric))))
+
+    print(f"  Max gradient deviation from central differences: {worst:.2e}")
+    assert worst < 1e-5, "Analytic gradient disagrees with finite differences"
+
+    # Exact gradients reach the same optimum with far fewer evaluations
+    def with_gradient(x):
+        value, grad = optimizer.refinement_objective_batch(x, 'balanced')
+        return value[0], grad[0]
+
+    def without_gradient(x):
+        return optimizer.refinement_objective_batch(x, 'balanced')[0][0]
+
+    nfev_exact, nfev_numeric = 0, 0
+    for x0 in params[:5]:
+        exact = qio.minimize(with_gradient, x0, jac=True, method='L-BFGS-B', bounds=[(0, 1)] * 10,
+                             options={'maxiter': 50})
+        numeric = qio.minimize(without_gradient, x0, method='L-BFGS-B', bounds=[(0, 1)] * 10,
+                               options={'maxiter': 50})
+        nfev_exact += exact.nfev
+        nfev_numeric += numeric.nfev
+        assert exact.fun <= numeric.fun + 1e-6 * max(1.0, abs(numeric.fun))
+
+    print(f"  Objective evaluations (5 starts): {nfev_exact} exact vs {nfev_numeric} finite-difference")
+    assert nfev_exact * 4 < nfev_numeric
+
+    print(f"\n  ✓ Refinement gradient is exact")
+    return True
+
+def test_parallel_architecture_optimization():
+    """Test the process-pool classical optimization against a serial run"""
+    print("\n" + "="*70)
+    print("TEST 5: Process-Pool Architecture Optimization (n_workers)")
+    print("="*70)
+
+    optimizer = _optimizer()
+    assert not optimizer.use_quantum
+
+    def comparable(results):
+        return {key: value for key, value in results.items()
+                if key not in ('timestamp', 'evaluation_cache')}
+
+    start = time.perf_counter()
+    serial = _quiet(optimizer.run_integrated_optimization, n_workers=1, seed=2026)
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = _quiet(optimizer.run_integrated_optimization, n_workers=2, seed=2026)
+    parallel_time = time.perf_counter() - start
+    print(f"  Serial: {serial_time:.2f} s, 2 workers: {parallel_time:.2f} s ({os.cpu_count()} CPUs)")
+    assert comparable(serial) == comparable(parallel), "Parallel results differ from serial run"
+
+    # The legacy global stream also gives identical serial and pooled results
+    np.random.seed(3)
+    serial = _quiet(optimizer.run_integrated_optimization, n_workers=1)
+    np.random.seed(3)
+    parallel = _quiet(optimizer.run_integrated_optimization, n_workers=2)
+    assert comparable(serial) == comparable(parallel)
+
+    print(f"\n  ✓ Pooled optimization reproduces the serial run")
+    return True
+
+def run_all_tests():
+    """Run all integrated optimizer tests"""
+    print("\n" + "#"*70)
+    print("# QUANTUM INTEGRATED OPTIMIZER TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_batch_evaluation_matches_scalar,
+        test_exhaustive_lattice_search,
+        test_evaluation_cache,
+        test_refinement_gradient,
+        test_parallel_architecture_optimization
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
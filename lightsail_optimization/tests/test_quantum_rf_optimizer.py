@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+REALISTIC RF OPTIMIZER TEST SUITE
+Tests the link budget engine of src/quantum/quantum_rf_optimizer_v2_realistic.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from quantum_rf_optimizer_v2_realistic import RealisticRFOptimizer
+
+def _quiet(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def test_link_budget_tensor():
+    """Test the broadcast link budget against compute_link_budget and failure reporting"""
+    print("\n" + "="*70)
+    print("TEST 1: dB-Separable Link Budget Engine (link_budget_tensor)")
+    print("="*70)
+
+    optimizer = RealisticRFOptimizer()
+    solutions = _quiet(optimizer.exhaustive_search)
+    tensor = optimizer.link_budget_tensor()
+    assert len(solutions) == tensor['metrics']['fitness'].size == 43200
+    assert not optimizer.failed_configurations
+    assert all(a['fitness'] >= b['fitness'] for a, b in zip(solutions, solutions[1:]))
+
+    # A repeated search replaces the previous results
+    again = _quiet(optimizer.exhaustive_search)
+    assert len(again) == len(optimizer.solution_store) == 43200
+    assert [s['config'] for s in again[:20]] == [s['config'] for s in solutions[:20]]
+
+    # Every 97th solution matches the per-configuration link budget
+    for solution in solutions[::97]:
+        eb_n0, data_rate, mass_g, cost_m, metrics = optimizer.compute_link_budget(solution['config'])
+        assert np.isclose(solution['eb_n0_db'], eb_n0) and np.isclose(solution['data_rate_bps'], data_rate)
+        assert np.isclose(solution['mass_g'], mass_g) and np.isclose(solution['cost_m'], cost_m)
+        for key, value in metrics.items():
+            if key == 'heritage':
+                assert solution['metrics'][key] == value
+            else:
+                assert np.isclose(solution['metrics'][key], value), key
+        feasible = (eb_n0 >= 9.0 and data_rate >= 10.0 and mass_g <= 500.0 and
+                    metrics['dc_power_w'] <= 200.0 and cost_m <= 10e9)
+        assert solution['feasible'] == int(feasible)
+    print(f"  {len(solutions)} combinations, "
+          f"{sum(s['feasible'] for s in solutions)} feasible, samples match compute_link_budget")
+
+    # Combinations without a finite link budget are reported, not dropped silently
+    optimizer = RealisticRFOptimizer()
+    optimizer.tx_power_range = np.array([0.0, 5.0])
+    solutions = _quiet(optimizer.exhaustive_search)
+    assert len(solutions) == len(optimizer.failed_configurations) == 2160
+    failure = optimizer.failed_configurations[0]
+    assert failure['config']['tx_power_w'] == 0.0 and 'effective_eb_n0_db' in failure['reason']
+    print(f"  Zero TX power: {len(optimizer.failed_configurations)} failed combinations reported")
+
+    print(f"\n  ✓ Broadcast engine reproduces the scalar link budget")
+    return True
+
+def run_all_tests():
+    """Run all realistic RF optimizer tests"""
+    print("\n" + "#"*70)
+    print("# REALISTIC RF OPTIMIZER TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_link_budget_tensor
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+SOLUTION STORE TEST SUITE
+Tests the columnar RF solution store in src/quantum/solution_store.py
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import contextlib
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from solution_store import FLUSH_ROWS, SolutionStore
+from quantum_rf_optimizer import RFArchitectureOptimizer
+from quantum_rf_optimizer_v2_realistic import RealisticRFOptimizer
+
+def _quiet(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def _random_columns(n, rng):
+    return {
+        'band': rng.choice(['S-band', 'X-band', 'Ka-band'], n),
+        'tx_power_w': rng.uniform(1, 100, n),
+        'tx_antenna_m': rng.uniform(0.01, 0.5, n),
+        'rx_antenna_m': rng.choice([34.0, 70.0], n),
+        'eb_n0_db': rng.normal(5, 10, n),
+        'data_rate_bps': rng.uniform(1, 1e6, n),
+        'mass_g': rng.uniform(1, 1000, n),
+        'cost_m': rng.uniform(1e6, 1e9, n),
+        'dsn_compatible': rng.random(n) < 0.5,
+        'feasible': rng.random(n) < 0.3,
+        'fitness': rng.integers(0, 50, n).astype(float)
+    }
+
+def test_queries_and_persistence():
+    """Test filter/top_k/group_by against plain numpy and the memory-mapped round trip"""
+    print("\n" + "="*70)
+    print("TEST 1: Store Queries and Memory-Mapped Persistence")
+    print("="*70)
+
+    rng = np.random.default_rng(11)
+    columns = _random_columns(5000, rng)
+    store = SolutionStore()
+    store.extend({name: values[:3000] for name, values in columns.items()})
+    for i in range(3000, 5000):
+        store.append({name: values[i] for name, values in columns.items()})
+    assert len(store) == 5000
+    assert list(store['band']) == list(columns['band'])
+    assert np.array_equal(store['fitness'], columns['fitness'])
+
+    # Best feasible per band under 500 g (ties go to the earlier row)
+    mask = columns['feasible'] & (columns['mass_g'] <= 500)
+    light = store.filter(store['feasible'] & (store['mass_g'] <= 500))
+    assert np.array_equal(light.row_ids, np.flatnonzero(mask))
+    groups = light.group_by('band')
+    assert list(groups) == list(dict.fromkeys(columns['band'][mask]))
+    for band, group in groups.items():
+        rows = np.flatnonzero(mask & (columns['band'] == band))
+        expected = rows[np.lexsort((rows, -columns['fitness'][rows]))][:5]
+        assert np.array_equal(group.top_k(5).row_ids, expected), band
+    lowest = store.top_k(3, key='mass_g', largest=False).rows()
+    assert [row['mass_g'] for row in lowest] == sorted(columns['mass_g'])[:3]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'store')
+        store.save(path)
+        opened = SolutionStore.open(path)
+        assert isinstance(opened.codes('fitness'), np.ndarray) and len(opened) == 5000
+        assert isinstance(opened._consolidate()['fitness'], np.memmap)
+        reopened = opened.filter(opened['feasible'] & (opened['mass_g'] <= 500))
+        assert reopened.group_by('band')['X-band'].top_k(5).rows() == groups['X-band'].top_k(5).rows()
+        try:
+            opened.append(lowest[0])
+            assert False, "opened stores are read-only"
+        except ValueError:
+            pass
+
+        SolutionStore().save(os.path.join(tmp, 'empty'))
+        assert len(SolutionStore.open(os.path.join(tmp, 'empty'))) == 0
+    # Appended rows are packed into column chunks, not kept as dicts
+    store = SolutionStore()
+    columns = _random_columns(3 * FLUSH_ROWS + 100, rng)
+    max_pending = 0
+    for i in range(len(columns['fitness'])):
+        store.append({name: values[i] for name, values in columns.items()})
+        max_pending = max(max_pending, len(store._pending))
+    assert max_pending < FLUSH_ROWS and len(store._pending) == 100
+    assert np.array_equal(store['fitness'], columns['fitness'])
+    assert list(store['band']) == list(columns['band'])
+
+    print(f"  5000 rows, {len(light)} feasible under 500 g in {len(groups)} bands, "
+          f"lightest {lowest[0]['mass_g']:.1f} g")
+
+    print(f"\n  ✓ Column queries match numpy and survive the memory-mapped round trip")
+    return True
+
+def test_optimizer_stores():
+    """Test that both RF optimizers record every solution in their store"""
+    print("\n" + "="*70)
+    print("TEST 2: RF Optimizer Solution Stores")
+    print("="*70)
+
+    optimizer = RealisticRFOptimizer()
+    solutions = _quiet(optimizer.exhaustive_search)
+    store = optimizer.solution_store
+    assert len(store) == len(solutions) == 43200
+    assert int(store['feasible'].sum()) == sum(s['feasible'] for s in solutions)
+    assert np.isclose(store.top_k(1).rows()[0]['fitness'], solutions[0]['fitness'])
+    print(f"  Realistic: {len(store)} rows, {int(store['feasible'].sum())} feasible")
+
+    np.random.seed(4)
+    optimizer = RFArchitectureOptimizer()
+    solutions = _quiet(optimizer.classical_exhaustive_search, 300)
+    store = optimizer.solution_store
+    assert len(store) == len(solutions)
+    assert int(store['feasible'].sum()) == sum(optimizer.is_feasible(s) for s in solutions)
+    best = store.top_k(1).rows()[0]
+    assert np.isclose(best['fitness'], solutions[0]['fitness'])
+    assert np.isclose(best['cost_m'], solutions[0]['cost_b'] * 1e9)
+    print(f"  Architecture: {len(store)} rows, best fitness {best['fitness']:.2f}")
+
+    print(f"\n  ✓ Stores hold the same solutions as all_solutions")
+    return True
+
+def run_all_tests():
+    """Run all solution store tests"""
+    print("\n" + "#"*70)
+    print("# SOLUTION STORE TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_queries_and_persistence,
+        test_optimizer_stores
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+TOP-K SELECTION TEST SUITE
+Tests the bounded top-k selection in src/quantum/topk.py and the sweeps using it
+"""
+
+import numpy as np
+import sys
+import os
+import io
+import contextlib
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'quantum'))
+
+from topk import TopK, top_indices
+from quantum_rf_optimizer import RFArchitectureOptimizer
+from quantum_rf_optimizer_v2_realistic import RealisticRFOptimizer
+
+def _quiet(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def _stable_top(values, k, largest=True):
+    """Reference: head of a stable sort, NaN excluded"""
+    values = np.asarray(values, dtype=float)
+    order = [i for i in np.argsort(-values if largest else values, kind='stable') if not np.isnan(values[i])]
+    return order[:k]
+
+def test_selection():
+    """Test batch and streaming selection against a stable sort (ties, NaN, minimization)"""
+    print("\n" + "="*70)
+    print("TEST 1: Top-k Selection (top_indices, TopK)")
+    print("="*70)
+
+    rng = np.random.default_rng(5)
+    values = rng.integers(0, 40, 5000).astype(float)  # many ties
+    values[rng.integers(0, 5000, 50)] = np.nan
+
+    for k in (1, 10, 100, 6000):
+        for largest in (True, False):
+            expected = _stable_top(values, k, largest)
+            assert list(top_indices(values, k, largest)) == expected
+
+            streamed = TopK(k, largest=largest)
+            for value in values:
+                streamed.add(value)
+            chunked = TopK(k, largest=largest)
+            for start in range(0, len(values), 777):
+                chunked.add_batch(values[start:start + 777])
+            assert streamed.items == chunked.items == expected, (k, largest)
+            assert np.array_equal(chunked.scores, values[expected])
+            assert chunked.n_seen == len(values) and len(chunked) == len(expected)
+    print(f"  5000 values (50 NaN, 40 distinct): batch, streaming and chunked selections agree")
+
+    # Chunks arriving out of order keep the tie order of their positions
+    order = rng.permutation(len(values)).reshape(10, -1)
+    shuffled = TopK(100)
+    for chunk in order:
+        shuffled.add_batch(values[chunk], items=chunk, positions=chunk)
+    assert shuffled.items == _stable_top(values, 100)
+    assert shuffled.threshold == values[_stable_top(values, 100)[-1]]
+    assert TopK(3).threshold == -np.inf and TopK(3, largest=False).threshold == np.inf
+    print(f"  Out-of-order chunks: threshold {shuffled.threshold:.0f}")
+
+    print(f"\n  ✓ Bounded selection equals the head of a stable sort")
+    return True
+
+def test_bounded_sweeps():
+    """Test that the bounded RF sweeps keep the head of the unbounded ranking"""
+    print("\n" + "="*70)
+    print("TEST 2: Bounded RF Sweeps")
+    print("="*70)
+
+    full = RealisticRFOptimizer()
+    _quiet(full.exhaustive_search)
+    bounded = RealisticRFOptimizer()
+    top = _quiet(bounded.exhaustive_search, top_k=50)
+    assert len(top) == 50 and len(bounded.solution_store) == len(full.solution_store) == 43200
+    assert [s['config'] for s in top] == [s['config'] for s in full.all_solutions[:50]]
+    print(f"  Realistic: top 50 of {len(bounded.solution_store)} materialized")
+
+    np.random.seed(8)
+    full = RFArchitectureOptimizer()
+    _quiet(full.classical_exhaustive_search, 400)
+    np.random.seed(8)
+    bounded = RFArchitectureOptimizer()
+    top = _quiet(bounded.classical_exhaustive_search, 400, top_k=20)
+    assert len(top) == len(bounded.solution_store) == 20
+    assert [s['bitstring'] for s in top] == [s['bitstring'] for s in full.all_solutions[:20]]
+    assert np.allclose(np.sort(bounded.solution_store['fitness']), np.sort([s['fitness'] for s in top]))
+    print(f"  Architecture: top 20 of {len(full.all_solutions)} kept (dicts and store)")
+
+    # Saved counts and statistics cover every evaluated sample, not the kept 20
+    with tempfile.TemporaryDirectory() as tmp:
+        expected = _quiet(full.save_results, os.path.join(tmp, 'full.json'))
+        saved = _quiet(bounded.save_results, os.path.join(tmp, 'bounded.json'))
+    assert saved['metadata']['total_solutions_evaluated'] == len(full.all_solutions) > 20
+    assert saved['metadata']['feasible_solutions_found'] == int(full.solution_store['feasible'].sum())
+    assert saved['statistics'] == expected['statistics']
+    assert expected['statistics']['best_eb_n0_db'] == float(full.solution_store['eb_n0_db'].max())
+    print(f"  Saved metadata: {saved['metadata']['total_solutions_evaluated']} evaluated, "
+          f"{saved['metadata']['feasible_solutions_found']} feasible")
+
+    print(f"\n  ✓ Bounded sweeps return the same best solutions")
+    return True
+
+def run_all_tests():
+    """Run all top-k selection tests"""
+    print("\n" + "#"*70)
+    print("# TOP-K SELECTION TEST SUITE")
+    print("#"*70)
+
+    tests = [
+        test_selection,
+        test_bounded_sweeps
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"\n  ✗ FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"\n  ✗ ERROR: {e}")
+            failed += 1
+
+    print("\n" + "="*70)
+    print(f"RESULTS: {passed}/{len(tests)} tests passed")
+    print("="*70)
+
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())